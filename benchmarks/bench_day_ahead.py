@@ -0,0 +1,53 @@
+"""
+Benchmark do DayAheadPlanner: um dia planejado para muitas casas.
+
+Gera uma curva de preços compartilhada (a cada 15 minutos) e previsões de
+temperatura por hora e agendamentos para cada casa, e mede quanto tempo
+`plan_many` leva para planejar o dia de todas elas.
+
+Uso:
+    python -m benchmarks.bench_day_ahead --homes 10000
+"""
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from src.energy.DayAheadPlanner import DayAheadPlanner
+from src.energy.DeviceSchedule import DeviceSchedule
+
+PRIORITIES = {"Security": 1, "Refrigerator": 1, "Heating": 2, "Washer": 2,
+              "Dishwasher": 2, "Lights": 3, "Computer": 2, "Pool Pump": 3}
+ENERGY = {"Security": 0.005, "Refrigerator": 0.01, "Heating": 0.03, "Cooling": 0.03, "Washer": 0.02,
+          "Dishwasher": 0.02, "Lights": 0.005, "Computer": 0.004, "Pool Pump": 0.015, "Oven": 0.04}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Plan one day for many homes.")
+    parser.add_argument("--homes", type=int, default=10000, help="Number of homes.")
+    parser.add_argument("--limit", type=float, default=12.0, help="Daily energy usage limit.")
+    args = parser.parse_args()
+
+    rng = random.Random(25)
+    day = date(2025, 11, 2)
+    midnight = datetime(2025, 11, 2)
+    prices = [0.2 + 0.15 * (1 if 68 <= quarter < 84 else 0) + rng.uniform(-0.05, 0.05) for quarter in range(96)]
+    temperatures = [[rng.gauss(21, 3) for _ in range(24)] for _ in range(args.homes)]
+    schedules = [[DeviceSchedule(rng.choice(["Washer", "Oven"]), midnight + timedelta(minutes=rng.randrange(1440)))
+                  for _ in range(rng.randrange(4))] for _ in range(args.homes)]
+
+    planner = DayAheadPlanner(PRIORITIES, ENERGY, price_threshold=0.3,
+                              desired_temperature_range=(19, 23), energy_usage_limit=args.limit)
+    start = time.perf_counter()
+    plans = planner.plan_many(day, prices, temperatures, schedules)
+    elapsed = time.perf_counter() - start
+
+    segments = sum(len(plan.segments) for plan in plans)
+    print(f"{args.homes} casas em {elapsed:.2f}s ({args.homes / elapsed:.0f} casas/s, "
+          f"{segments / args.homes:.1f} segmentos por casa em vez de 1440 minutos)")
+    print(f"custo total {sum(plan.total_cost for plan in plans):.2f}, "
+          f"energia total {sum(plan.total_energy for plan in plans):.2f}")
+
+
+if __name__ == "__main__":
+    main()
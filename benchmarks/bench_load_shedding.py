@@ -0,0 +1,67 @@
+"""
+Benchmark de pior caso do corte por limite de uso em `manage_energy`.
+
+Compara o laço original (reproduzido abaixo) com `apply_usage_limit` quando o consumo
+está muito acima do limite e todos os dispositivos são elegíveis, conferindo
+que ambos chegam ao mesmo resultado.
+
+Uso:
+    python -m benchmarks.bench_load_shedding --devices 10000 --repeat 200
+"""
+import argparse
+import time
+
+from src.energy.EnergyManagementSystem import apply_usage_limit
+
+
+def original_loop(device_status: dict[str, bool], device_priorities: dict[str, int],
+                  total: float, limit: float) -> float:
+    devices_were_on = True
+    while total >= limit and devices_were_on:
+        devices_to_turn_off = [
+            device for device, priority in device_priorities.items()
+            if device_status.get(device, False) and priority > 1
+        ]
+        if not devices_to_turn_off:
+            devices_were_on = False
+            continue
+        for device in devices_to_turn_off:
+            if total < limit:
+                break
+            device_status[device] = False
+            total -= 1
+    return total
+
+
+def measure(step, priorities: dict[str, int], total: float, limit: float, repeat: int) -> tuple[float, dict, float]:
+    elapsed = 0.0
+    for _ in range(repeat):
+        status = dict.fromkeys(priorities, True)
+        start = time.perf_counter()
+        remaining = step(status, priorities, total, limit)
+        elapsed += time.perf_counter() - start
+    return elapsed / repeat, status, remaining
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Worst-case benchmark for usage-limit load shedding.")
+    parser.add_argument("--devices", type=int, default=10000, help="Eligible devices per home.")
+    parser.add_argument("--repeat", type=int, default=200, help="Runs per case.")
+    args = parser.parse_args()
+
+    priorities = {f"Device {index}": 2 for index in range(args.devices)}
+    cases = {
+        "consumo muito acima do limite": (1e9 + 0.25, 100.5),
+        "limite atingido no meio da lista": (100.5 + args.devices / 2, 100.5),
+        "limite negativo (subtração repetida)": (0.3, -1e12),
+    }
+    for label, (total, limit) in cases.items():
+        loop_time, loop_status, loop_total = measure(original_loop, priorities, total, limit, args.repeat)
+        shed_time, shed_status, shed_total = measure(apply_usage_limit, priorities, total, limit, args.repeat)
+        assert loop_status == shed_status and loop_total == shed_total
+        print(f"{label:<38} laço={loop_time * 1e6:>9.1f} µs  shed_load={shed_time * 1e6:>9.1f} µs  "
+              f"({loop_time / shed_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
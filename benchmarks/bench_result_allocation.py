@@ -0,0 +1,144 @@
+"""
+Benchmark de alocação dos objetos de resultado.
+
+Mede, com tracemalloc, a memória ocupada por resultados com `__slots__` contra
+a mesma classe com `__dict__`, e a memória alocada por lotes repetidos de
+`quote_batch` e `check_for_fraud_batch` com colunas novas a cada chamada
+contra um `out` pré-alocado e reaproveitado, com colunas em listas ou em
+`array`s (que guardam os valores sem criar um objeto por linha).
+
+Uso:
+    python -m benchmarks.bench_result_allocation --results 100000 --batch 10000 --rounds 20
+"""
+import argparse
+import random
+import time
+import tracemalloc
+from array import array
+from collections.abc import Callable
+
+from src.flight.BookingBatchResult import BookingBatchResult
+from src.flight.BookingResult import BookingResult
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.fraud.FraudBatchResult import FraudBatchResult
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+
+
+class DictBookingResult:
+    """`BookingResult` sem `__slots__`, como referência."""
+    def __init__(self, confirmation, total_price, refund_amount, points_used):
+        self.confirmation = confirmation
+        self.total_price = total_price
+        self.refund_amount = refund_amount
+        self.points_used = points_used
+
+
+class DictFraudCheckResult:
+    """`FraudCheckResult` sem `__slots__`, como referência."""
+    def __init__(self, is_fraudulent, is_blocked, verification_required, risk_score):
+        self.is_fraudulent = is_fraudulent
+        self.is_blocked = is_blocked
+        self.verification_required = verification_required
+        self.risk_score = risk_score
+
+
+def measure(work: Callable[[], object]) -> tuple[int, int, float]:
+    """Executa `work` e retorna (bytes retidos, pico de bytes, segundos)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = work()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current, peak, elapsed
+
+
+def retained_results(result_type: type, count: int) -> Callable[[], list]:
+    return lambda: [result_type(True, 1.5, 0.0, False) for _ in range(count)]
+
+
+def booking_columns(rng: random.Random, size: int) -> dict[str, list]:
+    now = 1_700_000_000
+    return {
+        "passengers": [rng.randint(1, 8) for _ in range(size)],
+        "booking_times": [now] * size,
+        "available_seats": [rng.randint(0, 200) for _ in range(size)],
+        "current_prices": [rng.uniform(50, 800) for _ in range(size)],
+        "previous_sales": [rng.randint(0, 200) for _ in range(size)],
+        "is_cancellations": [rng.random() < 0.1 for _ in range(size)],
+        "departure_times": [now + rng.randint(0, 96 * 3600) for _ in range(size)],
+        "reward_points_available": [rng.choice((0, 0, 500, 5000)) for _ in range(size)],
+    }
+
+
+def fraud_columns(rng: random.Random, size: int) -> dict[str, list]:
+    return {
+        "amounts": [rng.uniform(1, 15000) for _ in range(size)],
+        "timestamps": [1_700_000_000 + row * 5 for row in range(size)],
+        "locations": [rng.choice(("SP", "RJ", "BH", "XX")) for _ in range(size)],
+        "account_ids": [rng.randrange(size // 20 + 1) for _ in range(size)],
+    }
+
+
+def repeated_batches(batch: Callable[..., object], rounds: int, out: object | None) -> Callable[[], None]:
+    def work() -> None:
+        for _ in range(rounds):
+            if out is None:
+                batch()
+            else:
+                batch(out=out)
+    return work
+
+
+def report(label: str, current: int, peak: int, elapsed: float) -> None:
+    print(f"{label:<42} retido={current / 1024:>9.0f} KiB  pico={peak / 1024:>9.0f} KiB  {elapsed:.3f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure result-object allocation.")
+    parser.add_argument("--results", type=int, default=100000, help="Result objects kept alive.")
+    parser.add_argument("--batch", type=int, default=10000, help="Rows per batch.")
+    parser.add_argument("--rounds", type=int, default=20, help="Batches per measurement.")
+    args = parser.parse_args()
+
+    print(f"{args.results} resultados mantidos em memória")
+    for label, result_type in [("BookingResult (__dict__)", DictBookingResult),
+                               ("BookingResult (__slots__)", BookingResult),
+                               ("FraudCheckResult (__dict__)", DictFraudCheckResult),
+                               ("FraudCheckResult (__slots__)", FraudCheckResult)]:
+        report(label, *measure(retained_results(result_type, args.results)))
+
+    rng = random.Random(42)
+    system = FlightBookingSystem()
+    booking = booking_columns(rng, args.batch)
+
+    def quote(out=None):
+        return system.quote_batch(**booking, out=out)
+
+    print(f"\n{args.rounds} lotes de {args.batch} cotações")
+    report("quote_batch (colunas novas)", *measure(repeated_batches(quote, args.rounds, None)))
+    report("quote_batch (out reaproveitado)",
+           *measure(repeated_batches(quote, args.rounds, BookingBatchResult.allocate(args.batch))))
+    booking_arrays = BookingBatchResult(array("B", bytes(args.batch)), array("d", [0.0]) * args.batch,
+                                        array("d", [0.0]) * args.batch, array("B", bytes(args.batch)))
+    report("quote_batch (out em arrays)", *measure(repeated_batches(quote, args.rounds, booking_arrays)))
+
+    detector = FraudDetectionSystem()
+    fraud = fraud_columns(rng, args.batch)
+
+    def check(out=None):
+        return detector.check_for_fraud_batch(**fraud, blacklisted_locations=["XX"], out=out)
+
+    print(f"\n{args.rounds} lotes de {args.batch} transações")
+    report("check_for_fraud_batch (colunas novas)", *measure(repeated_batches(check, args.rounds, None)))
+    report("check_for_fraud_batch (out reaproveitado)",
+           *measure(repeated_batches(check, args.rounds, FraudBatchResult.allocate(args.batch))))
+    fraud_arrays = FraudBatchResult(array("B", bytes(args.batch)), array("B", bytes(args.batch)),
+                                    array("B", bytes(args.batch)), array("B", bytes(args.batch)))
+    report("check_for_fraud_batch (out em arrays)", *measure(repeated_batches(check, args.rounds, fraud_arrays)))
+
+
+if __name__ == "__main__":
+    main()
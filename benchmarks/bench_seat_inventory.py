@@ -0,0 +1,65 @@
+"""
+Benchmark de contenção do SeatInventory.
+
+Compara o estoque com lock striping contra uma única trava (stripes=1), com
+várias threads reservando e liberando assentos em muitos voos, e confere que
+nenhum voo foi vendido além da capacidade.
+
+Uso:
+    python -m benchmarks.bench_seat_inventory --threads 8 --flights 1000 --operations 200000
+"""
+import argparse
+import random
+import threading
+import time
+
+from src.flight.SeatInventory import SeatInventory
+
+
+def run(stripes: int, threads: int, flights: int, operations: int, capacity: int) -> float:
+    inventory = SeatInventory(stripes=stripes)
+    for flight in range(flights):
+        inventory.add_flight(flight, capacity)
+    per_thread = operations // threads
+    start_barrier = threading.Barrier(threads + 1)
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        held: list[tuple[int, int]] = []
+        start_barrier.wait()
+        for _ in range(per_thread):
+            if held and rng.random() < 0.4:
+                inventory.release(*held.pop(rng.randrange(len(held))))
+            else:
+                flight, seats = rng.randrange(flights), rng.randint(1, 4)
+                if inventory.reserve(flight, seats):
+                    held.append((flight, seats))
+
+    workers = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads)]
+    for thread in workers:
+        thread.start()
+    start_barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    assert all(0 <= inventory.available(flight) <= capacity for flight in range(flights))
+    return per_thread * threads / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SeatInventory contention benchmark.")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--flights", type=int, default=1000)
+    parser.add_argument("--operations", type=int, default=200000)
+    parser.add_argument("--capacity", type=int, default=180)
+    args = parser.parse_args()
+
+    for stripes in (1, 64, 1024):
+        rate = run(stripes, args.threads, args.flights, args.operations, args.capacity)
+        print(f"stripes={stripes:5d}: {rate:12.0f} operações/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Gerador de carga local para o BookingService.
+
+Dispara muitos pedidos concorrentes de reserva e cancelamento sobre vários voos
+em um único laço de eventos, mede a vazão e confere que nenhum voo foi vendido
+além da capacidade.
+
+Uso:
+    python -m benchmarks.load_booking_service --requests 50000 --flights 200
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+
+from src.flight.BookingService import BookingService
+from src.flight.SeatInventory import SeatInventory
+
+
+async def run(requests: int, flights: int, capacity: int, max_concurrency: int, queue_size: int, seed: int) -> dict:
+    inventory = SeatInventory()
+    for flight in range(flights):
+        inventory.add_flight(flight, capacity)
+    service = BookingService(inventory, max_concurrency=max_concurrency, max_queue_per_flight=queue_size)
+    rng = random.Random(seed)
+    booking_time = datetime(2024, 1, 15, 10, 0)
+
+    async def one_request() -> None:
+        try:
+            await service.request(
+                flight_id=rng.randrange(flights),
+                passengers=rng.randint(1, 4),
+                booking_time=booking_time,
+                current_price=200.0,
+                previous_sales=rng.randint(0, 200),
+                is_cancellation=rng.random() < 0.2,
+                departure_time=booking_time + timedelta(hours=rng.choice([12, 36, 96])),
+                reward_points_available=0,
+            )
+        except (asyncio.QueueFull, asyncio.TimeoutError):
+            pass
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    assert all(0 <= inventory.available(flight) <= capacity for flight in range(flights))
+    metrics = service.metrics()
+    metrics["requests_per_second"] = requests / elapsed
+    return metrics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load generator for BookingService.")
+    parser.add_argument("--requests", type=int, default=50000)
+    parser.add_argument("--flights", type=int, default=200)
+    parser.add_argument("--capacity", type=int, default=180)
+    parser.add_argument("--max-concurrency", type=int, default=20000)
+    parser.add_argument("--queue-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=646)
+    args = parser.parse_args()
+
+    metrics = asyncio.run(run(args.requests, args.flights, args.capacity,
+                              args.max_concurrency, args.queue_size, args.seed))
+    for name, value in metrics.items():
+        print(f"{name}: {value:.0f}" if isinstance(value, float) else f"{name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+import math
+from bisect import bisect_right
+from collections.abc import Sequence
+from datetime import date, datetime, time, timedelta
+from itertools import accumulate
+
+from src.energy.DayPlan import DayPlan
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem, shed_load
+
+MINUTES_PER_DAY = 1440
+# Minutos em que o modo noturno (23h às 6h) termina e começa
+NIGHT_BOUNDARIES = (6 * 60, 23 * 60)
+
+
+class DayAheadPlanner:
+    """
+    Planeja um dia de operação dos dispositivos com as regras de `manage_energy`.
+
+    Cada minuto do dia é avaliado como uma chamada de `manage_energy` com o
+    preço e a temperatura previstos e o consumo acumulado até aquele minuto,
+    somando `device_energy[dispositivo]` por minuto ligado. O dia é percorrido
+    em segmentos de estado constante: eles terminam quando o preço cruza
+    `price_threshold`, a temperatura sai ou entra na faixa, o modo noturno
+    começa ou termina, há um agendamento ou o consumo muda quantos
+    dispositivos o limite de uso desliga. Dentro de um segmento o consumo
+    cresce linearmente e o custo sai de somas prefixadas da curva de preços.
+
+    `prices` e `temperatures` podem ter qualquer resolução que divida o dia
+    (24 valores por hora, 96 por 15 minutos, 1440 por minuto).
+    """
+    def __init__(
+        self,
+        device_priorities: dict[str, int],
+        device_energy: dict[str, float],
+        price_threshold: float,
+        desired_temperature_range: tuple[float, float],
+        energy_usage_limit: float,
+        system: SmartEnergyManagementSystem | None = None,
+    ):
+        self.device_priorities = device_priorities
+        self.device_energy = device_energy
+        self.price_threshold = price_threshold
+        self.desired_temperature_range = desired_temperature_range
+        self.energy_usage_limit = energy_usage_limit
+        self.system = system if system is not None else SmartEnergyManagementSystem()
+        # (preço acima do limite, noite, lado da temperatura) -> estado base e elegíveis
+        self._base: dict[tuple[bool, bool, int], tuple[dict[str, bool], list[str]]] = {}
+        # (chave, desligados pelo limite) -> estado e energia por minuto
+        self._states: dict[tuple[tuple[bool, bool, int], int], tuple[dict[str, bool], float]] = {}
+
+    @staticmethod
+    def _resolution(curve: Sequence[float], name: str) -> int:
+        if not curve or MINUTES_PER_DAY % len(curve):
+            raise ValueError(f"{name} deve ter um número de valores que divida {MINUTES_PER_DAY}.")
+        return MINUTES_PER_DAY // len(curve)
+
+    def _temperature_side(self, temperature: float) -> int:
+        low, high = self.desired_temperature_range
+        if temperature < low:
+            return -1
+        if temperature > high:
+            return 1
+        return 0
+
+    def _flips(self, values: Sequence[float], step: int, classify) -> list[int]:
+        """Minutos em que a classificação da curva muda de um valor para o seguinte."""
+        flips = []
+        previous = classify(values[0])
+        for index in range(1, len(values)):
+            current = classify(values[index])
+            if current != previous:
+                flips.append(index * step)
+                previous = current
+        return flips
+
+    def _base_state(self, key, price: float, when: datetime, temperature: float) -> tuple[dict[str, bool], list[str]]:
+        base = self._base.get(key)
+        if base is None:
+            # Passos 1 a 3 apenas: sem limite de uso e sem agendamentos
+            result = self.system.manage_energy(
+                current_price=price,
+                price_threshold=self.price_threshold,
+                device_priorities=self.device_priorities,
+                current_time=when,
+                current_temperature=temperature,
+                desired_temperature_range=self.desired_temperature_range,
+                energy_usage_limit=math.inf,
+                total_energy_used_today=0.0,
+                scheduled_devices=[],
+            )
+            eligible = [device for device, priority in self.device_priorities.items()
+                        if result.device_status.get(device, False) and priority > 1]
+            base = self._base[key] = (result.device_status, eligible)
+        return base
+
+    def _power(self, device_status: dict[str, bool]) -> float:
+        energy = self.device_energy
+        return sum(energy.get(device, 0.0) for device, on in device_status.items() if on)
+
+    def _shed_count(self, total: float, eligible: int) -> int:
+        if not total >= self.energy_usage_limit:
+            return 0
+        return shed_load(total, self.energy_usage_limit, eligible)[0]
+
+    def _plan(
+        self,
+        day: date,
+        prices: Sequence[float],
+        price_step: int,
+        price_prefix: list[float],
+        price_flips: list[int],
+        temperatures: Sequence[float],
+        scheduled_devices: Sequence[DeviceSchedule],
+        initial_usage: float,
+    ) -> DayPlan:
+        temperature_step = self._resolution(temperatures, "temperatures")
+        midnight = datetime.combine(day, time())
+
+        # Agendamentos que caem exatamente em um minuto do dia
+        scheduled: dict[int, list[str]] = {}
+        for schedule in scheduled_devices:
+            offset = schedule.scheduled_time - midnight
+            minute, remainder = divmod(offset, timedelta(minutes=1))
+            if not remainder and 0 <= minute < MINUTES_PER_DAY:
+                scheduled.setdefault(minute, []).append(schedule.device_name)
+
+        cuts = set(price_flips)
+        cuts.update(NIGHT_BOUNDARIES)
+        cuts.update(self._flips(temperatures, temperature_step, self._temperature_side))
+        for minute in scheduled:
+            cuts.add(minute)
+            cuts.add(minute + 1)
+        cuts.add(MINUTES_PER_DAY)
+        cuts = sorted(cut for cut in cuts if 0 < cut <= MINUTES_PER_DAY)
+
+        def cost_until(minute: int) -> float:
+            block, offset = divmod(minute, price_step)
+            if block == len(prices):
+                return price_prefix[block]
+            return price_prefix[block] + offset * prices[block]
+
+        segments = []
+        total = initial_usage
+        cost = 0.0
+        minute = 0
+        while minute < MINUTES_PER_DAY:
+            end = cuts[bisect_right(cuts, minute)]
+            price = prices[minute // price_step]
+            temperature = temperatures[minute // temperature_step]
+            key = (
+                price > self.price_threshold,
+                minute < NIGHT_BOUNDARIES[0] or minute >= NIGHT_BOUNDARIES[1],
+                self._temperature_side(temperature),
+            )
+            base_status, eligible = self._base_state(key, price, midnight + timedelta(minutes=minute), temperature)
+
+            turned_off = self._shed_count(total, len(eligible))
+            state = self._states.get((key, turned_off))
+            if state is None:
+                device_status = dict(base_status)
+                device_status.update(dict.fromkeys(eligible[:turned_off], False))
+                state = self._states[(key, turned_off)] = (device_status, self._power(device_status))
+            device_status, power = state
+
+            activated = scheduled.get(minute)
+            if activated:
+                device_status = dict(device_status)
+                for device in activated:
+                    device_status[device] = True
+                power = self._power(device_status)
+            elif turned_off < len(eligible) and power > 0 and end - minute > 1:
+                # Primeiro minuto do segmento em que o limite desliga mais um dispositivo
+                length = end - minute
+                if self._shed_count(total + (length - 1) * power, len(eligible)) != turned_off:
+                    low, high = 1, length - 1
+                    while low < high:
+                        middle = (low + high) // 2
+                        if self._shed_count(total + middle * power, len(eligible)) != turned_off:
+                            high = middle
+                        else:
+                            low = middle + 1
+                    end = minute + low
+
+            segments.append((minute, end, device_status, power, total))
+            cost += power * (cost_until(end) - cost_until(minute))
+            total += (end - minute) * power
+            minute = end
+
+        return DayPlan(day, segments, cost, initial_usage, total)
+
+    def plan(
+        self,
+        day: date,
+        prices: Sequence[float],
+        temperatures: Sequence[float],
+        scheduled_devices: Sequence[DeviceSchedule] = (),
+        initial_usage: float = 0.0,
+    ) -> DayPlan:
+        """Planeja um dia a partir das previsões de preço e temperatura."""
+        return self.plan_many(day, prices, [temperatures], [scheduled_devices], [initial_usage])[0]
+
+    def plan_many(
+        self,
+        day: date,
+        prices: Sequence[float],
+        temperatures: Sequence[Sequence[float]],
+        scheduled_devices: Sequence[Sequence[DeviceSchedule]] | None = None,
+        initial_usage: Sequence[float] | None = None,
+    ) -> list[DayPlan]:
+        """
+        Planeja o mesmo dia para várias casas com esta configuração.
+
+        A curva de preços é compartilhada; `temperatures`, `scheduled_devices`
+        e `initial_usage` trazem um valor por casa. Os estados calculados são
+        reaproveitados entre as casas.
+        """
+        homes = len(temperatures)
+        if scheduled_devices is not None and len(scheduled_devices) != homes:
+            raise ValueError("Todas as colunas devem ter uma posição por casa.")
+        if initial_usage is not None and len(initial_usage) != homes:
+            raise ValueError("Todas as colunas devem ter uma posição por casa.")
+        price_step = self._resolution(prices, "prices")
+        price_prefix = [0.0, *accumulate(price * price_step for price in prices)]
+        price_flips = self._flips(prices, price_step, lambda price: price > self.price_threshold)
+
+        return [
+            self._plan(
+                day, prices, price_step, price_prefix, price_flips, temperatures[home],
+                scheduled_devices[home] if scheduled_devices is not None else (),
+                initial_usage[home] if initial_usage is not None else 0.0,
+            )
+            for home in range(homes)
+        ]
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return (f"DayAheadPlanner(devices={len(self.device_priorities)}, "
+                f"price_threshold={self.price_threshold}, energy_usage_limit={self.energy_usage_limit})")
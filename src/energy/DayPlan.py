@@ -0,0 +1,61 @@
+from bisect import bisect_right
+from datetime import date
+
+
+class DayPlan:
+    """
+    Plano de um dia, minuto a minuto, produzido pelo `DayAheadPlanner`.
+
+    O dia é dividido em segmentos `(início, fim, device_status, energia por
+    minuto, consumo no início)`, com minutos em [início, fim) e estado constante.
+    No minuto `início + i` o consumo acumulado do dia é
+    `consumo no início + i * energia por minuto`. Os dicionários de estado são
+    compartilhados entre planos e devem ser tratados como somente leitura.
+    """
+    __slots__ = ("day", "segments", "total_cost", "initial_usage", "final_usage", "_starts")
+
+    def __init__(self, day: date, segments: list[tuple], total_cost: float, initial_usage: float, final_usage: float):
+        self.day = day
+        self.segments = segments
+        self.total_cost = total_cost
+        self.initial_usage = initial_usage
+        self.final_usage = final_usage
+        self._starts = [segment[0] for segment in segments]
+
+    @property
+    def total_energy(self) -> float:
+        """Energia consumida no dia segundo o plano."""
+        return self.final_usage - self.initial_usage
+
+    def _segment_at(self, minute: int) -> tuple:
+        if not 0 <= minute < 1440:
+            raise ValueError("minute deve estar entre 0 e 1439.")
+        return self.segments[bisect_right(self._starts, minute) - 1]
+
+    def status_at(self, minute: int) -> dict[str, bool]:
+        """Estado dos dispositivos no minuto `minute` do dia."""
+        return self._segment_at(minute)[2]
+
+    def energy_used_before(self, minute: int) -> float:
+        """Consumo acumulado do dia no início do minuto `minute`."""
+        start, _, _, power, usage = self._segment_at(minute)
+        return usage + (minute - start) * power
+
+    def timelines(self) -> dict[str, list[tuple[int, int]]]:
+        """Intervalos [início, fim) em minutos em que cada dispositivo fica ligado."""
+        timelines: dict[str, list[tuple[int, int]]] = {}
+        for start, end, device_status, _, _ in self.segments:
+            for device, on in device_status.items():
+                intervals = timelines.setdefault(device, [])
+                if not on:
+                    continue
+                if intervals and intervals[-1][1] == start:
+                    intervals[-1] = (intervals[-1][0], end)
+                else:
+                    intervals.append((start, end))
+        return timelines
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return (f"DayPlan(day={self.day}, segments={len(self.segments)}, "
+                f"total_energy={self.total_energy:.2f}, total_cost={self.total_cost:.2f})")
@@ -0,0 +1,144 @@
+import math
+from datetime import date, datetime
+
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementResult import EnergyManagementResult
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem, apply_usage_limit
+from src.energy.ScheduleIndex import ScheduleIndex
+
+
+class EnergyController:
+    """
+    Controlador com estado que aplica as regras de `manage_energy` a cada tick.
+
+    Os estados dos passos 1 a 3 dependem apenas de o preço estar acima do
+    limite, de ser noite e de a temperatura estar abaixo, acima ou dentro da
+    faixa, então ficam em cache por essa combinação. A cada tick só o limite de
+    uso e os agendamentos do instante são reaplicados, e `tick` retorna apenas
+    os dispositivos cujo estado mudou. O consumo medido é acumulado em
+    `total_energy_used_today` e zerado quando o dia muda. Com um
+    `ScheduleIndex`, os agendamentos que já passaram são descartados a cada tick.
+    """
+    def __init__(
+        self,
+        device_priorities: dict[str, int],
+        price_threshold: float,
+        desired_temperature_range: tuple[float, float],
+        energy_usage_limit: float,
+        scheduled_devices: list[DeviceSchedule] | ScheduleIndex | None = None,
+        system: SmartEnergyManagementSystem | None = None,
+    ):
+        self.device_priorities = device_priorities
+        self.price_threshold = price_threshold
+        self.desired_temperature_range = desired_temperature_range
+        self.energy_usage_limit = energy_usage_limit
+        self.scheduled_devices = scheduled_devices if scheduled_devices is not None else ScheduleIndex()
+        self.system = system if system is not None else SmartEnergyManagementSystem()
+        self.total_energy_used_today = 0.0
+        self.device_status: dict[str, bool] = {}
+        self.energy_saving_mode = False
+        self.temperature_regulation_active = False
+        self.total_energy_used = 0.0
+        self._day: date | None = None
+        self._base: dict[tuple[bool, bool, int], EnergyManagementResult] = {}
+        self._key: tuple[bool, bool, int] | None = None
+        # Se o último estado diferiu do estado base (limite de uso ou agendamento)
+        self._adjusted = False
+
+    def _temperature_side(self, current_temperature: float) -> int:
+        low, high = self.desired_temperature_range
+        if current_temperature < low:
+            return -1
+        if current_temperature > high:
+            return 1
+        return 0
+
+    def tick(
+        self,
+        current_price: float,
+        current_time: datetime,
+        current_temperature: float,
+        energy_used: float = 0.0,
+    ) -> dict[str, bool | None]:
+        """
+        Soma `energy_used` (o consumo medido desde o tick anterior) ao dia de
+        `current_time` e avalia as regras nesse instante.
+
+        Retorna os dispositivos que mudaram de estado desde o tick anterior;
+        os que deixaram de constar no resultado aparecem com `None`.
+        """
+        today = current_time.date()
+        if today != self._day:
+            self._day = today
+            self.total_energy_used_today = 0.0
+        self.total_energy_used_today += energy_used
+
+        key = (
+            current_price > self.price_threshold,
+            current_time.hour >= 23 or current_time.hour < 6,
+            self._temperature_side(current_temperature),
+        )
+        base = self._base.get(key)
+        if base is None:
+            # Passos 1 a 3 apenas: sem limite de uso e sem agendamentos
+            base = self._base[key] = self.system.manage_energy(
+                current_price=current_price,
+                price_threshold=self.price_threshold,
+                device_priorities=self.device_priorities,
+                current_time=current_time,
+                current_temperature=current_temperature,
+                desired_temperature_range=self.desired_temperature_range,
+                energy_usage_limit=math.inf,
+                total_energy_used_today=0.0,
+                scheduled_devices=[],
+            )
+
+        total = self.total_energy_used_today
+        if hasattr(self.scheduled_devices, "expire_before"):
+            self.scheduled_devices.expire_before(current_time)
+            activated = self.scheduled_devices.devices_at(current_time)
+        else:
+            activated = [schedule.device_name for schedule in self.scheduled_devices
+                         if schedule.scheduled_time == current_time]
+        over_limit = total >= self.energy_usage_limit
+
+        self.energy_saving_mode = base.energy_saving_mode
+        self.temperature_regulation_active = base.temperature_regulation_active
+        self.total_energy_used = total
+
+        # Mesmo estado base e nada a ajustar agora nem no tick anterior: nada muda
+        if key == self._key and not self._adjusted and not over_limit and not activated:
+            return {}
+
+        status = dict(base.device_status)
+        if over_limit:
+            self.total_energy_used = apply_usage_limit(status, self.device_priorities, total, self.energy_usage_limit)
+        for device in activated:
+            status[device] = True
+
+        previous = self.device_status
+        changes: dict[str, bool | None] = {
+            device: state for device, state in status.items() if previous.get(device) != state
+        }
+        for device in previous:
+            if device not in status:
+                changes[device] = None
+        self.device_status = status
+        self._key = key
+        self._adjusted = over_limit or bool(activated)
+        return changes
+
+    def result(self) -> EnergyManagementResult:
+        """Retorna o estado atual como um `EnergyManagementResult`."""
+        return EnergyManagementResult(
+            dict(self.device_status),
+            self.energy_saving_mode,
+            self.temperature_regulation_active,
+            self.total_energy_used,
+        )
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return (f"EnergyController(devices={len(self.device_priorities)}, "
+                f"total_energy_used_today={self.total_energy_used_today}, "
+                f"cached_states={len(self._base)})")
@@ -1,5 +1,7 @@
 class EnergyManagementResult:
     """Armazena os resultados da lógica de gerenciamento de energia."""
+    __slots__ = ("device_status", "energy_saving_mode", "temperature_regulation_active", "total_energy_used")
+
     def __init__(
         self,
         device_status: dict[str, bool],
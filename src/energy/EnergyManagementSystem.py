@@ -1,6 +1,79 @@
+from collections.abc import Sequence
 from datetime import datetime
 from src.energy.DeviceSchedule import DeviceSchedule
 from src.energy.EnergyManagementResult import EnergyManagementResult
+from src.energy.FleetEnergyResult import FleetEnergyResult
+from src.energy.ScheduleIndex import ScheduleIndex
+
+# Dispositivos que o modo noturno mantém ligados
+NIGHT_PROTECTED_DEVICES = ("Security", "Refrigerator")
+
+
+def shed_load(total_energy_used: float, energy_usage_limit: float, eligible: int) -> tuple[int, float]:
+    """
+    Resolve o corte por limite de uso sem subtrair um dispositivo por vez.
+
+    O passo 4 de `manage_energy` desliga, na ordem, os `eligible` dispositivos
+    elegíveis, subtraindo 1 do consumo a cada um, enquanto o consumo não fica
+    abaixo do limite. Retorna quantos são desligados e o consumo final, iguais
+    aos da subtração repetida: a contagem é achada por busca binária onde
+    `total - k` é exato (inteiros, ou floats em [0, 2**53) sem ficar negativo)
+    e o restante, se houver, segue pela subtração repetida.
+    """
+    total = total_energy_used
+    limit = energy_usage_limit
+    if eligible <= 0 or not total >= limit:
+        return 0, total
+    if isinstance(total, int):
+        high = eligible
+    elif isinstance(total, float) and 0.0 <= total < 2.0 ** 53:
+        high = min(eligible, int(total))
+    else:
+        high = 0
+
+    # Primeiro k em [0, high] com total - k < limit, ou high se não houver
+    low = 0
+    while low < high:
+        middle = (low + high) // 2
+        if total - middle >= limit:
+            low = middle + 1
+        else:
+            high = middle
+    turned_off = low
+    if turned_off:
+        total -= turned_off
+
+    while turned_off < eligible and total >= limit:
+        total -= 1
+        turned_off += 1
+    return turned_off, total
+
+def apply_usage_limit(
+    device_status: dict[str, bool],
+    device_priorities: dict[str, int],
+    total_energy_used: float,
+    energy_usage_limit: float,
+) -> float:
+    """
+    Passo 4 de `manage_energy`: desliga em `device_status`, na ordem de
+    `device_priorities`, os dispositivos ligados com prioridade maior que 1
+    enquanto o consumo não fica abaixo do limite, e retorna o consumo final.
+    """
+    if not total_energy_used >= energy_usage_limit:
+        return total_energy_used
+    # Quantos seriam desligados se houvesse elegíveis suficientes
+    budget, total_after_budget = shed_load(total_energy_used, energy_usage_limit, len(device_priorities))
+    turned_off = 0
+    for device, priority in device_priorities.items():
+        if turned_off == budget:
+            break
+        if device_status.get(device, False) and priority > 1:
+            device_status[device] = False
+            turned_off += 1
+    if turned_off == budget:
+        return total_after_budget
+    return shed_load(total_energy_used, energy_usage_limit, turned_off)[1]
+
 
 class SmartEnergyManagementSystem:
     """Um sistema para gerenciar inteligentemente o consumo de energia."""
@@ -14,8 +87,14 @@ class SmartEnergyManagementSystem:
         desired_temperature_range: tuple[float, float],
         energy_usage_limit: float,
         total_energy_used_today: float,
-        scheduled_devices: list[DeviceSchedule],
+        scheduled_devices: list[DeviceSchedule] | ScheduleIndex,
     ) -> EnergyManagementResult:
+        """
+        Decide o estado de cada dispositivo no instante `current_time`.
+
+        `scheduled_devices` pode ser uma lista de `DeviceSchedule` ou um
+        `ScheduleIndex`, que consulta só os agendamentos do instante.
+        """
 
         device_status: dict[str, bool] = {}
         energy_saving_mode = False
@@ -37,7 +116,7 @@ class SmartEnergyManagementSystem:
         # 2. Modo noturno entre 23h e 6h
         if current_time.hour >= 23 or current_time.hour < 6:
             for device in device_priorities:
-                if device not in ("Security", "Refrigerator"):
+                if device not in NIGHT_PROTECTED_DEVICES:
                     device_status[device] = False
 
         # 3. Regulação de temperatura
@@ -52,26 +131,141 @@ class SmartEnergyManagementSystem:
             device_status["Cooling"] = False
 
 
-        devices_were_on = True
-        while total_energy_used_today >= energy_usage_limit and devices_were_on:
-            devices_to_turn_off = [
-                device for device, priority in device_priorities.items()
-                if device_status.get(device, False) and priority > 1
-            ]
-            
-            if not devices_to_turn_off:
-                devices_were_on = False
-                continue
-
-            for device in devices_to_turn_off:
-                 if total_energy_used_today < energy_usage_limit:
-                     break
-                 device_status[device] = False
-                 total_energy_used_today -= 1
+        # 4. Limite de uso: desliga os não essenciais, na ordem das prioridades
+        total_energy_used_today = apply_usage_limit(
+            device_status, device_priorities, total_energy_used_today, energy_usage_limit
+        )
 
         # 5. Lida com dispositivos agendados
-        for schedule in scheduled_devices:
-            if schedule.scheduled_time == current_time:
-                device_status[schedule.device_name] = True
+        if hasattr(scheduled_devices, "devices_at"):
+            for device in scheduled_devices.devices_at(current_time):
+                device_status[device] = True
+        else:
+            for schedule in scheduled_devices:
+                if schedule.scheduled_time == current_time:
+                    device_status[schedule.device_name] = True
+
+        return EnergyManagementResult(device_status, energy_saving_mode, temperature_regulation_active, total_energy_used_today)
+
+    def manage_energy_fleet(
+        self,
+        current_prices: Sequence[float],
+        price_thresholds: Sequence[float],
+        device_names: Sequence[str],
+        device_priorities: Sequence[Sequence[int | None]],
+        current_times: Sequence[datetime],
+        current_temperatures: Sequence[float],
+        desired_temperature_ranges: Sequence[tuple[float, float]],
+        energy_usage_limits: Sequence[float],
+        total_energy_used_today: Sequence[float],
+        scheduled_devices: Sequence[list[DeviceSchedule] | ScheduleIndex] | None = None,
+    ) -> FleetEnergyResult:
+        """
+        Aplica `manage_energy` a várias casas de uma vez.
+
+        `device_priorities` é uma matriz casa × dispositivo, com as colunas na
+        ordem de `device_names` e `None` onde a casa não tem o dispositivo; os
+        demais argumentos trazem um valor por casa. O resultado tem uma linha
+        de estados por casa, igual ao `device_status` da chamada individual com
+        as prioridades da casa na ordem das colunas. "Heating", "Cooling" e os
+        dispositivos agendados para o instante que não estão em `device_names`
+        ganham colunas extras no final. Cada casa pode ter uma lista de
+        `DeviceSchedule` ou um `ScheduleIndex`.
+        """
+        homes = len(device_priorities)
+        columns = (current_prices, price_thresholds, current_times, current_temperatures,
+                   desired_temperature_ranges, energy_usage_limits, total_energy_used_today)
+        if any(len(column) != homes for column in columns):
+            raise ValueError("Todas as colunas devem ter uma posição por casa.")
+        if scheduled_devices is not None and len(scheduled_devices) != homes:
+            raise ValueError("Todas as colunas devem ter uma posição por casa.")
+        width = len(device_names)
+        if any(len(row) != width for row in device_priorities):
+            raise ValueError("Cada linha de prioridades deve ter uma coluna por dispositivo.")
+
+        # Dispositivos que os agendamentos ligam no instante de cada casa
+        activated: list[Sequence[str]] = [()] * homes
+        if scheduled_devices is not None:
+            for home, schedules in enumerate(scheduled_devices):
+                current_time = current_times[home]
+                if hasattr(schedules, "devices_at"):
+                    activated[home] = schedules.devices_at(current_time)
+                else:
+                    activated[home] = [schedule.device_name for schedule in schedules
+                                       if schedule.scheduled_time == current_time]
+
+        names = list(device_names)
+        column_of = {name: column for column, name in enumerate(names)}
+        extra = ["Heating", "Cooling"]
+        extra += [name for devices in activated for name in devices]
+        for name in extra:
+            if name not in column_of:
+                column_of[name] = len(names)
+                names.append(name)
+        padding = [None] * (len(names) - width)
+        heating = column_of["Heating"]
+        cooling = column_of["Cooling"]
+        protected = [name in NIGHT_PROTECTED_DEVICES for name in device_names]
+
+        device_status = []
+        energy_saving_mode = []
+        temperature_regulation_active = []
+        total_energy_used = []
+
+        for home in range(homes):
+            priorities = device_priorities[home]
+            current_time = current_times[home]
+            saving = current_prices[home] > price_thresholds[home]
+            night = current_time.hour >= 23 or current_time.hour < 6
+
+            # 1 e 2. Modo de economia e modo noturno
+            if night:
+                row = [None if priority is None else (kept and (not saving or not priority > 1))
+                       for priority, kept in zip(priorities, protected)]
+            elif saving:
+                row = [None if priority is None else not priority > 1 for priority in priorities]
+            else:
+                row = [None if priority is None else True for priority in priorities]
+            row += padding
+
+            # 3. Regulação de temperatura
+            temperature = current_temperatures[home]
+            low, high = desired_temperature_ranges[home]
+            regulating = True
+            if temperature < low:
+                row[heating] = True
+            elif temperature > high:
+                row[cooling] = True
+            else:
+                row[heating] = False
+                row[cooling] = False
+                regulating = False
+
+            # 4. Limite de uso: desliga os não essenciais na ordem das colunas
+            total = total_energy_used_today[home]
+            limit = energy_usage_limits[home]
+            if total >= limit:
+                budget, total_after_budget = shed_load(total, limit, width)
+                turned_off = 0
+                for column, priority in enumerate(priorities):
+                    if turned_off == budget:
+                        break
+                    if priority is not None and priority > 1 and row[column]:
+                        row[column] = False
+                        turned_off += 1
+                if turned_off == budget:
+                    total = total_after_budget
+                else:
+                    _, total = shed_load(total, limit, turned_off)
+
+            # 5. Dispositivos agendados
+            for name in activated[home]:
+                row[column_of[name]] = True
+
+            device_status.append(row)
+            energy_saving_mode.append(saving)
+            temperature_regulation_active.append(regulating)
+            total_energy_used.append(total)
 
-        return EnergyManagementResult(device_status, energy_saving_mode, temperature_regulation_active, total_energy_used_today)
\ No newline at end of file
+        return FleetEnergyResult(names, device_status, energy_saving_mode,
+                                 temperature_regulation_active, total_energy_used)
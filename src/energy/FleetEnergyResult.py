@@ -0,0 +1,47 @@
+from src.energy.EnergyManagementResult import EnergyManagementResult
+
+
+class FleetEnergyResult:
+    """
+    Armazena, em colunas, os resultados de `manage_energy_fleet` para várias casas.
+
+    `device_status[casa][coluna]` é o estado do dispositivo `device_names[coluna]`
+    na casa, ou `None` quando ele não aparece no resultado daquela casa.
+    """
+    __slots__ = ("device_names", "device_status", "energy_saving_mode",
+                 "temperature_regulation_active", "total_energy_used")
+
+    def __init__(
+        self,
+        device_names: list[str],
+        device_status: list[list[bool | None]],
+        energy_saving_mode: list[bool],
+        temperature_regulation_active: list[bool],
+        total_energy_used: list[float],
+    ):
+        self.device_names = device_names
+        self.device_status = device_status
+        self.energy_saving_mode = energy_saving_mode
+        self.temperature_regulation_active = temperature_regulation_active
+        self.total_energy_used = total_energy_used
+
+    def __len__(self) -> int:
+        return len(self.device_status)
+
+    def __getitem__(self, home: int) -> EnergyManagementResult:
+        """Retorna o resultado da casa `home` como um `EnergyManagementResult`."""
+        device_status = {
+            name: status
+            for name, status in zip(self.device_names, self.device_status[home])
+            if status is not None
+        }
+        return EnergyManagementResult(
+            device_status,
+            self.energy_saving_mode[home],
+            self.temperature_regulation_active[home],
+            self.total_energy_used[home],
+        )
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return f"FleetEnergyResult(homes={len(self)}, devices={len(self.device_names)})"
@@ -0,0 +1,68 @@
+import heapq
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+
+from src.energy.DeviceSchedule import DeviceSchedule
+
+
+class ScheduleIndex:
+    """
+    Agendamentos de dispositivos indexados pelo horário exato de ativação.
+
+    `devices_at` responde em O(1) quais dispositivos disparam em um horário,
+    na ordem em que foram agendados, e pode substituir a lista de
+    `DeviceSchedule` em `manage_energy`. Um heap com os horários permite
+    descartar os agendamentos vencidos com `expire_before`.
+    """
+    __slots__ = ("_by_time", "_times", "_size")
+
+    def __init__(self, schedules: Iterable[DeviceSchedule] = ()):
+        self._by_time: dict[datetime, list[str]] = {}
+        self._times: list[datetime] = []
+        self._size = 0
+        for schedule in schedules:
+            self.add(schedule)
+
+    def add(self, schedule: DeviceSchedule) -> None:
+        """Agenda a ativação de `schedule.device_name` em `schedule.scheduled_time`."""
+        devices = self._by_time.get(schedule.scheduled_time)
+        if devices is None:
+            devices = self._by_time[schedule.scheduled_time] = []
+            heapq.heappush(self._times, schedule.scheduled_time)
+        devices.append(schedule.device_name)
+        self._size += 1
+
+    def cancel(self, schedule: DeviceSchedule) -> bool:
+        """Remove um agendamento igual a `schedule`; retorna se ele existia."""
+        devices = self._by_time.get(schedule.scheduled_time)
+        if devices is None or schedule.device_name not in devices:
+            return False
+        # A lista vazia fica até o horário vencer, para não repetir o horário no heap
+        devices.remove(schedule.device_name)
+        self._size -= 1
+        return True
+
+    def devices_at(self, when: datetime) -> list[str] | tuple[()]:
+        """Dispositivos agendados exatamente para `when` (somente leitura)."""
+        return self._by_time.get(when, ())
+
+    def expire_before(self, when: datetime) -> int:
+        """Descarta os agendamentos anteriores a `when` e retorna quantos eram."""
+        removed = 0
+        while self._times and self._times[0] < when:
+            removed += len(self._by_time.pop(heapq.heappop(self._times)))
+        self._size -= removed
+        return removed
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[DeviceSchedule]:
+        """Percorre os agendamentos, agrupados por horário na ordem de inserção."""
+        for scheduled_time, devices in self._by_time.items():
+            for device_name in devices:
+                yield DeviceSchedule(device_name, scheduled_time)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return f"ScheduleIndex(schedules={self._size}, times={len(self._by_time)})"
@@ -0,0 +1,33 @@
+from src.flight.BookingResult import BookingResult
+
+
+class BookingBatchResult:
+    """
+    Uma classe para armazenar, em colunas, os resultados de uma cotação em lote.
+    """
+    def __init__(self, confirmation, total_price, refund_amount, points_used):
+        self.confirmation = confirmation
+        self.total_price = total_price
+        self.refund_amount = refund_amount
+        self.points_used = points_used
+
+    @classmethod
+    def allocate(cls, size):
+        """Cria colunas com `size` linhas para reaproveitar como `out` de `quote_batch`."""
+        return cls([False] * size, [0.0] * size, [0.0] * size, [False] * size)
+
+    def __len__(self):
+        return len(self.confirmation)
+
+    def __getitem__(self, index):
+        """Retorna o resultado da linha `index` como um `BookingResult`."""
+        return BookingResult(
+            self.confirmation[index],
+            self.total_price[index],
+            self.refund_amount[index],
+            self.points_used[index],
+        )
+
+    def __repr__(self):
+        """Retorna uma representação legível do objeto."""
+        return f"BookingBatchResult(rows={len(self)})"
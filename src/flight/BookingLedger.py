@@ -0,0 +1,134 @@
+import json
+import os
+
+from src.flight.BookingResult import BookingResult
+from src.flight.LedgerState import LedgerState
+
+REPLAY_CHUNK_BYTES = 1 << 20
+
+
+class BookingLedger:
+    """
+    Livro-razão somente de acréscimo com os resultados de `book_flight`, em JSONL.
+
+    Cada evento é uma linha JSON. As escritas são agrupadas e sincronizadas
+    com o disco (`fsync`) a cada `fsync_every` eventos ou em `flush`. O estado
+    por voo é reconstruído por `replay`, que parte do último snapshot e lê
+    apenas os eventos gravados depois dele. Uma linha incompleta no final,
+    deixada por uma queda durante a escrita, é descartada ao reabrir o arquivo.
+    """
+    def __init__(self, path: str | os.PathLike, fsync_every: int = 1000):
+        if fsync_every < 1:
+            raise ValueError("fsync_every deve ser positivo.")
+        self.path = os.fspath(path)
+        self.fsync_every = fsync_every
+        self._file = open(self.path, "ab")
+        self._file.truncate(self._complete_length(self.path))
+        self._pending = 0
+
+    @staticmethod
+    def _complete_length(path: str) -> int:
+        """Tamanho do arquivo até a última quebra de linha (sem a linha incompleta)."""
+        with open(path, "rb") as ledger_file:
+            end = ledger_file.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                start = max(0, position - REPLAY_CHUNK_BYTES)
+                ledger_file.seek(start)
+                newline = ledger_file.read(position - start).rfind(b"\n")
+                if newline >= 0:
+                    return start + newline + 1
+                position = start
+        return 0
+
+    def _append(self, event: dict) -> None:
+        self._file.write(json.dumps(event, separators=(",", ":")).encode("utf-8") + b"\n")
+        self._pending += 1
+        if self._pending >= self.fsync_every:
+            self.flush()
+
+    def open_flight(self, flight_id: str, capacity: int) -> None:
+        """Registra a capacidade de um voo."""
+        self._append({"type": "flight", "flight_id": flight_id, "capacity": capacity})
+
+    def record(self, flight_id: str, passengers: int, is_cancellation: bool, result: BookingResult) -> None:
+        """
+        Registra o resultado de uma chamada a `book_flight`.
+
+        Cancelamentos devem ser registrados apenas quando efetivamente processados.
+        """
+        if is_cancellation:
+            event = {"type": "cancellation", "flight_id": flight_id, "passengers": passengers,
+                     "refund_amount": result.refund_amount}
+        elif result.confirmation:
+            event = {"type": "booking", "flight_id": flight_id, "passengers": passengers,
+                     "total_price": result.total_price, "points_used": result.points_used}
+        else:
+            event = {"type": "rejected", "flight_id": flight_id, "passengers": passengers}
+        self._append(event)
+
+    def flush(self) -> None:
+        """Grava os eventos pendentes e os sincroniza com o disco."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @staticmethod
+    def replay(path: str | os.PathLike, snapshot_path: str | os.PathLike | None = None) -> LedgerState:
+        """Reconstrói o estado a partir do snapshot (se houver) e dos eventos seguintes."""
+        state, _ = BookingLedger._replay(path, snapshot_path)
+        return state
+
+    @staticmethod
+    def _replay(path, snapshot_path) -> tuple[LedgerState, int]:
+        state = LedgerState()
+        offset = 0
+        if snapshot_path is not None and os.path.exists(snapshot_path):
+            with open(snapshot_path, encoding="utf-8") as snapshot_file:
+                snapshot = json.load(snapshot_file)
+            state = LedgerState.from_dict(snapshot["state"])
+            offset = snapshot["offset"]
+
+        if not os.path.exists(path):
+            return state, offset
+        with open(path, "rb") as ledger_file:
+            ledger_file.seek(offset)
+            while lines := ledger_file.readlines(REPLAY_CHUNK_BYTES):
+                # Uma linha sem quebra no final é uma escrita incompleta: fica para depois
+                complete = lines[-1].endswith(b"\n")
+                if not complete:
+                    lines.pop()
+                # Decodifica o bloco inteiro de uma vez, como um único array JSON
+                for event in json.loads(b"[" + b",".join(lines) + b"]"):
+                    state.apply(event)
+                offset += sum(map(len, lines))
+                if not complete:
+                    break
+        return state, offset
+
+    @staticmethod
+    def write_snapshot(path: str | os.PathLike, snapshot_path: str | os.PathLike) -> LedgerState:
+        """Atualiza o snapshot com todos os eventos já gravados e retorna o estado."""
+        state, offset = BookingLedger._replay(path, snapshot_path)
+        snapshot_path = os.fspath(snapshot_path)
+        temporary = snapshot_path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as snapshot_file:
+            json.dump({"offset": offset, "state": state.to_dict()}, snapshot_file)
+            snapshot_file.flush()
+            os.fsync(snapshot_file.fileno())
+        os.replace(temporary, snapshot_path)
+        return state
+
+    def __repr__(self):
+        """Retorna uma representação legível do objeto."""
+        return f"BookingLedger(path='{self.path}', fsync_every={self.fsync_every})"
@@ -2,6 +2,8 @@ class BookingResult:
     """
     Uma classe para armazenar o resultado de uma operação de reserva de voo.
     """
+    __slots__ = ("confirmation", "total_price", "refund_amount", "points_used")
+
     def __init__(self, confirmation, total_price, refund_amount, points_used):
         self.confirmation = confirmation
         self.total_price = total_price
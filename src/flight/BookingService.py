@@ -0,0 +1,117 @@
+import asyncio
+from collections.abc import Hashable
+from datetime import datetime
+
+from src.flight.BookingResult import BookingResult
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.SeatInventory import SeatInventory
+
+
+class BookingService:
+    """
+    Front-end assíncrono de reservas com serialização por voo.
+
+    Cada voo tem uma fila própria, consumida por uma única tarefa, então pedidos
+    do mesmo voo são processados em ordem e pedidos de voos diferentes
+    avançam em paralelo. `max_concurrency` limita os pedidos em andamento no
+    serviço todo; uma fila de voo cheia rejeita novos pedidos com
+    `asyncio.QueueFull` (backpressure), e pedidos que excedem `timeout`
+    segundos são cancelados antes de executar.
+    """
+    def __init__(
+        self,
+        inventory: SeatInventory,
+        system: FlightBookingSystem | None = None,
+        max_concurrency: int = 10000,
+        max_queue_per_flight: int = 1000,
+        timeout: float | None = 5.0,
+    ):
+        if max_concurrency < 1 or max_queue_per_flight < 1:
+            raise ValueError("Os limites de concorrência e de fila devem ser positivos.")
+        self.inventory = inventory
+        self.system = system if system is not None else FlightBookingSystem()
+        self.max_concurrency = max_concurrency
+        self.max_queue_per_flight = max_queue_per_flight
+        self.timeout = timeout
+        self._semaphore: asyncio.Semaphore | None = None
+        self._queues: dict[Hashable, asyncio.Queue] = {}
+        self._workers: dict[Hashable, asyncio.Task] = {}
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    async def request(
+            self,
+            flight_id: Hashable,
+            passengers: int,
+            booking_time: datetime,
+            current_price: float,
+            previous_sales: int,
+            is_cancellation: bool,
+            departure_time: datetime,
+            reward_points_available: int
+        ) -> BookingResult:
+        """Enfileira uma reserva ou cancelamento no voo e aguarda o resultado."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            queue = self._queues.get(flight_id)
+            if queue is None:
+                queue = self._queues[flight_id] = asyncio.Queue(self.max_queue_per_flight)
+            future = asyncio.get_running_loop().create_future()
+            arguments = (passengers, booking_time, current_price, previous_sales,
+                         is_cancellation, departure_time, reward_points_available)
+            try:
+                queue.put_nowait((future, arguments))
+            except asyncio.QueueFull:
+                self.rejected += 1
+                raise
+            if flight_id not in self._workers:
+                self._workers[flight_id] = asyncio.create_task(self._drain(flight_id, queue))
+            try:
+                return await asyncio.wait_for(future, self.timeout)
+            except asyncio.TimeoutError:
+                self.timed_out += 1
+                raise
+
+    async def _drain(self, flight_id: Hashable, queue: asyncio.Queue) -> None:
+        """Processa a fila do voo em ordem e encerra quando ela esvazia."""
+        try:
+            while not queue.empty():
+                future, arguments = queue.get_nowait()
+                # Pedidos cancelados por timeout não chegam a reservar assentos
+                if future.done():
+                    continue
+                (passengers, booking_time, current_price, previous_sales,
+                 is_cancellation, departure_time, reward_points_available) = arguments
+                try:
+                    result = self.inventory.book(
+                        self.system, flight_id, passengers, booking_time, current_price,
+                        previous_sales, is_cancellation, departure_time, reward_points_available,
+                    )
+                except Exception as error:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+                    self.completed += 1
+                # Cede a vez para os outros voos entre um pedido e outro
+                await asyncio.sleep(0)
+        finally:
+            del self._workers[flight_id]
+            if queue.empty():
+                del self._queues[flight_id]
+
+    def metrics(self) -> dict:
+        """Retorna contadores do serviço e o tamanho atual das filas."""
+        return {
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "active_flights": len(self._workers),
+            "queued": sum(queue.qsize() for queue in self._queues.values()),
+        }
+
+    def __repr__(self):
+        """Retorna uma representação legível do objeto."""
+        return (f"BookingService(max_concurrency={self.max_concurrency}, "
+                f"max_queue_per_flight={self.max_queue_per_flight}, timeout={self.timeout})")
@@ -0,0 +1,155 @@
+from collections import deque
+from collections.abc import Hashable
+from datetime import datetime, timedelta
+
+from src.flight.LedgerState import LedgerState
+
+EPOCH = datetime(1970, 1, 1)
+
+
+class DemandTracker:
+    """
+    Mantém, por voo, o contador de vendas usado como `previous_sales` no preço dinâmico.
+
+    Reservas confirmadas e cancelamentos atualizam o contador em O(1). Com
+    `window`, só as vendas dos últimos `window` contam: elas ficam agrupadas em
+    intervalos de `bucket`, em ordem mesmo quando os eventos chegam fora de
+    ordem, e os intervalos vencidos são descartados conforme o tempo avança
+    (horários sem fuso horário ou em segundos epoch).
+    """
+    def __init__(self, window: timedelta | None = None, bucket: timedelta = timedelta(hours=1)):
+        if bucket <= timedelta(0):
+            raise ValueError("bucket deve ser positivo.")
+        if window is not None and window < bucket:
+            raise ValueError("window deve ser maior ou igual a bucket.")
+        self.window = window
+        self.bucket = bucket
+        self._totals: dict[Hashable, int] = {}
+        self._buckets: dict[Hashable, deque[list[int]]] = {}
+
+    def _bucket_index(self, at: datetime | int) -> int:
+        if isinstance(at, datetime):
+            return (at - EPOCH) // self.bucket
+        # Segundos epoch, como aceitos por `book_flight`
+        return timedelta(seconds=at) // self.bucket
+
+    def _expire(self, flight_id: Hashable, now_index: int) -> None:
+        buckets = self._buckets.get(flight_id)
+        if not buckets:
+            return
+        oldest_kept = now_index - self.window // self.bucket + 1
+        while buckets and buckets[0][0] < oldest_kept:
+            self._totals[flight_id] -= buckets.popleft()[1]
+
+    def _event_index(self, at: datetime | int | None) -> int:
+        if at is None:
+            raise ValueError("Com janela de tempo, informe o horário do evento.")
+        return self._bucket_index(at)
+
+    def _bucket_at(self, flight_id: Hashable, index: int, create: bool) -> list[int] | None:
+        """Intervalo `index` do voo, criado na posição certa se `create`; `None` se já venceu."""
+        buckets = self._buckets.setdefault(flight_id, deque())
+        if buckets and index < buckets[-1][0] - self.window // self.bucket + 1:
+            return None
+        # Eventos fora de ordem caem no seu próprio intervalo, não no mais recente
+        position = len(buckets)
+        while position and buckets[position - 1][0] > index:
+            position -= 1
+        if position and buckets[position - 1][0] == index:
+            return buckets[position - 1]
+        if not create:
+            return None
+        entry = [index, 0]
+        buckets.insert(position, entry)
+        return entry
+
+    def record_booking(self, flight_id: Hashable, passengers: int, at: datetime | int | None = None) -> None:
+        """Soma uma reserva confirmada às vendas do voo (com janela, se ainda não venceu)."""
+        if self.window is not None:
+            index = self._event_index(at)
+            entry = self._bucket_at(flight_id, index, create=True)
+            if entry is None:
+                return
+            entry[1] += passengers
+        self._totals[flight_id] = self._totals.get(flight_id, 0) + passengers
+        if self.window is not None:
+            self._expire(flight_id, self._buckets[flight_id][-1][0])
+
+    def record_cancellation(
+        self,
+        flight_id: Hashable,
+        passengers: int,
+        at: datetime | int | None = None,
+        booked_at: datetime | int | None = None,
+    ) -> None:
+        """
+        Desconta um cancelamento das vendas do voo, sem deixá-las negativas.
+
+        Com janela, o cancelamento sai do intervalo em que a venda foi
+        registrada: o de `booked_at`, se informado (nada é descontado se ele já
+        venceu), ou senão os intervalos mais recentes primeiro.
+        """
+        total = self._totals.get(flight_id, 0)
+        if self.window is None:
+            self._totals[flight_id] = max(0, total - passengers)
+            return
+        index = self._event_index(at)
+        if booked_at is not None:
+            entry = self._bucket_at(flight_id, self._bucket_index(booked_at), create=False)
+            entries = [] if entry is None else [entry]
+        else:
+            entries = reversed(self._buckets.get(flight_id, ()))
+        remaining = passengers
+        for entry in entries:
+            if remaining <= 0:
+                break
+            taken = min(remaining, entry[1])
+            entry[1] -= taken
+            remaining -= taken
+        self._totals[flight_id] = total - (passengers - remaining)
+        self._expire(flight_id, index)
+
+    def previous_sales(self, flight_id: Hashable, now: datetime | int | None = None) -> int:
+        """Retorna as vendas do voo (dentro da janela terminada em `now`, se houver janela)."""
+        if self.window is not None and now is not None:
+            self._expire(flight_id, self._bucket_index(now))
+        return self._totals.get(flight_id, 0)
+
+    def snapshot(self) -> dict:
+        """
+        Retorna o estado em estruturas simples, próprias para serialização.
+
+        As tabelas por voo são listas de pares `[flight_id, valor]`, como em
+        `LedgerState.to_dict`, para que um `flight_id` inteiro sobreviva ao JSON.
+        """
+        return {
+            "window_seconds": None if self.window is None else self.window.total_seconds(),
+            "bucket_seconds": self.bucket.total_seconds(),
+            "totals": list(map(list, self._totals.items())),
+            "buckets": [[flight_id, [list(entry) for entry in buckets]]
+                        for flight_id, buckets in self._buckets.items()],
+        }
+
+    @classmethod
+    def restore(cls, data: dict) -> "DemandTracker":
+        """Reconstrói um rastreador a partir de `snapshot`."""
+        window = data["window_seconds"]
+        tracker = cls(
+            window=None if window is None else timedelta(seconds=window),
+            bucket=timedelta(seconds=data["bucket_seconds"]),
+        )
+        tracker._totals = dict(data["totals"])
+        tracker._buckets = {flight_id: deque(list(entry) for entry in buckets)
+                            for flight_id, buckets in data["buckets"]}
+        return tracker
+
+    @classmethod
+    def from_ledger(cls, state: LedgerState) -> "DemandTracker":
+        """Cria um rastreador sem janela com as vendas reconstruídas do livro-razão."""
+        tracker = cls()
+        tracker._totals = dict(state.sales)
+        return tracker
+
+    def __repr__(self):
+        """Retorna uma representação legível do objeto."""
+        return f"DemandTracker(flights={len(self._totals)}, window={self.window})"
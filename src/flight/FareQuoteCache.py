@@ -0,0 +1,173 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from datetime import datetime
+
+from src.flight.BookingResult import BookingResult
+from src.flight.FlightBookingSystem import (
+    FULL_REFUND_SECONDS,
+    LAST_MINUTE_SECONDS,
+    FlightBookingSystem,
+    seconds_to_departure,
+)
+from src.flight.FlightRequest import FlightRequest
+
+
+class FareQuoteCache:
+    """
+    Cache de cotações na frente de `FlightBookingSystem.book_flight`.
+
+    A chave usa apenas o que influencia o resultado: os horários entram como a
+    faixa de antecedência (menos de 24h, entre 24h e 48h, 48h ou mais) e os
+    assentos como "cabe ou não cabe", então pedidos equivalentes reaproveitam a
+    mesma entrada. O cache é limitado a `max_entries` (LRU), aceita expiração
+    por `ttl` em segundos e, quando `flight_id` é informado, descarta as
+    entradas do voo assim que `current_price` ou `previous_sales` mudam.
+
+    Os `BookingResult` retornados são compartilhados entre chamadas e devem ser
+    tratados como somente leitura.
+    """
+    def __init__(
+        self,
+        system: FlightBookingSystem | None = None,
+        max_entries: int = 100000,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries deve ser positivo.")
+        self.system = system if system is not None else FlightBookingSystem()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[tuple, tuple[BookingResult, float | None]] = OrderedDict()
+        self._flight_keys: dict[Hashable, set[tuple]] = {}
+        self._flight_inputs: dict[Hashable, tuple[float, int]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def time_bucket(booking_time: datetime | int, departure_time: datetime | int) -> int:
+        """Faixa de antecedência usada por `book_flight`: 0 (<24h), 1 (<48h) ou 2."""
+        departure_in_seconds = seconds_to_departure(booking_time, departure_time)
+        if departure_in_seconds < LAST_MINUTE_SECONDS:
+            return 0
+        if departure_in_seconds < FULL_REFUND_SECONDS:
+            return 1
+        return 2
+
+    def book_flight(
+                    self,
+                    passengers: int,
+                    booking_time: datetime | int,
+                    available_seats: int,
+                    current_price: float,
+                    previous_sales: int,
+                    is_cancellation: bool,
+                    departure_time: datetime | int,
+                    reward_points_available: int,
+                    flight_id: Hashable = None
+                ) -> BookingResult:
+        """Retorna a cotação do cache ou a calcula com `book_flight` e a armazena."""
+        if flight_id is not None:
+            inputs = (current_price, previous_sales)
+            if self._flight_inputs.get(flight_id, inputs) != inputs:
+                self.invalidate(flight_id)
+            self._flight_inputs[flight_id] = inputs
+
+        key = (
+            flight_id,
+            passengers,
+            passengers > available_seats,
+            current_price,
+            previous_sales,
+            is_cancellation,
+            self.time_bucket(booking_time, departure_time),
+            reward_points_available,
+        )
+        entry = self._entries.get(key)
+        if entry is not None:
+            result, expires_at = entry
+            if expires_at is None or self._clock() < expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            self._remove(key)
+
+        self.misses += 1
+        result = self.system.book_flight(
+            passengers=passengers,
+            booking_time=booking_time,
+            available_seats=available_seats,
+            current_price=current_price,
+            previous_sales=previous_sales,
+            is_cancellation=is_cancellation,
+            departure_time=departure_time,
+            reward_points_available=reward_points_available,
+        )
+        expires_at = self._clock() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (result, expires_at)
+        self._flight_keys.setdefault(flight_id, set()).add(key)
+        if len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+        return result
+
+    def book_request(self, request: FlightRequest, flight_id: Hashable = None) -> BookingResult:
+        """Versão de `book_flight` que recebe um `FlightRequest`."""
+        return self.book_flight(
+            request.passengers,
+            request.booking_time,
+            request.available_seats,
+            request.current_price,
+            request.previous_sales,
+            request.is_cancellation,
+            request.departure_time,
+            request.reward_points_available,
+            flight_id,
+        )
+
+    def _remove(self, key: tuple) -> None:
+        del self._entries[key]
+        keys = self._flight_keys.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._flight_keys[key[0]]
+
+    def invalidate(self, flight_id: Hashable = None) -> int:
+        """Remove as entradas de um voo (ou sem voo, se `None`) e retorna quantas eram."""
+        keys = self._flight_keys.pop(flight_id, set())
+        for key in keys:
+            del self._entries[key]
+        self._flight_inputs.pop(flight_id, None)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Esvazia o cache, mantendo as estatísticas."""
+        self._entries.clear()
+        self._flight_keys.clear()
+        self._flight_inputs.clear()
+
+    def stats(self) -> dict:
+        """Retorna acertos, falhas, despejos, invalidações e ocupação do cache."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        """Retorna uma representação legível do objeto."""
+        return f"FareQuoteCache(size={len(self._entries)}, max_entries={self.max_entries}, ttl={self.ttl})"
@@ -1,23 +1,44 @@
+from collections.abc import Hashable, Sequence
 from datetime import datetime
 from src.flight.BookingResult import BookingResult
+from src.flight.BookingBatchResult import BookingBatchResult
+from src.flight.DemandTracker import DemandTracker
+from src.flight.FlightRequest import FlightRequest
+
+# Limites de antecedência em segundos: taxa de última hora e reembolso integral
+LAST_MINUTE_SECONDS = 24 * 3600
+FULL_REFUND_SECONDS = 48 * 3600
+
+
+def seconds_to_departure(booking_time: datetime | float, departure_time: datetime | float) -> float:
+    """Antecedência da reserva em segundos, para `datetime`s ou segundos epoch."""
+    if isinstance(booking_time, datetime):
+        return (departure_time - booking_time).total_seconds()
+    return departure_time - booking_time
+
 
 class FlightBookingSystem:
     """
     Um sistema para gerenciar a reserva e o cancelamento de voos.
     """
+    def __init__(self, demand_tracker: DemandTracker | None = None):
+        self.demand_tracker = demand_tracker
+
     def book_flight(
                     self, 
                     passengers: int, 
-                    booking_time: datetime, 
+                    booking_time: datetime | int, 
                     available_seats: int,
                     current_price: float, 
                     previous_sales: int, 
                     is_cancellation: bool,
-                    departure_time: datetime, 
+                    departure_time: datetime | int, 
                     reward_points_available: int
                 ) -> BookingResult:
         """
         Processa a reserva ou cancelamento de um voo com base nos parâmetros fornecidos.
+
+        Os horários podem ser `datetime`s ou segundos epoch (inteiros).
         """
         final_price = 0.0
         refund_amount = 0.0
@@ -33,10 +54,9 @@ class FlightBookingSystem:
         final_price = current_price * price_factor * passengers
 
         # Taxa de última hora
-        time_difference = departure_time - booking_time
-        hours_to_departure = time_difference.total_seconds() / 3600
+        departure_in_seconds = seconds_to_departure(booking_time, departure_time)
         
-        if hours_to_departure < 24:
+        if departure_in_seconds < LAST_MINUTE_SECONDS:
             final_price += 100
 
         # Desconto para reservas em grupo
@@ -54,7 +74,7 @@ class FlightBookingSystem:
 
         # Lógica para cancelamentos
         if is_cancellation:
-            if hours_to_departure >= 48:
+            if departure_in_seconds >= FULL_REFUND_SECONDS:
                 refund_amount = final_price
             else:
                 refund_amount = final_price * 0.5
@@ -63,4 +83,125 @@ class FlightBookingSystem:
             
         confirmation = True
 
-        return BookingResult(confirmation, final_price, refund_amount, points_used)
\ No newline at end of file
+        return BookingResult(confirmation, final_price, refund_amount, points_used)
+
+    def book_request(self, request: FlightRequest) -> BookingResult:
+        """Processa um `FlightRequest` com `book_flight`."""
+        return self.book_flight(
+            passengers=request.passengers,
+            booking_time=request.booking_time,
+            available_seats=request.available_seats,
+            current_price=request.current_price,
+            previous_sales=request.previous_sales,
+            is_cancellation=request.is_cancellation,
+            departure_time=request.departure_time,
+            reward_points_available=request.reward_points_available,
+        )
+
+    def book_tracked_flight(
+                    self,
+                    flight_id: Hashable,
+                    passengers: int,
+                    booking_time: datetime | int,
+                    available_seats: int,
+                    current_price: float,
+                    is_cancellation: bool,
+                    departure_time: datetime | int,
+                    reward_points_available: int
+                ) -> BookingResult:
+        """
+        Como `book_flight`, mas lê `previous_sales` do `DemandTracker` e o atualiza.
+        """
+        if self.demand_tracker is None:
+            raise RuntimeError("FlightBookingSystem foi criado sem DemandTracker.")
+        result = self.book_flight(
+            passengers=passengers,
+            booking_time=booking_time,
+            available_seats=available_seats,
+            current_price=current_price,
+            previous_sales=self.demand_tracker.previous_sales(flight_id, booking_time),
+            is_cancellation=is_cancellation,
+            departure_time=departure_time,
+            reward_points_available=reward_points_available,
+        )
+        if result.confirmation:
+            self.demand_tracker.record_booking(flight_id, passengers, booking_time)
+        elif is_cancellation and passengers <= available_seats:
+            self.demand_tracker.record_cancellation(flight_id, passengers, booking_time)
+        return result
+
+    def quote_batch(
+                    self,
+                    passengers: Sequence[int],
+                    booking_times: Sequence[float],
+                    available_seats: Sequence[int],
+                    current_prices: Sequence[float],
+                    previous_sales: Sequence[int],
+                    is_cancellations: Sequence[bool],
+                    departure_times: Sequence[float],
+                    reward_points_available: Sequence[int],
+                    out: BookingBatchResult | None = None
+                ) -> BookingBatchResult:
+        """
+        Aplica as regras de `book_flight` a colunas de pedidos, com horários em segundos epoch.
+
+        Cada linha produz exatamente o mesmo resultado da chamada escalar
+        correspondente; o retorno traz uma lista por campo de `BookingResult`.
+        Se `out` for informado (por exemplo, de `BookingBatchResult.allocate`),
+        as primeiras linhas de suas colunas são sobrescritas e ele é retornado,
+        sem alocar novas colunas.
+        """
+        size = len(passengers)
+        columns = (booking_times, available_seats, current_prices, previous_sales,
+                   is_cancellations, departure_times, reward_points_available)
+        if any(len(column) != size for column in columns):
+            raise ValueError("Todas as colunas devem ter o mesmo tamanho.")
+        if out is None:
+            out = BookingBatchResult.allocate(size)
+        elif len(out) < size:
+            raise ValueError("O resultado `out` tem menos linhas que o lote.")
+
+        confirmation = out.confirmation
+        total_price = out.total_price
+        refund_amount = out.refund_amount
+        points_used = out.points_used
+
+        for row in range(size):
+            row_passengers = passengers[row]
+
+            # Assentos insuficientes: valores padrão
+            if row_passengers > available_seats[row]:
+                confirmation[row] = False
+                total_price[row] = 0.0
+                refund_amount[row] = 0.0
+                points_used[row] = False
+                continue
+
+            final_price = current_prices[row] * ((previous_sales[row] / 100.0) * 0.8) * row_passengers
+            departure_in_seconds = departure_times[row] - booking_times[row]
+            if departure_in_seconds < LAST_MINUTE_SECONDS:
+                final_price += 100
+            if row_passengers > 4:
+                final_price *= 0.95
+            points = reward_points_available[row]
+            if points > 0:
+                final_price -= points * 0.01
+            if final_price < 0:
+                final_price = 0
+
+            if is_cancellations[row]:
+                confirmation[row] = False
+                total_price[row] = 0
+                if departure_in_seconds >= FULL_REFUND_SECONDS:
+                    refund_amount[row] = final_price
+                else:
+                    refund_amount[row] = final_price * 0.5
+                points_used[row] = False
+                continue
+
+            confirmation[row] = True
+            total_price[row] = final_price
+            refund_amount[row] = 0.0
+            points_used[row] = points > 0
+
+        return out
@@ -0,0 +1,28 @@
+class FlightRequest:
+    """
+    Um pedido compacto de reserva ou cancelamento, com horários em segundos epoch.
+    """
+    __slots__ = ("passengers", "booking_time", "available_seats", "current_price",
+                 "previous_sales", "is_cancellation", "departure_time", "reward_points_available")
+
+    def __init__(self, passengers, booking_time, available_seats, current_price,
+                 previous_sales, is_cancellation, departure_time, reward_points_available):
+        self.passengers = passengers
+        self.booking_time = booking_time
+        self.available_seats = available_seats
+        self.current_price = current_price
+        self.previous_sales = previous_sales
+        self.is_cancellation = is_cancellation
+        self.departure_time = departure_time
+        self.reward_points_available = reward_points_available
+
+    def __repr__(self):
+        """Retorna uma representação legível do objeto."""
+        return (f"FlightRequest(passengers={self.passengers}, "
+                f"booking_time={self.booking_time}, "
+                f"available_seats={self.available_seats}, "
+                f"current_price={self.current_price:.2f}, "
+                f"previous_sales={self.previous_sales}, "
+                f"is_cancellation={self.is_cancellation}, "
+                f"departure_time={self.departure_time}, "
+                f"reward_points_available={self.reward_points_available})")
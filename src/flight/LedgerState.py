@@ -0,0 +1,64 @@
+class LedgerState:
+    """
+    Estado por voo reconstruído a partir do livro-razão de reservas.
+
+    Guarda a capacidade, os assentos vendidos (o `previous_sales` do voo), a
+    receita e os reembolsos acumulados.
+    """
+    def __init__(self):
+        self.capacity: dict[str, int] = {}
+        self.sales: dict[str, int] = {}
+        self.revenue: dict[str, float] = {}
+        self.refunds: dict[str, float] = {}
+        self.events = 0
+
+    def available_seats(self, flight_id: str) -> int:
+        """Assentos livres do voo."""
+        return self.capacity[flight_id] - self.sales.get(flight_id, 0)
+
+    def apply(self, event: dict) -> None:
+        """Aplica um evento do livro-razão ao estado."""
+        kind = event["type"]
+        flight_id = event["flight_id"]
+        if kind == "flight":
+            self.capacity[flight_id] = event["capacity"]
+        elif kind == "booking":
+            self.sales[flight_id] = self.sales.get(flight_id, 0) + event["passengers"]
+            self.revenue[flight_id] = self.revenue.get(flight_id, 0.0) + event["total_price"]
+        elif kind == "cancellation":
+            self.sales[flight_id] = self.sales.get(flight_id, 0) - event["passengers"]
+            self.refunds[flight_id] = self.refunds.get(flight_id, 0.0) + event["refund_amount"]
+        elif kind != "rejected":
+            raise ValueError(f"Tipo de evento desconhecido: {kind!r}")
+        self.events += 1
+
+    def to_dict(self) -> dict:
+        """
+        Serializa o estado para JSON.
+
+        Cada tabela por voo vira uma lista de pares `[flight_id, valor]`, pois
+        chaves de objetos JSON são sempre texto e um `flight_id` inteiro
+        voltaria como outro voo.
+        """
+        return {
+            "capacity": list(map(list, self.capacity.items())),
+            "sales": list(map(list, self.sales.items())),
+            "revenue": list(map(list, self.revenue.items())),
+            "refunds": list(map(list, self.refunds.items())),
+            "events": self.events,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LedgerState":
+        """Reconstrói o estado serializado por `to_dict`."""
+        state = cls()
+        state.capacity = dict(data["capacity"])
+        state.sales = dict(data["sales"])
+        state.revenue = dict(data["revenue"])
+        state.refunds = dict(data["refunds"])
+        state.events = data["events"]
+        return state
+
+    def __repr__(self):
+        """Retorna uma representação legível do objeto."""
+        return f"LedgerState(flights={len(self.capacity)}, events={self.events})"
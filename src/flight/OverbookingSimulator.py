@@ -0,0 +1,194 @@
+import argparse
+import itertools
+import random
+import sys
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+from src.flight.BookingBatchResult import BookingBatchResult
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.SimulationResult import SimulationResult
+
+
+class OverbookingSimulator:
+    """
+    Simula reservas, cancelamentos e embarques para dimensionar o overbooking.
+
+    Cada cenário acompanha `flights` voos de `capacity` assentos desde `horizon`
+    segundos antes da partida, em passos de `tick` segundos. A cada passo chega,
+    por voo, no máximo um pedido de reserva (com probabilidade
+    `booking_probability`) e um cancelamento (cada grupo cancela com
+    probabilidade `cancellation_rate`). Os sorteios de todos os voos são feitos
+    de uma vez e os pedidos do passo são avaliados juntos por
+    `FlightBookingSystem.quote_batch`, com as regras de preço e reembolso de
+    `book_flight` e `previous_sales` igual aos assentos vendidos do voo.
+
+    São vendidos até `capacity * (1 + overbooking)` assentos. Na partida, cada
+    grupo falta com probabilidade `no_show_rate`, e os passageiros que excedem a
+    capacidade têm o embarque negado ao custo de `denied_boarding_cost` cada.
+    """
+    def __init__(
+        self,
+        flights: int = 100,
+        capacity: int = 180,
+        overbooking: float = 0.05,
+        current_price: float = 300.0,
+        booking_probability: float = 0.3,
+        cancellation_rate: float = 0.0005,
+        no_show_rate: float = 0.05,
+        party_sizes: Sequence[int] = (1, 2, 3, 4, 5, 6),
+        party_weights: Sequence[float] = (50, 25, 10, 8, 4, 3),
+        horizon: int = 30 * 24 * 3600,
+        tick: int = 3600,
+        denied_boarding_cost: float = 600.0,
+        system: FlightBookingSystem | None = None,
+    ):
+        if flights < 1 or capacity < 1:
+            raise ValueError("flights e capacity devem ser positivos.")
+        if tick < 1 or horizon < tick:
+            raise ValueError("tick deve ser positivo e menor ou igual a horizon.")
+        if overbooking < 0:
+            raise ValueError("overbooking não pode ser negativo.")
+        for rate in (booking_probability, cancellation_rate, no_show_rate):
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError("As probabilidades devem estar entre 0 e 1.")
+        if not party_sizes or len(party_sizes) != len(party_weights):
+            raise ValueError("party_sizes e party_weights devem ter o mesmo tamanho.")
+        self.flights = flights
+        self.capacity = capacity
+        self.overbooking = overbooking
+        self.current_price = current_price
+        self.booking_probability = booking_probability
+        self.cancellation_rate = cancellation_rate
+        self.no_show_rate = no_show_rate
+        self.party_sizes = tuple(party_sizes)
+        self.party_weights = tuple(party_weights)
+        self.horizon = horizon
+        self.tick = tick
+        self.denied_boarding_cost = denied_boarding_cost
+        self.system = system if system is not None else FlightBookingSystem()
+
+    @property
+    def sell_limit(self) -> int:
+        """Assentos vendáveis por voo, incluindo o overbooking."""
+        return int(self.capacity * (1 + self.overbooking))
+
+    def run(self, seed: int) -> SimulationResult:
+        """Executa um cenário com o gerador `random.Random(seed)`."""
+        rng = random.Random(seed)
+        flights = self.flights
+        sell_limit = self.sell_limit
+        departure = self.horizon
+        party_cum_weights = list(itertools.accumulate(self.party_weights))
+        keep_probability = 1.0 - self.cancellation_rate
+
+        sold = [0] * flights
+        parties: list[list[int]] = [[] for _ in range(flights)]
+        revenue = [0.0] * flights
+        refunds = [0.0] * flights
+        # No máximo uma reserva e um cancelamento por voo a cada passo
+        out = BookingBatchResult.allocate(2 * flights)
+
+        for booking_time in range(0, self.horizon, self.tick):
+            arrivals = rng.choices((True, False), cum_weights=(self.booking_probability, 1.0), k=flights)
+            sizes = rng.choices(self.party_sizes, cum_weights=party_cum_weights, k=flights)
+            draws = [rng.random() for _ in range(flights)]
+
+            row_flights = []
+            row_parties = []
+            passengers = []
+            available_seats = []
+            is_cancellations = []
+            for flight in range(flights):
+                if arrivals[flight]:
+                    row_flights.append(flight)
+                    row_parties.append(None)
+                    passengers.append(sizes[flight])
+                    available_seats.append(sell_limit - sold[flight])
+                    is_cancellations.append(False)
+                booked = parties[flight]
+                if booked and draws[flight] < 1.0 - keep_probability ** len(booked):
+                    index = rng.randrange(len(booked))
+                    row_flights.append(flight)
+                    row_parties.append(index)
+                    passengers.append(booked[index])
+                    # Cancelamentos são conferidos contra os assentos vendidos
+                    available_seats.append(sold[flight])
+                    is_cancellations.append(True)
+            if not row_flights:
+                continue
+
+            rows = len(row_flights)
+            self.system.quote_batch(
+                passengers=passengers,
+                booking_times=[booking_time] * rows,
+                available_seats=available_seats,
+                current_prices=[self.current_price] * rows,
+                previous_sales=[sold[flight] for flight in row_flights],
+                is_cancellations=is_cancellations,
+                departure_times=[departure] * rows,
+                reward_points_available=[0] * rows,
+                out=out,
+            )
+
+            for row, flight in enumerate(row_flights):
+                if is_cancellations[row]:
+                    booked = parties[flight]
+                    index = row_parties[row]
+                    sold[flight] -= booked[index]
+                    booked[index] = booked[-1]
+                    booked.pop()
+                    refunds[flight] += out.refund_amount[row]
+                elif out.confirmation[row]:
+                    parties[flight].append(passengers[row])
+                    sold[flight] += passengers[row]
+                    revenue[flight] += out.total_price[row]
+
+        boarded = []
+        denied_boardings = []
+        load_factor = []
+        for booked in parties:
+            shows = sum(size for size in booked if rng.random() >= self.no_show_rate)
+            boarded.append(min(shows, self.capacity))
+            denied_boardings.append(max(0, shows - self.capacity))
+            load_factor.append(min(shows, self.capacity) / self.capacity)
+
+        return SimulationResult(seed, self.capacity, revenue, refunds, sold, boarded,
+                                denied_boardings, load_factor, self.denied_boarding_cost)
+
+    def run_many(self, seeds: Iterable[int], workers: int | None = None) -> list[SimulationResult]:
+        """Executa um cenário por semente em processos separados, na ordem das sementes."""
+        seeds = list(seeds)
+        if workers == 1 or len(seeds) <= 1:
+            return [self.run(seed) for seed in seeds]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.run, seeds))
+
+    def __repr__(self):
+        """Retorna uma representação legível do objeto."""
+        return (f"OverbookingSimulator(flights={self.flights}, capacity={self.capacity}, "
+                f"overbooking={self.overbooking}, horizon={self.horizon}, tick={self.tick})")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare overbooking levels by simulation.")
+    parser.add_argument("--overbooking", type=float, nargs="+", default=[0.0, 0.05, 0.1],
+                        help="Overbooking levels to compare (fraction of capacity).")
+    parser.add_argument("--scenarios", type=int, default=16, help="Scenarios per level.")
+    parser.add_argument("--flights", type=int, default=100, help="Flights per scenario.")
+    parser.add_argument("--capacity", type=int, default=180, help="Seats per flight.")
+    parser.add_argument("--workers", type=int, help="Number of worker processes.")
+    args = parser.parse_args(argv)
+
+    for overbooking in args.overbooking:
+        simulator = OverbookingSimulator(flights=args.flights, capacity=args.capacity, overbooking=overbooking)
+        summaries = [result.summary() for result in simulator.run_many(range(args.scenarios), args.workers)]
+        mean = {key: sum(summary[key] for summary in summaries) / len(summaries) for key in summaries[0]}
+        sys.stdout.write(f"overbooking={overbooking:.2f} net_revenue={mean['net_revenue']:.2f} "
+                         f"refunds={mean['refunds']:.2f} denied_boardings={mean['denied_boardings']:.1f} "
+                         f"mean_load_factor={mean['mean_load_factor']:.3f}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+import threading
+from collections.abc import Hashable
+from datetime import datetime
+
+from src.flight.BookingResult import BookingResult
+from src.flight.FlightBookingSystem import FlightBookingSystem
+
+
+class SeatInventory:
+    """
+    Controla os assentos de cada voo com reservas e liberações atômicas.
+
+    Os voos são distribuídos entre `stripes` travas (lock striping): operações
+    sobre voos diferentes raramente disputam a mesma trava, e não há trava
+    global no caminho de reserva.
+    """
+    def __init__(self, stripes: int = 64):
+        if stripes < 1:
+            raise ValueError("stripes deve ser positivo.")
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._capacity: dict[Hashable, int] = {}
+        self._available: dict[Hashable, int] = {}
+
+    def _lock_for(self, flight_id: Hashable) -> threading.Lock:
+        return self._locks[hash(flight_id) % len(self._locks)]
+
+    def add_flight(self, flight_id: Hashable, capacity: int) -> None:
+        """Cadastra um voo com todos os assentos livres."""
+        if capacity < 0:
+            raise ValueError("A capacidade não pode ser negativa.")
+        with self._lock_for(flight_id):
+            if flight_id in self._capacity:
+                raise ValueError(f"Voo já cadastrado: {flight_id!r}")
+            self._capacity[flight_id] = capacity
+            self._available[flight_id] = capacity
+
+    def available(self, flight_id: Hashable) -> int:
+        """Retorna os assentos livres do voo."""
+        return self._available[flight_id]
+
+    def sold(self, flight_id: Hashable) -> int:
+        """Retorna os assentos ocupados do voo."""
+        with self._lock_for(flight_id):
+            return self._capacity[flight_id] - self._available[flight_id]
+
+    def reserve(self, flight_id: Hashable, seats: int) -> bool:
+        """Reserva `seats` assentos se houver disponibilidade; retorna se conseguiu."""
+        if seats <= 0:
+            raise ValueError("A reserva deve ter ao menos um assento.")
+        with self._lock_for(flight_id):
+            available = self._available[flight_id]
+            if seats > available:
+                return False
+            self._available[flight_id] = available - seats
+            return True
+
+    def release(self, flight_id: Hashable, seats: int) -> None:
+        """Devolve `seats` assentos ao voo."""
+        if seats < 0:
+            raise ValueError("A liberação não pode ser negativa.")
+        with self._lock_for(flight_id):
+            available = self._available[flight_id] + seats
+            if available > self._capacity[flight_id]:
+                raise ValueError("Liberação maior que os assentos ocupados.")
+            self._available[flight_id] = available
+
+    def book(
+            self,
+            system: FlightBookingSystem,
+            flight_id: Hashable,
+            passengers: int,
+            booking_time: datetime,
+            current_price: float,
+            previous_sales: int,
+            is_cancellation: bool,
+            departure_time: datetime,
+            reward_points_available: int
+        ) -> BookingResult:
+        """
+        Executa `book_flight` com o estoque do voo e o atualiza de forma atômica.
+
+        Reservas usam os assentos livres como `available_seats` e os ocupam se
+        confirmadas. Cancelamentos usam os assentos ocupados, de modo que só é
+        possível cancelar o que foi vendido, e os devolvem quando processados.
+        """
+        if passengers < 0:
+            raise ValueError("O número de passageiros não pode ser negativo.")
+        with self._lock_for(flight_id):
+            available = self._available[flight_id]
+            sold = self._capacity[flight_id] - available
+            result = system.book_flight(
+                passengers=passengers,
+                booking_time=booking_time,
+                available_seats=sold if is_cancellation else available,
+                current_price=current_price,
+                previous_sales=previous_sales,
+                is_cancellation=is_cancellation,
+                departure_time=departure_time,
+                reward_points_available=reward_points_available,
+            )
+            if result.confirmation:
+                self._available[flight_id] = available - passengers
+            elif is_cancellation and passengers <= sold:
+                self._available[flight_id] = available + passengers
+            return result
+
+    def __repr__(self):
+        """Retorna uma representação legível do objeto."""
+        return f"SeatInventory(flights={len(self._capacity)}, stripes={len(self._locks)})"
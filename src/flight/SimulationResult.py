@@ -0,0 +1,46 @@
+class SimulationResult:
+    """
+    Armazena, por voo, o resultado de um cenário do `OverbookingSimulator`.
+
+    Cada atributo de voo é uma lista com uma posição por voo do cenário.
+    """
+    __slots__ = ("seed", "capacity", "revenue", "refunds", "sold", "boarded",
+                 "denied_boardings", "load_factor", "denied_boarding_cost")
+
+    def __init__(self, seed, capacity, revenue, refunds, sold, boarded,
+                 denied_boardings, load_factor, denied_boarding_cost):
+        self.seed = seed
+        self.capacity = capacity
+        self.revenue = revenue
+        self.refunds = refunds
+        self.sold = sold
+        self.boarded = boarded
+        self.denied_boardings = denied_boardings
+        self.load_factor = load_factor
+        self.denied_boarding_cost = denied_boarding_cost
+
+    def __len__(self):
+        return len(self.revenue)
+
+    def summary(self) -> dict:
+        """Totais do cenário: receita, reembolsos, embarques negados e ocupação média."""
+        revenue = sum(self.revenue)
+        refunds = sum(self.refunds)
+        denied = sum(self.denied_boardings)
+        denied_cost = denied * self.denied_boarding_cost
+        return {
+            "revenue": revenue,
+            "refunds": refunds,
+            "denied_boardings": denied,
+            "denied_boarding_cost": denied_cost,
+            "net_revenue": revenue - refunds - denied_cost,
+            "mean_load_factor": sum(self.load_factor) / len(self.load_factor) if self.load_factor else 0.0,
+        }
+
+    def __repr__(self):
+        """Retorna uma representação legível do objeto."""
+        summary = self.summary()
+        return (f"SimulationResult(seed={self.seed}, flights={len(self)}, "
+                f"net_revenue={summary['net_revenue']:.2f}, "
+                f"mean_load_factor={summary['mean_load_factor']:.3f}, "
+                f"denied_boardings={summary['denied_boardings']})")
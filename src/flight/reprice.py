@@ -0,0 +1,236 @@
+"""
+Reprecificação em massa de cenários de reserva, em vários processos.
+
+Uso:
+    python -m src.flight.reprice cenarios.csv saida/ --chunk-size 100000 --workers 8
+
+O CSV de entrada tem cabeçalho com as colunas de `SCENARIO_COLUMNS` (horários em
+segundos epoch). Os cenários são lidos em blocos; cada bloco é copiado para um
+segmento de memória compartilhada, processado por `FlightBookingSystem.quote_batch`
+em um processo trabalhador e gravado, em ordem, em um arquivo binário por coluna
+de resultado. Um checkpoint após cada bloco permite retomar uma execução interrompida.
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import TextIO
+
+from src.flight.BookingBatchResult import BookingBatchResult
+from src.flight.FlightBookingSystem import FlightBookingSystem
+
+SCENARIO_COLUMNS = ["passengers", "booking_time", "available_seats", "current_price",
+                    "previous_sales", "is_cancellation", "departure_time", "reward_points_available"]
+INTEGER_COLUMNS = [name for name in SCENARIO_COLUMNS if name != "current_price"]
+# Arquivos de saída: nome da coluna -> formato do array (bytes nativos)
+RESULT_FILES = {"confirmation": "B", "total_price": "d", "refund_amount": "d", "points_used": "B"}
+CHECKPOINT = "checkpoint.json"
+
+
+def _layout(rows: int) -> dict[str, tuple[int, str]]:
+    """Deslocamento e formato de cada coluna no segmento compartilhado de um bloco."""
+    layout = {}
+    offset = 0
+    for name in INTEGER_COLUMNS:
+        layout[name] = (offset, "q")
+        offset += rows * 8
+    for name in ["current_price", "total_price", "refund_amount"]:
+        layout[name] = (offset, "d")
+        offset += rows * 8
+    for name in ["confirmation", "points_used"]:
+        layout[name] = (offset, "B")
+        offset += rows
+    layout["size"] = (offset, "")
+    return layout
+
+
+def _views(buffer, rows: int) -> dict[str, memoryview]:
+    layout = _layout(rows)
+    return {
+        name: buffer[offset:offset + rows * array(fmt).itemsize].cast(fmt)
+        for name, (offset, fmt) in layout.items() if name != "size"
+    }
+
+
+def _parse_bool(value: str) -> int:
+    return 1 if value.strip().lower() in ("1", "true", "yes") else 0
+
+
+def _reprice_chunk(name: str, rows: int) -> int:
+    """Processa, em um trabalhador, o bloco guardado no segmento compartilhado `name`."""
+    # O processo principal cria e remove o segmento. Os trabalhadores usam o
+    # mesmo resource tracker, então anexar aqui só registra de novo o mesmo nome
+    segment = shared_memory.SharedMemory(name=name)
+    views = _views(segment.buf, rows)
+    try:
+        # Os resultados são gravados direto nas colunas do segmento compartilhado
+        FlightBookingSystem().quote_batch(
+            passengers=views["passengers"],
+            booking_times=views["booking_time"],
+            available_seats=views["available_seats"],
+            current_prices=views["current_price"],
+            previous_sales=views["previous_sales"],
+            is_cancellations=views["is_cancellation"],
+            departure_times=views["departure_time"],
+            reward_points_available=views["reward_points_available"],
+            out=BookingBatchResult(views["confirmation"], views["total_price"],
+                                   views["refund_amount"], views["points_used"]),
+        )
+    finally:
+        for view in views.values():
+            view.release()
+        segment.close()
+    return rows
+
+
+def _load_chunk(rows: list[list[str]], header: list[str]) -> shared_memory.SharedMemory:
+    """Copia um bloco de linhas do CSV para um novo segmento compartilhado."""
+    count = len(rows)
+    segment = shared_memory.SharedMemory(create=True, size=max(1, _layout(count)["size"][0]))
+    views = _views(segment.buf, count)
+    try:
+        for name in SCENARIO_COLUMNS:
+            index = header.index(name)
+            if name == "current_price":
+                views[name][:] = array("d", (float(row[index]) for row in rows))
+            elif name == "is_cancellation":
+                views[name][:] = array("q", (_parse_bool(row[index]) for row in rows))
+            else:
+                views[name][:] = array("q", (int(row[index]) for row in rows))
+    finally:
+        for view in views.values():
+            view.release()
+    return segment
+
+
+def _read_checkpoint(output_dir: str) -> int:
+    path = os.path.join(output_dir, CHECKPOINT)
+    if not os.path.exists(path):
+        return 0
+    with open(path, encoding="utf-8") as checkpoint_file:
+        return json.load(checkpoint_file)["rows"]
+
+
+def _write_checkpoint(output_dir: str, rows: int) -> None:
+    path = os.path.join(output_dir, CHECKPOINT)
+    with open(path + ".tmp", "w", encoding="utf-8") as checkpoint_file:
+        json.dump({"rows": rows}, checkpoint_file)
+        checkpoint_file.flush()
+        os.fsync(checkpoint_file.fileno())
+    os.replace(path + ".tmp", path)
+
+
+def reprice(
+    input_path: str,
+    output_dir: str,
+    chunk_size: int = 100000,
+    workers: int | None = None,
+    resume: bool = True,
+    progress: TextIO | None = None,
+) -> int:
+    """Reprecifica todos os cenários de `input_path` e retorna o total de linhas gravadas."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size deve ser positivo.")
+    os.makedirs(output_dir, exist_ok=True)
+    done = _read_checkpoint(output_dir) if resume else 0
+
+    # Uma coluna menor que o checkpoint perdeu linhas que ele diz gravadas
+    for name, fmt in RESULT_FILES.items():
+        path = os.path.join(output_dir, f"{name}.bin")
+        size = os.path.getsize(path) if os.path.exists(path) else 0
+        if size < done * array(fmt).itemsize:
+            raise ValueError(f"{name}.bin tem menos linhas que o checkpoint ({done}); "
+                             "recomece sem retomar (--restart).")
+
+    # Descarta qualquer saída gravada depois do último checkpoint
+    outputs = {}
+    for name, fmt in RESULT_FILES.items():
+        path = os.path.join(output_dir, f"{name}.bin")
+        output = open(path, "r+b" if os.path.exists(path) else "wb")
+        output.truncate(done * array(fmt).itemsize)
+        output.seek(0, os.SEEK_END)
+        outputs[name] = output
+
+    start = time.perf_counter()
+    written = done
+    workers = workers or os.cpu_count() or 1
+    try:
+        with open(input_path, newline="", encoding="utf-8") as scenarios, \
+                ProcessPoolExecutor(max_workers=workers) as executor:
+            reader = csv.reader(scenarios)
+            header = next(reader)
+            missing = set(SCENARIO_COLUMNS) - set(header)
+            if missing:
+                raise ValueError(f"Colunas ausentes no CSV: {sorted(missing)}")
+            for _ in itertools.islice(reader, done):
+                pass
+
+            in_flight = deque()
+
+            def finish_oldest() -> None:
+                nonlocal written
+                segment, rows, future = in_flight.popleft()
+                future.result()
+                views = _views(segment.buf, rows)
+                try:
+                    for name in RESULT_FILES:
+                        outputs[name].write(views[name])
+                finally:
+                    for view in views.values():
+                        view.release()
+                segment.close()
+                segment.unlink()
+                # As colunas chegam ao disco antes do checkpoint que as declara gravadas
+                for output in outputs.values():
+                    output.flush()
+                    os.fsync(output.fileno())
+                written += rows
+                _write_checkpoint(output_dir, written)
+                if progress is not None:
+                    elapsed = time.perf_counter() - start
+                    rate = (written - done) / elapsed if elapsed > 0 else 0.0
+                    progress.write(f"{written} cenários gravados ({rate:.0f} cenários/s)\n")
+
+            try:
+                while rows := list(itertools.islice(reader, chunk_size)):
+                    segment = _load_chunk(rows, header)
+                    in_flight.append((segment, len(rows), executor.submit(_reprice_chunk, segment.name, len(rows))))
+                    if len(in_flight) >= 2 * workers:
+                        finish_oldest()
+                while in_flight:
+                    finish_oldest()
+            finally:
+                # Em caso de erro, libera os segmentos dos blocos não gravados
+                for segment, _, future in in_flight:
+                    future.cancel()
+                    segment.close()
+                    segment.unlink()
+    finally:
+        for output in outputs.values():
+            output.close()
+    return written
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Reprice booking scenarios in bulk across processes.")
+    parser.add_argument("input", help="CSV file with booking scenarios.")
+    parser.add_argument("output", help="Directory for the columnar result files.")
+    parser.add_argument("--chunk-size", type=int, default=100000, help="Scenarios per chunk.")
+    parser.add_argument("--workers", type=int, help="Number of worker processes.")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint.")
+    args = parser.parse_args(argv)
+
+    reprice(args.input, args.output, args.chunk_size, args.workers,
+            resume=not args.restart, progress=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
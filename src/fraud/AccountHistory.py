@@ -0,0 +1,56 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+
+from src.fraud.Transaction import Transaction
+
+
+class AccountHistory:
+    """
+    Histórico de transações de uma conta, mantido ordenado por timestamp.
+
+    Pode ser passado a `FraudDetectionSystem.check_for_fraud` no lugar da lista
+    `previous_transactions`: a contagem da janela de 60 minutos é feita por
+    busca binária e a última transação é obtida em O(1).
+    """
+    def __init__(self, transactions: list[Transaction] | None = None):
+        self._transactions: list[Transaction] = []
+        self._timestamps: list[datetime] = []
+        for transaction in transactions or ():
+            self.add(transaction)
+
+    def add(self, transaction: Transaction) -> None:
+        """Insere a transação mantendo a ordem cronológica (O(1) se já estiver em ordem)."""
+        timestamps = self._timestamps
+        if not timestamps or transaction.timestamp >= timestamps[-1]:
+            timestamps.append(transaction.timestamp)
+            self._transactions.append(transaction)
+            return
+        # Empates ficam depois dos já existentes, como em uma lista preenchida com append
+        index = bisect_right(timestamps, transaction.timestamp)
+        timestamps.insert(index, transaction.timestamp)
+        self._transactions.insert(index, transaction)
+
+    def count_since(self, cutoff: datetime) -> int:
+        """Conta as transações com timestamp maior ou igual a `cutoff`."""
+        return len(self._timestamps) - bisect_left(self._timestamps, cutoff)
+
+    def discard_before(self, cutoff: datetime) -> int:
+        """Remove as transações anteriores a `cutoff` e retorna quantas foram removidas."""
+        index = bisect_left(self._timestamps, cutoff)
+        if index:
+            del self._timestamps[:index]
+            del self._transactions[:index]
+        return index
+
+    def __len__(self) -> int:
+        return len(self._transactions)
+
+    def __getitem__(self, index):
+        return self._transactions[index]
+
+    def __iter__(self):
+        return iter(self._transactions)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return f"AccountHistory(transactions={len(self._transactions)})"
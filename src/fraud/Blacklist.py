@@ -0,0 +1,61 @@
+import sys
+from collections.abc import Hashable, Iterable
+
+
+class Blacklist:
+    """
+    Lista de bloqueio de localizações, construída uma única vez e consultada em O(1).
+
+    Aceita localizações exatas (strings ou códigos inteiros) e, opcionalmente,
+    prefixos de região (por exemplo "BR-" bloqueia "BR-SP" e "BR-RJ"). Pode ser
+    passada a `FraudDetectionSystem` no lugar da lista `blacklisted_locations`.
+    """
+    def __init__(self, locations: Iterable[Hashable] = (), prefixes: Iterable[str] = ()):
+        self._snapshot = self._build(locations, prefixes)
+
+    @staticmethod
+    def _build(locations: Iterable[Hashable], prefixes: Iterable[str]):
+        """Monta o snapshot imutável (localizações exatas, prefixos agrupados por tamanho)."""
+        exact = frozenset(
+            sys.intern(location) if isinstance(location, str) else location
+            for location in locations
+        )
+        by_length: dict[int, set[str]] = {}
+        for prefix in prefixes:
+            if not prefix:
+                raise ValueError("Prefixos da blacklist não podem ser vazios.")
+            by_length.setdefault(len(prefix), set()).add(sys.intern(prefix))
+        grouped = tuple(
+            (length, frozenset(group)) for length, group in sorted(by_length.items())
+        )
+        return exact, grouped
+
+    def replace(self, locations: Iterable[Hashable], prefixes: Iterable[str] = ()) -> None:
+        """
+        Substitui o conteúdo da blacklist.
+
+        O novo snapshot é construído por completo antes de ser publicado com uma
+        única atribuição, então consultas concorrentes veem a lista antiga ou a
+        nova, nunca um estado parcial.
+        """
+        self._snapshot = self._build(locations, prefixes)
+
+    def __contains__(self, location: Hashable) -> bool:
+        exact, prefixes = self._snapshot
+        if location in exact:
+            return True
+        if prefixes and isinstance(location, str):
+            for length, group in prefixes:
+                if location[:length] in group:
+                    return True
+        return False
+
+    def __len__(self) -> int:
+        exact, prefixes = self._snapshot
+        return len(exact) + sum(len(group) for _, group in prefixes)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        exact, prefixes = self._snapshot
+        return (f"Blacklist(locations={len(exact)}, "
+                f"prefixes={sum(len(group) for _, group in prefixes)})")
@@ -0,0 +1,37 @@
+from src.fraud.FraudCheckResult import FraudCheckResult
+
+
+class FraudBatchResult:
+    """Armazena, em colunas, os resultados de uma verificação de fraude em lote."""
+    def __init__(
+        self,
+        is_fraudulent: list[bool],
+        is_blocked: list[bool],
+        verification_required: list[bool],
+        risk_score: list[int],
+    ):
+        self.is_fraudulent = is_fraudulent
+        self.is_blocked = is_blocked
+        self.verification_required = verification_required
+        self.risk_score = risk_score
+
+    @classmethod
+    def allocate(cls, size: int) -> "FraudBatchResult":
+        """Cria colunas com `size` linhas para reaproveitar como `out` de `check_for_fraud_batch`."""
+        return cls([False] * size, [False] * size, [False] * size, [0] * size)
+
+    def __len__(self) -> int:
+        return len(self.risk_score)
+
+    def __getitem__(self, index: int) -> FraudCheckResult:
+        """Retorna o resultado da linha `index` como um `FraudCheckResult`."""
+        return FraudCheckResult(
+            self.is_fraudulent[index],
+            self.is_blocked[index],
+            self.verification_required[index],
+            self.risk_score[index],
+        )
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return f"FraudBatchResult(rows={len(self)})"
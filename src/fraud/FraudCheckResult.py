@@ -1,5 +1,7 @@
 class FraudCheckResult:
     """Armazena os resultados de uma verificação de detecção de fraude."""
+    __slots__ = ("is_fraudulent", "is_blocked", "verification_required", "risk_score")
+
     def __init__(self, is_fraudulent: bool, is_blocked: bool, verification_required: bool, risk_score: int):
         self.is_fraudulent = is_fraudulent
         self.is_blocked = is_blocked
@@ -1,5 +1,11 @@
+from bisect import bisect_left, insort
+from collections.abc import Hashable, Sequence
+from datetime import timedelta
 from src.fraud.Transaction import Transaction
 from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.AccountHistory import AccountHistory
+from src.fraud.FraudBatchResult import FraudBatchResult
+from src.fraud.Blacklist import Blacklist
 
 
 class FraudDetectionSystem:
@@ -7,11 +13,19 @@ class FraudDetectionSystem:
     def check_for_fraud(
         self,
         current_transaction: Transaction,
-        previous_transactions: list[Transaction],
-        blacklisted_locations: list[str],
+        previous_transactions: list[Transaction] | AccountHistory,
+        blacklisted_locations: list[str] | Blacklist,
+        previous_sorted: bool = False,
     ) -> FraudCheckResult:
         """
         Verifica a transação atual contra um conjunto de regras para identificar fraudes.
+
+        `previous_transactions` pode ser uma lista em ordem cronológica ou um
+        histórico indexado (`AccountHistory`, `TransactionLog` ou uma visão dele),
+        que responde à contagem da última hora por busca binária.
+        `blacklisted_locations` pode ser uma lista ou uma `Blacklist` pré-construída.
+        Com `previous_sorted=True` o chamador garante que a lista está em ordem
+        cronológica, e a contagem da última hora percorre apenas o final dela.
         """
         is_fraudulent = False
         is_blocked = False
@@ -25,12 +39,27 @@ class FraudDetectionSystem:
             risk_score += 50
 
         # 2. Verifica por transações excessivas na última hora
-        recent_transaction_count = 0
-        for transaction in previous_transactions:
-            time_difference = current_transaction.timestamp - transaction.timestamp
-            time_diff_minutes = time_difference.total_seconds() / 60
-            if time_diff_minutes <= 60:
+        if hasattr(previous_transactions, "count_since"):
+            recent_transaction_count = previous_transactions.count_since(
+                current_transaction.timestamp - timedelta(minutes=60)
+            )
+        elif previous_sorted:
+            # Da mais recente para a mais antiga: para ao sair da janela ou ao passar de 10
+            recent_transaction_count = 0
+            for transaction in reversed(previous_transactions):
+                time_difference = current_transaction.timestamp - transaction.timestamp
+                if time_difference.total_seconds() / 60 > 60:
+                    break
                 recent_transaction_count += 1
+                if recent_transaction_count > 10:
+                    break
+        else:
+            recent_transaction_count = 0
+            for transaction in previous_transactions:
+                time_difference = current_transaction.timestamp - transaction.timestamp
+                time_diff_minutes = time_difference.total_seconds() / 60
+                if time_diff_minutes <= 60:
+                    recent_transaction_count += 1
         
         if recent_transaction_count > 10:
             is_blocked = True
@@ -53,3 +82,90 @@ class FraudDetectionSystem:
             risk_score = 100
 
         return FraudCheckResult(is_fraudulent, is_blocked, verification_required, risk_score)
+
+    def check_for_fraud_batch(
+        self,
+        amounts: Sequence[float],
+        timestamps: Sequence[float],
+        locations: Sequence[Hashable],
+        account_ids: Sequence[Hashable],
+        blacklisted_locations: list[str] | Blacklist,
+        out: FraudBatchResult | None = None,
+    ) -> FraudBatchResult:
+        """
+        Verifica um lote de transações recebido em colunas.
+
+        `timestamps` são instantes epoch em segundos. O histórico de cada linha
+        são as linhas anteriores da mesma conta, na ordem de entrada, o que
+        equivale a chamar `check_for_fraud` linha a linha com essa lista.
+        Se `out` for informado (por exemplo, de `FraudBatchResult.allocate`), as
+        primeiras linhas de suas colunas são sobrescritas e ele é retornado.
+        """
+        size = len(amounts)
+        if not len(timestamps) == len(locations) == len(account_ids) == size:
+            raise ValueError("Todas as colunas devem ter o mesmo tamanho.")
+
+        blacklist = blacklisted_locations
+        if isinstance(blacklist, (list, tuple)):
+            blacklist = frozenset(blacklist)
+
+        if out is None:
+            out = FraudBatchResult.allocate(size)
+        elif len(out) < size:
+            raise ValueError("O resultado `out` tem menos linhas que o lote.")
+        is_fraudulent = out.is_fraudulent
+        is_blocked = out.is_blocked
+        verification_required = out.verification_required
+        risk_score = out.risk_score
+
+        # Por conta: timestamps ordenados (regra 2) e última transação (regra 3)
+        sorted_times: dict[Hashable, list[float]] = {}
+        last_seen: dict[Hashable, tuple[float, Hashable]] = {}
+
+        for row in range(size):
+            timestamp = timestamps[row]
+            location = locations[row]
+            account = account_ids[row]
+            fraudulent = blocked = False
+            score = 0
+
+            # 1. Valor da transação
+            if amounts[row] > 10000:
+                fraudulent = True
+                score += 50
+
+            # 2. Transações da mesma conta na última hora
+            times = sorted_times.get(account)
+            if times is None:
+                times = sorted_times[account] = []
+            first = bisect_left(times, timestamp - 3600)
+            # Ajusta a borda com o mesmo cálculo do caminho escalar
+            while first > 0 and (timestamp - times[first - 1]) / 60 <= 60:
+                first -= 1
+            while first < len(times) and not (timestamp - times[first]) / 60 <= 60:
+                first += 1
+            if len(times) - first > 10:
+                blocked = True
+                score += 30
+
+            # 3. Mudança de localização desde a última transação da conta
+            last = last_seen.get(account)
+            if last is not None:
+                if (timestamp - last[0]) / 60 < 30 and last[1] != location:
+                    fraudulent = True
+                    score += 20
+
+            # 4. Localização na lista de bloqueio
+            if location in blacklist:
+                blocked = True
+                score = 100
+
+            # Todas as colunas são gravadas, pois `out` pode conter um lote anterior
+            is_fraudulent[row] = fraudulent
+            is_blocked[row] = blocked
+            verification_required[row] = fraudulent
+            risk_score[row] = score
+            insort(times, timestamp)
+            last_seen[account] = (timestamp, location)
+
+        return out
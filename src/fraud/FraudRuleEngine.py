@@ -0,0 +1,146 @@
+from datetime import timedelta
+
+from src.fraud.Blacklist import Blacklist
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.Transaction import Transaction
+
+FLAGS = {"is_fraudulent": 1, "is_blocked": 2, "verification_required": 4}
+
+# Regras atuais de `FraudDetectionSystem.check_for_fraud`, declaradas como dados
+DEFAULT_RULES = (
+    {"name": "high_amount", "kind": "amount_above", "threshold": 10000,
+     "score": 50, "flags": ("is_fraudulent", "verification_required")},
+    {"name": "velocity", "kind": "velocity", "window_minutes": 60, "max_count": 10,
+     "score": 30, "flags": ("is_blocked",)},
+    {"name": "location_change", "kind": "location_change", "window_minutes": 30,
+     "score": 20, "flags": ("is_fraudulent", "verification_required")},
+    {"name": "blacklist", "kind": "blacklisted_location",
+     "score": 100, "score_mode": "set", "flags": ("is_blocked",)},
+)
+
+
+def _amount_above(rule: dict):
+    threshold = rule["threshold"]
+
+    def check(current, previous, blacklist) -> bool:
+        return current.amount > threshold
+    return check
+
+
+def _velocity(rule: dict):
+    window_minutes = rule["window_minutes"]
+    window = timedelta(minutes=window_minutes)
+    max_count = rule["max_count"]
+
+    def check(current, previous, blacklist) -> bool:
+        if hasattr(previous, "count_since"):
+            return previous.count_since(current.timestamp - window) > max_count
+        count = 0
+        for transaction in previous:
+            if (current.timestamp - transaction.timestamp).total_seconds() / 60 <= window_minutes:
+                count += 1
+                # Só importa ultrapassar o limite, e a contagem não diminui
+                if count > max_count:
+                    return True
+        return False
+    return check
+
+
+def _location_change(rule: dict):
+    window_minutes = rule["window_minutes"]
+
+    def check(current, previous, blacklist) -> bool:
+        if not previous:
+            return False
+        last = previous[-1]
+        minutes_since_last = (current.timestamp - last.timestamp).total_seconds() / 60
+        return minutes_since_last < window_minutes and last.location != current.location
+    return check
+
+
+def _blacklisted_location(rule: dict):
+    def check(current, previous, blacklist) -> bool:
+        return current.location in blacklist
+    return check
+
+
+RULE_KINDS = {
+    "amount_above": _amount_above,
+    "velocity": _velocity,
+    "location_change": _location_change,
+    "blacklisted_location": _blacklisted_location,
+}
+
+
+class FraudRuleEngine:
+    """
+    Avalia regras de fraude declaradas como dados.
+
+    As regras são compiladas uma única vez em um plano plano e ordenado. Regras
+    com `score_mode` "set" (como a blacklist) sobrescrevem a pontuação e são
+    avaliadas primeiro: quando uma delas dispara, as regras "add" cujas flags já
+    estão todas ativas são puladas, e as demais só contribuem com flags. Com as
+    regras padrão, o resultado é idêntico a `FraudDetectionSystem.check_for_fraud`.
+    """
+    def __init__(self, rules: tuple[dict, ...] | list[dict] = DEFAULT_RULES):
+        self.rules = tuple(dict(rule) for rule in rules)
+        self._overrides, self._additive = self._compile(self.rules)
+
+    @staticmethod
+    def _compile(rules):
+        overrides = []
+        additive = []
+        for rule in rules:
+            kind = rule.get("kind")
+            if kind not in RULE_KINDS:
+                raise ValueError(f"Tipo de regra desconhecido: {kind!r}")
+            unknown = set(rule.get("flags", ())) - set(FLAGS)
+            if unknown:
+                raise ValueError(f"Flags desconhecidas na regra {rule.get('name', kind)!r}: {sorted(unknown)}")
+            mode = rule.get("score_mode", "add")
+            if mode not in ("add", "set"):
+                raise ValueError(f"score_mode inválido: {mode!r}")
+            if mode == "add" and overrides:
+                raise ValueError("Regras com score_mode 'set' devem vir depois das regras 'add'.")
+            mask = 0
+            for flag in rule.get("flags", ()):
+                mask |= FLAGS[flag]
+            step = (RULE_KINDS[kind](rule), mask, rule.get("score", 0))
+            (overrides if mode == "set" else additive).append(step)
+        return tuple(overrides), tuple(additive)
+
+    def check(
+        self,
+        current_transaction: Transaction,
+        previous_transactions,
+        blacklisted_locations: list[str] | Blacklist,
+    ) -> FraudCheckResult:
+        """Executa o plano compilado para uma transação."""
+        flags = 0
+        score = None
+        for predicate, mask, value in self._overrides:
+            if predicate(current_transaction, previous_transactions, blacklisted_locations):
+                flags |= mask
+                score = value
+
+        if score is None:
+            score = 0
+            for predicate, mask, value in self._additive:
+                if predicate(current_transaction, previous_transactions, blacklisted_locations):
+                    flags |= mask
+                    score += value
+        else:
+            for predicate, mask, value in self._additive:
+                if mask & ~flags and predicate(current_transaction, previous_transactions, blacklisted_locations):
+                    flags |= mask
+
+        return FraudCheckResult(
+            bool(flags & FLAGS["is_fraudulent"]),
+            bool(flags & FLAGS["is_blocked"]),
+            bool(flags & FLAGS["verification_required"]),
+            score,
+        )
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return f"FraudRuleEngine(rules={[rule.get('name', rule['kind']) for rule in self.rules]})"
@@ -0,0 +1,227 @@
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+from collections.abc import Hashable
+from concurrent.futures import ThreadPoolExecutor
+
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.RollingFraudScorer import RollingFraudScorer
+from src.fraud.Transaction import Transaction
+from src.fraud.stream import parse_transactions
+
+
+class FraudScoringService:
+    """
+    Serviço assíncrono de verificação de fraude com micro-lotes.
+
+    Pedidos concorrentes entram em uma fila e são agrupados em lotes de até
+    `max_batch_size` itens ou até `max_delay` segundos após o primeiro item.
+    Cada lote é pontuado fora do laço de eventos, em uma única thread, para
+    preservar a ordem das transações de cada conta.
+    """
+    def __init__(
+        self,
+        scorer: RollingFraudScorer | None = None,
+        max_batch_size: int = 256,
+        max_delay: float = 0.002,
+        latency_window: int = 10000,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size deve ser positivo.")
+        if max_delay < 0:
+            raise ValueError("max_delay não pode ser negativo.")
+        self.scorer = scorer if scorer is not None else RollingFraudScorer()
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+        self._queue: asyncio.Queue | None = None
+        self._batcher: asyncio.Task | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._started_at = 0.0
+        self._requests = 0
+        self._batches = 0
+
+    async def start(self) -> None:
+        """Inicia a tarefa que agrupa e pontua os pedidos."""
+        if self._batcher is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._started_at = time.perf_counter()
+        self._batcher = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Interrompe o serviço.
+
+        Pedidos ainda na fila ou em um lote em formação são cancelados; um lote
+        que já está sendo pontuado termina e entrega seus resultados.
+        """
+        if self._batcher is None:
+            return
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            _, _, future, _ = self._queue.get_nowait()
+            future.cancel()
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+        self._batcher = None
+
+    async def check(self, account: Hashable, transaction: Transaction) -> FraudCheckResult:
+        """Enfileira uma verificação e aguarda o resultado do lote em que ela entrar."""
+        if self._batcher is None:
+            raise RuntimeError("FraudScoringService não foi iniciado.")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((account, transaction, future, time.perf_counter()))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = []
+            try:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.max_delay
+                while len(batch) < self.max_batch_size:
+                    if not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Interrompido por `stop()` antes da pontuação: o lote não será avaliado
+                for _, _, future, _ in batch:
+                    future.cancel()
+                raise
+
+            delivery = asyncio.ensure_future(
+                self._deliver(batch, loop.run_in_executor(self._executor, self._score_batch, batch))
+            )
+            try:
+                await asyncio.shield(delivery)
+            except asyncio.CancelledError:
+                # O lote já está alterando o histórico do scorer: termina e entrega os resultados
+                await delivery
+                raise
+
+    async def _deliver(self, batch: list, scoring: asyncio.Future) -> None:
+        """Aguarda a pontuação do lote e resolve o futuro de cada pedido."""
+        try:
+            results = await scoring
+        except Exception as error:
+            for _, _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        finished = time.perf_counter()
+        for (_, _, future, enqueued), result in zip(batch, results):
+            self._latencies.append(finished - enqueued)
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+        self._requests += len(batch)
+        self._batches += 1
+
+    def _score_batch(self, batch: list) -> list[FraudCheckResult | Exception]:
+        """Pontua o lote; a falha de um item vira o resultado só desse item."""
+        results = []
+        for account, transaction, _, _ in batch:
+            try:
+                results.append(self.scorer.score(account, transaction))
+            except Exception as error:
+                results.append(error)
+        return results
+
+    def metrics(self) -> dict:
+        """Retorna contadores, vazão e latências (em milissegundos) do serviço."""
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        latencies = sorted(self._latencies)
+
+        def percentile(fraction: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+
+        return {
+            "requests": self._requests,
+            "batches": self._batches,
+            "mean_batch_size": self._requests / self._batches if self._batches else 0.0,
+            "requests_per_second": self._requests / elapsed if elapsed > 0 else 0.0,
+            "p50_latency_ms": percentile(0.50),
+            "p99_latency_ms": percentile(0.99),
+            "max_batch_size": self.max_batch_size,
+            "max_delay_ms": self.max_delay * 1000,
+        }
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Atende uma conexão TCP com um pedido JSON por linha.
+
+        Cada linha traz `account`, `amount`, `timestamp` e `location` e recebe o
+        resultado como JSON; a linha `{"command": "metrics"}` retorna as métricas.
+        """
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    if not isinstance(record, dict):
+                        raise ValueError("Cada linha deve ser um objeto JSON.")
+                    if record.get("command") == "metrics":
+                        response = self.metrics()
+                    else:
+                        account, transaction = next(parse_transactions([record]))
+                        result = await self.check(account, transaction)
+                        response = {
+                            "is_fraudulent": result.is_fraudulent,
+                            "is_blocked": result.is_blocked,
+                            "verification_required": result.verification_required,
+                            "risk_score": result.risk_score,
+                        }
+                except (ValueError, KeyError, TypeError) as error:
+                    response = {"error": str(error)}
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8646) -> asyncio.Server:
+        """Inicia o serviço e um servidor TCP local que o atende."""
+        await self.start()
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return (f"FraudScoringService(max_batch_size={self.max_batch_size}, "
+                f"max_delay={self.max_delay})")
+
+
+async def _main(args) -> None:
+    service = FraudScoringService(max_batch_size=args.batch_size, max_delay=args.max_delay_ms / 1000)
+    server = await service.serve(args.host, args.port)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve fraud checks over TCP with micro-batching.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on.")
+    parser.add_argument("--port", type=int, default=8646, help="Port to listen on.")
+    parser.add_argument("--batch-size", type=int, default=256, help="Maximum requests per batch.")
+    parser.add_argument("--max-delay-ms", type=float, default=2.0, help="Maximum wait to fill a batch.")
+    asyncio.run(_main(parser.parse_args()))
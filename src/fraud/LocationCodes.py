@@ -0,0 +1,40 @@
+import threading
+
+
+class LocationCodes:
+    """
+    Tabela de códigos inteiros de localização usada pelos `TransactionLog`.
+
+    A consulta de um código já existente não usa trava; a criação de um novo
+    código é feita sob uma trava, então threads concorrentes nunca atribuem
+    dois códigos à mesma localização. A tabela só cresce: para limitar a
+    memória, use uma instância própria por conjunto de logs e descarte-a junto
+    com eles.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._codes: dict[str, int] = {}
+        self._names: list[str] = []
+
+    def code(self, location: str) -> int:
+        """Retorna o código inteiro da localização, criando-o se necessário."""
+        code = self._codes.get(location)
+        if code is None:
+            with self._lock:
+                code = self._codes.get(location)
+                if code is None:
+                    # O nome entra antes do código para que quem vê o código ache o nome
+                    self._names.append(location)
+                    code = self._codes[location] = len(self._names) - 1
+        return code
+
+    def name(self, code: int) -> str:
+        """Retorna a localização de um código."""
+        return self._names[code]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return f"LocationCodes(locations={len(self)})"
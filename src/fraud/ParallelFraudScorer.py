@@ -0,0 +1,126 @@
+import multiprocessing
+import os
+from collections.abc import Hashable, Iterable
+from multiprocessing.connection import wait
+
+from src.fraud.Blacklist import Blacklist
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.RollingFraudScorer import RollingFraudScorer
+from src.fraud.Transaction import Transaction
+
+
+def _worker_main(connection, blacklisted_locations, max_accounts) -> None:
+    """Laço de um processo trabalhador: pontua lotes até receber `None`."""
+    scorer = RollingFraudScorer(blacklisted_locations=blacklisted_locations, max_accounts=max_accounts)
+    while True:
+        batch = connection.recv()
+        if batch is None:
+            break
+        results = []
+        for account, amount, timestamp, location in batch:
+            result = scorer.score(account, Transaction(amount, timestamp, location))
+            results.append((result.is_fraudulent, result.is_blocked,
+                            result.verification_required, result.risk_score))
+        connection.send(results)
+    connection.close()
+
+
+class ParallelFraudScorer:
+    """
+    Distribui a verificação de fraude entre vários processos, particionando por conta.
+
+    Cada conta é sempre enviada ao mesmo processo trabalhador, que mantém o
+    histórico dela entre chamadas de `score`. As transações seguem em lotes de
+    até `batch_size` linhas, na ordem de entrada, e os resultados voltam na
+    mesma ordem em que foram recebidos.
+    """
+    def __init__(
+        self,
+        blacklisted_locations: list[str] | Blacklist = (),
+        max_workers: int | None = None,
+        batch_size: int = 5000,
+        max_accounts: int | None = None,
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size deve ser positivo.")
+        if not isinstance(blacklisted_locations, Blacklist):
+            blacklisted_locations = Blacklist(blacklisted_locations)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self._connections = []
+        self._processes = []
+        for _ in range(self.max_workers):
+            parent_end, child_end = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_worker_main,
+                args=(child_end, blacklisted_locations, max_accounts),
+                daemon=True,
+            )
+            process.start()
+            child_end.close()
+            self._connections.append(parent_end)
+            self._processes.append(process)
+
+    def shard_of(self, account: Hashable) -> int:
+        """Retorna o índice do processo responsável pela conta."""
+        return hash(account) % self.max_workers
+
+    def score(self, transactions: Iterable[tuple[Hashable, Transaction]]) -> list[FraudCheckResult]:
+        """Pontua pares (conta, transação) e retorna os resultados na ordem de entrada."""
+        if not self._connections:
+            raise RuntimeError("ParallelFraudScorer já foi fechado.")
+
+        shards: list[list[tuple]] = [[] for _ in range(self.max_workers)]
+        positions: list[list[int]] = [[] for _ in range(self.max_workers)]
+        size = 0
+        for account, transaction in transactions:
+            shard = self.shard_of(account)
+            shards[shard].append((account, transaction.amount, transaction.timestamp, transaction.location))
+            positions[shard].append(size)
+            size += 1
+
+        results: list[FraudCheckResult | None] = [None] * size
+        offsets = [0] * self.max_workers
+        pending = {}
+
+        def send_next(shard: int) -> None:
+            start = offsets[shard]
+            if start < len(shards[shard]):
+                connection = self._connections[shard]
+                connection.send(shards[shard][start:start + self.batch_size])
+                pending[connection] = shard
+
+        for shard in range(self.max_workers):
+            send_next(shard)
+
+        # Um lote em andamento por processo: a ordem por conta fica preservada
+        while pending:
+            for connection in wait(list(pending)):
+                shard = pending.pop(connection)
+                start = offsets[shard]
+                for index, values in enumerate(connection.recv(), start):
+                    results[positions[shard][index]] = FraudCheckResult(*values)
+                offsets[shard] = start + self.batch_size
+                send_next(shard)
+
+        return results
+
+    def close(self) -> None:
+        """Encerra os processos trabalhadores."""
+        for connection in self._connections:
+            connection.send(None)
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return f"ParallelFraudScorer(max_workers={self.max_workers}, batch_size={self.batch_size})"
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from datetime import datetime, timedelta
+
+from src.fraud.AccountHistory import AccountHistory
+from src.fraud.Blacklist import Blacklist
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.Transaction import Transaction
+
+
+class RollingFraudScorer:
+    """
+    Aplica as regras de `FraudDetectionSystem` a um fluxo de transações de várias contas.
+
+    Cada conta guarda apenas a janela de histórico que as regras consultam, e
+    contas sem transações nos últimos `HISTORY_WINDOW` do fluxo (medido pela
+    transação mais recente vista) são descartadas, sem alterar resultados:
+    a memória acompanha as contas ativas, não todas as contas já vistas.
+    `max_accounts` é um teto rígido adicional que descarta as contas menos
+    usadas recentemente mesmo dentro da janela. Supõe que o fluxo chega em
+    ordem cronológica.
+    """
+    HISTORY_WINDOW = timedelta(minutes=60)
+
+    def __init__(
+        self,
+        fraud_system: FraudDetectionSystem | None = None,
+        blacklisted_locations: list[str] | Blacklist = (),
+        max_accounts: int | None = None,
+    ):
+        if max_accounts is not None and max_accounts < 1:
+            raise ValueError("max_accounts deve ser positivo.")
+        self.fraud_system = fraud_system if fraud_system is not None else FraudDetectionSystem()
+        if not isinstance(blacklisted_locations, Blacklist):
+            blacklisted_locations = Blacklist(blacklisted_locations)
+        self.blacklist = blacklisted_locations
+        self.max_accounts = max_accounts
+        # Contas na ordem da última transação vista, a menos recente primeiro
+        self._histories: OrderedDict[Hashable, AccountHistory] = OrderedDict()
+        self._latest: datetime | None = None
+
+    def score(self, account: Hashable, transaction: Transaction) -> FraudCheckResult:
+        """Verifica a transação contra o histórico da conta e a acrescenta a ele."""
+        history = self._histories.get(account)
+        if history is None:
+            history = self._histories[account] = AccountHistory()
+            if self.max_accounts is not None and len(self._histories) > self.max_accounts:
+                self._histories.popitem(last=False)
+        else:
+            self._histories.move_to_end(account)
+
+        result = self.fraud_system.check_for_fraud(transaction, history, self.blacklist)
+
+        history.add(transaction)
+        history.discard_before(history[-1].timestamp - self.HISTORY_WINDOW)
+        if self._latest is None or transaction.timestamp > self._latest:
+            self._latest = transaction.timestamp
+        self._evict_idle(self._latest - self.HISTORY_WINDOW)
+        return result
+
+    def _evict_idle(self, cutoff: datetime) -> None:
+        """Descarta as contas cuja transação mais recente é anterior a `cutoff`."""
+        histories = self._histories
+        while histories:
+            account, history = next(iter(histories.items()))
+            if history[-1].timestamp >= cutoff:
+                break
+            del histories[account]
+
+    def __len__(self) -> int:
+        return len(self._histories)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return f"RollingFraudScorer(accounts={len(self._histories)}, max_accounts={self.max_accounts})"
@@ -2,6 +2,8 @@ from datetime import datetime
 
 class Transaction:
     """Representa uma única transação financeira."""
+    __slots__ = ("amount", "timestamp", "location")
+
     def __init__(self, amount: float, timestamp: datetime, location: str):
         self.amount = amount
         self.timestamp = timestamp
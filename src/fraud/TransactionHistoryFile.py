@@ -0,0 +1,181 @@
+import mmap
+import os
+import struct
+from bisect import bisect_left
+from datetime import datetime, timedelta
+
+from src.fraud.RollingFraudScorer import RollingFraudScorer
+from src.fraud.Transaction import Transaction
+from src.fraud.TransactionLog import from_micros, to_micros
+
+MAGIC = b"FRDHIST1"
+HEADER_SIZE = len(MAGIC)
+# timestamp (int64, microssegundos epoch), valor (float64), localização (UTF-8, 32 bytes)
+RECORD = struct.Struct("<qd32s")
+RECORD_SIZE = RECORD.size
+LOCATION_SIZE = 32
+# Maior janela consultada pelas regras de fraude (regra 2)
+RETENTION = RollingFraudScorer.HISTORY_WINDOW
+
+
+class _TimestampIndex:
+    """Expõe os timestamps dos registros mapeados como sequência para busca binária."""
+    __slots__ = ("buffer", "count")
+
+    def __init__(self, buffer, count: int):
+        self.buffer = buffer
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> int:
+        return RECORD.unpack_from(self.buffer, HEADER_SIZE + index * RECORD_SIZE)[0]
+
+
+def _read_transaction(buffer, index: int) -> Transaction:
+    micros, amount, location = RECORD.unpack_from(buffer, HEADER_SIZE + index * RECORD_SIZE)
+    return Transaction(amount, from_micros(micros), location.rstrip(b"\0").decode("utf-8"))
+
+
+class TransactionHistoryFile:
+    """
+    Histórico de uma conta em arquivo binário, somente de acréscimo, lido via `mmap`.
+
+    O arquivo tem um cabeçalho de 8 bytes seguido de registros de tamanho fixo
+    em ordem cronológica, então o registro `i` fica no deslocamento
+    `HEADER_SIZE + i * RECORD_SIZE` e a janela da última hora é localizada por
+    busca binária, sem copiar os dados. As visões retornadas por `window`
+    podem ser passadas diretamente a `check_for_fraud`. Um registro incompleto
+    no final, deixado por uma queda durante `append`, é descartado ao abrir.
+    """
+    def __init__(self, path: str | os.PathLike):
+        self.path = os.fspath(path)
+        if not os.path.exists(self.path):
+            with open(self.path, "wb") as new_file:
+                new_file.write(MAGIC)
+        self._file = open(self.path, "r+b")
+        self._map = None
+        try:
+            self._open()
+        except ValueError:
+            self._file.close()
+            raise
+
+    def _open(self) -> None:
+        size = os.fstat(self._file.fileno()).st_size
+        self._file.seek(0)
+        if self._file.read(HEADER_SIZE) != MAGIC:
+            raise ValueError(f"{self.path} não é um arquivo de histórico de transações.")
+        self._count = (size - HEADER_SIZE) // RECORD_SIZE
+        if (size - HEADER_SIZE) % RECORD_SIZE:
+            self._file.truncate(HEADER_SIZE + self._count * RECORD_SIZE)
+        self._last_micros = None
+        self._stale = True
+        if self._count:
+            self._last_micros = _TimestampIndex(self._buffer(), self._count)[self._count - 1]
+
+    def _buffer(self):
+        """Retorna o mapeamento atual do arquivo, refazendo-o após acréscimos."""
+        if self._stale:
+            # Mapeamentos antigos continuam válidos para as visões que os referenciam
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._stale = False
+        return self._map
+
+    def append(self, transaction: Transaction) -> None:
+        """Acrescenta uma transação; timestamps devem ser não decrescentes."""
+        micros = to_micros(transaction.timestamp)
+        if self._last_micros is not None and micros < self._last_micros:
+            raise ValueError("Transações devem ser acrescentadas em ordem cronológica.")
+        location = transaction.location.encode("utf-8")
+        if len(location) > LOCATION_SIZE:
+            raise ValueError(f"Localização com mais de {LOCATION_SIZE} bytes: {transaction.location!r}")
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(RECORD.pack(micros, transaction.amount, location))
+        self._file.flush()
+        self._count += 1
+        self._last_micros = micros
+        self._stale = True
+
+    def window(self, since: datetime) -> "TransactionHistoryView":
+        """Retorna uma visão, sem cópia, dos registros a partir de `since`."""
+        buffer = self._buffer()
+        start = bisect_left(_TimestampIndex(buffer, self._count), to_micros(since))
+        return TransactionHistoryView(buffer, start, self._count)
+
+    def compact(self, now: datetime, retention: timedelta = RETENTION) -> int:
+        """
+        Reescreve o arquivo sem os registros anteriores a `now - retention`.
+
+        Retorna quantos registros foram descartados. A troca é feita com
+        `os.replace`, então leitores nunca veem um arquivo parcial.
+        """
+        view = self.window(now - retention)
+        dropped = view.start
+        if not dropped:
+            return 0
+        temporary = self.path + ".compact"
+        with open(temporary, "wb") as compacted:
+            compacted.write(MAGIC)
+            if len(view):
+                begin = HEADER_SIZE + view.start * RECORD_SIZE
+                compacted.write(view.buffer[begin:HEADER_SIZE + view.stop * RECORD_SIZE])
+            compacted.flush()
+            os.fsync(compacted.fileno())
+        self._file.close()
+        os.replace(temporary, self.path)
+        self._file = open(self.path, "r+b")
+        self._open()
+        return dropped
+
+    def close(self) -> None:
+        self._file.close()
+        self._map = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return f"TransactionHistoryFile(path='{self.path}', records={self._count})"
+
+
+class TransactionHistoryView:
+    """Intervalo de registros de um `TransactionHistoryFile` mapeado em memória."""
+    __slots__ = ("buffer", "start", "stop")
+
+    def __init__(self, buffer, start: int, stop: int):
+        self.buffer = buffer
+        self.start = start
+        self.stop = stop
+
+    def count_since(self, cutoff: datetime) -> int:
+        """Conta os registros da visão com timestamp maior ou igual a `cutoff`."""
+        index = _TimestampIndex(self.buffer, self.stop)
+        return self.stop - bisect_left(index, to_micros(cutoff), self.start, self.stop)
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index: int) -> Transaction:
+        size = self.stop - self.start
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("índice fora da visão")
+        return _read_transaction(self.buffer, self.start + index)
+
+    def __iter__(self):
+        for index in range(self.start, self.stop):
+            yield _read_transaction(self.buffer, index)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return f"TransactionHistoryView(start={self.start}, stop={self.stop})"
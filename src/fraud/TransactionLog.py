@@ -0,0 +1,148 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+
+from src.fraud.LocationCodes import LocationCodes
+from src.fraud.Transaction import Transaction
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def to_micros(timestamp: datetime) -> int:
+    """Converte um `datetime` sem fuso horário em microssegundos desde a época."""
+    if timestamp.tzinfo is not None:
+        raise ValueError("TransactionLog só aceita timestamps sem fuso horário.")
+    return (timestamp - EPOCH) // MICROSECOND
+
+
+def from_micros(micros: int) -> datetime:
+    """Converte microssegundos desde a época em `datetime`."""
+    return EPOCH + timedelta(microseconds=micros)
+
+
+class TransactionLog:
+    """
+    Histórico compacto de uma conta, armazenado em colunas.
+
+    Valores ficam em float64, timestamps em int64 (microssegundos epoch) e
+    localizações em códigos inteiros de uma tabela `LocationCodes`, cerca de
+    20 bytes por transação. Sem `codes`, todos os logs compartilham
+    `TransactionLog.default_codes`. Assim como `AccountHistory`, é mantido em
+    ordem cronológica e pode ser passado diretamente a `check_for_fraud`; as
+    transações só são materializadas quando acessadas por índice.
+    """
+    default_codes = LocationCodes()
+
+    def __init__(self, transactions: list[Transaction] | None = None, codes: LocationCodes | None = None):
+        self.codes = codes if codes is not None else self.default_codes
+        self.amounts = array("d")
+        self.timestamps = array("q")
+        self.locations = array("i")
+        for transaction in transactions or ():
+            self.add(transaction)
+
+    def location_code(self, location: str) -> int:
+        """Retorna o código inteiro da localização, criando-o se necessário."""
+        return self.codes.code(location)
+
+    def location_name(self, code: int) -> str:
+        """Retorna a localização de um código."""
+        return self.codes.name(code)
+
+    def add(self, transaction: Transaction) -> None:
+        """Insere a transação mantendo a ordem cronológica (O(1) se já estiver em ordem)."""
+        micros = to_micros(transaction.timestamp)
+        code = self.location_code(transaction.location)
+        if not self.timestamps or micros >= self.timestamps[-1]:
+            self.amounts.append(transaction.amount)
+            self.timestamps.append(micros)
+            self.locations.append(code)
+            return
+        index = bisect_right(self.timestamps, micros)
+        self.amounts.insert(index, transaction.amount)
+        self.timestamps.insert(index, micros)
+        self.locations.insert(index, code)
+
+    def count_since(self, cutoff: datetime) -> int:
+        """Conta as transações com timestamp maior ou igual a `cutoff`."""
+        return len(self.timestamps) - bisect_left(self.timestamps, to_micros(cutoff))
+
+    def discard_before(self, cutoff: datetime) -> int:
+        """Remove as transações anteriores a `cutoff` e retorna quantas foram removidas."""
+        index = bisect_left(self.timestamps, to_micros(cutoff))
+        if index:
+            del self.amounts[:index]
+            del self.timestamps[:index]
+            del self.locations[:index]
+        return index
+
+    def window(self, since: datetime) -> "TransactionLogView":
+        """Retorna uma visão, sem cópia, das transações a partir de `since`."""
+        return TransactionLogView(self, bisect_left(self.timestamps, to_micros(since)), len(self))
+
+    def transaction_at(self, index: int) -> Transaction:
+        """Materializa a transação na posição `index`."""
+        return Transaction(
+            self.amounts[index],
+            from_micros(self.timestamps[index]),
+            self.codes.name(self.locations[index]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("Visões de TransactionLog não aceitam passo.")
+            return TransactionLogView(self, start, max(start, stop))
+        return self.transaction_at(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.transaction_at(index)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return f"TransactionLog(transactions={len(self)})"
+
+
+class TransactionLogView:
+    """
+    Visão de um intervalo contíguo de um `TransactionLog`, sem cópia dos dados.
+
+    Continua válida enquanto o log não tiver transações removidas ou inseridas
+    antes do fim do intervalo.
+    """
+    __slots__ = ("log", "start", "stop")
+
+    def __init__(self, log: TransactionLog, start: int, stop: int):
+        self.log = log
+        self.start = start
+        self.stop = stop
+
+    def count_since(self, cutoff: datetime) -> int:
+        """Conta as transações da visão com timestamp maior ou igual a `cutoff`."""
+        first = bisect_left(self.log.timestamps, to_micros(cutoff), self.start, self.stop)
+        return self.stop - first
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index: int) -> Transaction:
+        size = self.stop - self.start
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("índice fora da visão")
+        return self.log.transaction_at(self.start + index)
+
+    def __iter__(self):
+        for index in range(self.start, self.stop):
+            yield self.log.transaction_at(index)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação legível do objeto."""
+        return f"TransactionLogView(start={self.start}, stop={self.stop})"
@@ -0,0 +1,215 @@
+"""
+Pontuação de fraude em fluxo sobre arquivos JSONL ou CSV.
+
+Uso:
+    python -m src.fraud.stream transacoes.jsonl -o resultados.jsonl --blacklist bloqueio.txt
+
+Cada registro de entrada tem os campos `account`, `amount`, `timestamp`
+(ISO 8601 ou segundos epoch) e `location`. A leitura, a pontuação e a escrita
+são geradores encadeados, então a memória não depende do tamanho do arquivo.
+Registros malformados são ignorados e relatados na saída de erro, ou
+interrompem a execução com `--strict`.
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from typing import TextIO
+
+from src.fraud.Blacklist import Blacklist
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.RollingFraudScorer import RollingFraudScorer
+from src.fraud.Transaction import Transaction
+
+EPOCH = datetime(1970, 1, 1)
+RESULT_FIELDS = ["account", "timestamp", "is_fraudulent", "is_blocked", "verification_required", "risk_score"]
+
+
+def parse_timestamp(value) -> datetime:
+    """
+    Converte segundos epoch (número ou texto numérico) ou ISO 8601 em `datetime`.
+
+    Horários com fuso são convertidos para UTC sem fuso, como os demais.
+    """
+    if isinstance(value, (int, float)):
+        return EPOCH + timedelta(seconds=value)
+    try:
+        return EPOCH + timedelta(seconds=float(value))
+    except ValueError:
+        moment = datetime.fromisoformat(value)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def report_skipped(errors: TextIO | None, where: str, error: Exception) -> None:
+    """Relata um registro ignorado no fluxo de erros, se houver um."""
+    if errors is not None:
+        errors.write(f"{where} ignorado: {error}\n")
+
+
+def read_records(
+    lines: Iterable[str],
+    fmt: str,
+    strict: bool = True,
+    errors: TextIO | None = None,
+) -> Iterator[dict]:
+    """
+    Lê registros de um fluxo de linhas JSONL ou CSV (com cabeçalho).
+
+    Sem `strict`, linhas JSON inválidas são ignoradas e relatadas em `errors`.
+    """
+    if fmt == "csv":
+        yield from csv.DictReader(lines)
+    elif fmt == "jsonl":
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as error:
+                if strict:
+                    raise
+                report_skipped(errors, f"linha {number}", error)
+                continue
+            yield record
+    else:
+        raise ValueError(f"Formato desconhecido: {fmt}")
+
+
+def parse_transactions(
+    records: Iterable[dict],
+    strict: bool = True,
+    errors: TextIO | None = None,
+) -> Iterator[tuple[str, Transaction]]:
+    """
+    Converte registros em pares (conta, transação).
+
+    Sem `strict`, registros com campos ausentes ou inválidos são ignorados e
+    relatados em `errors`.
+    """
+    for number, record in enumerate(records, 1):
+        try:
+            transaction = Transaction(
+                amount=float(record["amount"]),
+                timestamp=parse_timestamp(record["timestamp"]),
+                location=record["location"],
+            )
+            account = str(record["account"])
+        except (ValueError, KeyError, TypeError, OverflowError) as error:
+            if strict:
+                raise
+            report_skipped(errors, f"registro {number}", error)
+            continue
+        yield account, transaction
+
+
+def score_transactions(
+    transactions: Iterable[tuple[str, Transaction]],
+    scorer: RollingFraudScorer,
+) -> Iterator[tuple[str, Transaction, FraudCheckResult]]:
+    """Pontua cada transação com o estado por conta mantido pelo `scorer`."""
+    for account, transaction in transactions:
+        yield account, transaction, scorer.score(account, transaction)
+
+
+def write_results(
+    rows: Iterable[tuple[str, Transaction, FraudCheckResult]],
+    output: TextIO,
+    fmt: str,
+) -> Iterator[int]:
+    """Escreve cada resultado assim que é produzido e devolve a contagem acumulada."""
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(output, fieldnames=RESULT_FIELDS)
+        writer.writeheader()
+    count = 0
+    for account, transaction, result in rows:
+        row = {
+            "account": account,
+            "timestamp": transaction.timestamp.isoformat(),
+            "is_fraudulent": result.is_fraudulent,
+            "is_blocked": result.is_blocked,
+            "verification_required": result.verification_required,
+            "risk_score": result.risk_score,
+        }
+        if writer is not None:
+            writer.writerow(row)
+        else:
+            output.write(json.dumps(row) + "\n")
+        count += 1
+        yield count
+
+
+def run(
+    lines: Iterable[str],
+    output: TextIO,
+    fmt: str,
+    scorer: RollingFraudScorer,
+    progress: TextIO | None = None,
+    progress_every: int = 100000,
+    strict: bool = True,
+) -> int:
+    """
+    Executa o pipeline completo e retorna o número de linhas processadas.
+
+    Sem `strict`, registros malformados são ignorados e relatados em `progress`.
+    """
+    records = read_records(lines, fmt, strict, progress)
+    rows = score_transactions(parse_transactions(records, strict, progress), scorer)
+    start = time.perf_counter()
+    count = 0
+    for count in write_results(rows, output, fmt):
+        if progress is not None and count % progress_every == 0:
+            report_rate(progress, count, time.perf_counter() - start)
+    if progress is not None:
+        report_rate(progress, count, time.perf_counter() - start)
+    return count
+
+
+def report_rate(progress: TextIO, count: int, elapsed: float) -> None:
+    """Escreve a vazão (linhas/segundo) no fluxo de progresso."""
+    rate = count / elapsed if elapsed > 0 else 0.0
+    progress.write(f"{count} linhas em {elapsed:.2f}s ({rate:.0f} linhas/s)\n")
+
+
+def guess_format(path: str) -> str:
+    return "csv" if path.lower().endswith(".csv") else "jsonl"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Score a JSONL/CSV transaction feed for fraud.")
+    parser.add_argument("input", nargs="?", default="-", help="Input feed path ('-' for stdin).")
+    parser.add_argument("-o", "--output", default="-", help="Output path ('-' for stdout).")
+    parser.add_argument("-f", "--format", choices=["jsonl", "csv"], help="Feed format (default: from the input extension).")
+    parser.add_argument("--blacklist", help="File with one blacklisted location per line.")
+    parser.add_argument("--max-accounts", type=int, help="Hard cap on accounts kept in memory (idle accounts are always dropped).")
+    parser.add_argument("--progress-every", type=int, default=100000, help="Report throughput every N rows.")
+    parser.add_argument("--strict", action="store_true", help="Stop at the first malformed record instead of skipping it.")
+    args = parser.parse_args(argv)
+
+    fmt = args.format or guess_format(args.input)
+    blacklist = Blacklist()
+    if args.blacklist:
+        with open(args.blacklist, encoding="utf-8") as blacklist_file:
+            blacklist = Blacklist(line.strip() for line in blacklist_file if line.strip())
+    scorer = RollingFraudScorer(blacklisted_locations=blacklist, max_accounts=args.max_accounts)
+
+    source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        run(source, target, fmt, scorer, progress=sys.stderr, progress_every=args.progress_every,
+            strict=args.strict)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
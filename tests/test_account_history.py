@@ -0,0 +1,82 @@
+import random
+from datetime import datetime, timedelta
+from src.fraud.Transaction import Transaction
+from src.fraud.AccountHistory import AccountHistory
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+
+
+class TestAccountHistory:
+
+    def setup_method(self):
+        self.fraud_system = FraudDetectionSystem()
+        self.base_time = datetime(2025, 10, 16, 13, 0, 0)
+
+    def test_keeps_transactions_sorted(self):
+        history = AccountHistory()
+        history.add(Transaction(10.0, self.base_time + timedelta(minutes=20), 'B'))
+        history.add(Transaction(10.0, self.base_time, 'A'))
+        history.add(Transaction(10.0, self.base_time + timedelta(minutes=10), 'C'))
+
+        assert [t.location for t in history] == ['A', 'C', 'B']
+        assert history[-1].location == 'B'
+        assert len(history) == 3
+
+    def test_ties_keep_insertion_order(self):
+        history = AccountHistory()
+        history.add(Transaction(10.0, self.base_time + timedelta(minutes=5), 'A'))
+        history.add(Transaction(10.0, self.base_time, 'B'))
+        history.add(Transaction(10.0, self.base_time, 'C'))
+
+        assert [t.location for t in history] == ['B', 'C', 'A']
+
+    def test_count_since_includes_cutoff(self):
+        history = AccountHistory([
+            Transaction(10.0, self.base_time + timedelta(minutes=i), 'Brasil')
+            for i in range(5)
+        ])
+
+        assert history.count_since(self.base_time + timedelta(minutes=2)) == 3
+        assert history.count_since(self.base_time + timedelta(minutes=10)) == 0
+
+    def test_discard_before(self):
+        history = AccountHistory([
+            Transaction(10.0, self.base_time + timedelta(minutes=i), 'Brasil')
+            for i in range(5)
+        ])
+
+        assert history.discard_before(self.base_time + timedelta(minutes=3)) == 3
+        assert len(history) == 2
+        assert history[0].timestamp == self.base_time + timedelta(minutes=3)
+
+    def test_exactly_60_minutes_is_counted(self):
+        current = Transaction(100.0, self.base_time + timedelta(minutes=60), 'Brasil')
+        previous = [
+            Transaction(50.0, self.base_time + timedelta(minutes=i), 'Brasil')
+            for i in range(11)
+        ]
+
+        result = self.fraud_system.check_for_fraud(current, AccountHistory(previous), [])
+
+        assert result.is_blocked == True
+        assert result.risk_score == 30
+
+    def test_matches_list_path(self):
+        rng = random.Random(646)
+        locations = ['Brasil', 'EUA', 'Chile']
+        for _ in range(200):
+            previous = []
+            moment = self.base_time
+            for _ in range(rng.randint(0, 30)):
+                moment += timedelta(seconds=rng.randint(0, 600))
+                previous.append(Transaction(rng.choice([50.0, 20000.0]), moment, rng.choice(locations)))
+            current = Transaction(
+                rng.choice([100.0, 10000.0, 15000.0]),
+                moment + timedelta(seconds=rng.randint(-300, 4000)),
+                rng.choice(locations),
+            )
+            blacklist = rng.choice([[], ['EUA']])
+
+            expected = self.fraud_system.check_for_fraud(current, previous, blacklist)
+            result = self.fraud_system.check_for_fraud(current, AccountHistory(previous), blacklist)
+
+            assert repr(result) == repr(expected)
@@ -0,0 +1,55 @@
+import pytest
+from datetime import datetime
+from src.fraud.Blacklist import Blacklist
+from src.fraud.Transaction import Transaction
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+
+
+class TestBlacklist:
+
+    def test_exact_locations(self):
+        blacklist = Blacklist(['Las Vegas', 'Miami'])
+
+        assert 'Miami' in blacklist
+        assert 'Miami Beach' not in blacklist
+        assert len(blacklist) == 2
+
+    def test_integer_codes(self):
+        blacklist = Blacklist([101, 202])
+
+        assert 202 in blacklist
+        assert 303 not in blacklist
+
+    def test_prefix_matching(self):
+        blacklist = Blacklist(['Miami'], prefixes=['BR-', 'US-NV'])
+
+        assert 'BR-SP' in blacklist
+        assert 'US-NV-LV' in blacklist
+        assert 'US-NY' not in blacklist
+        assert 'BR' not in blacklist
+        assert 7 not in blacklist
+
+    def test_empty_prefix_is_rejected(self):
+        with pytest.raises(ValueError):
+            Blacklist(prefixes=[''])
+
+    def test_replace_swaps_contents(self):
+        blacklist = Blacklist(['Miami'])
+
+        blacklist.replace(['Chile'], prefixes=['AR-'])
+
+        assert 'Miami' not in blacklist
+        assert 'Chile' in blacklist
+        assert 'AR-BA' in blacklist
+
+    def test_accepted_by_fraud_detection(self):
+        fraud_system = FraudDetectionSystem()
+        blacklist = Blacklist(['Brasil'])
+        current = Transaction(100.00, datetime(2025, 10, 16, 14, 0, 0), 'Brasil')
+
+        result = fraud_system.check_for_fraud(current, [], blacklist)
+        batch = fraud_system.check_for_fraud_batch([100.00, 100.00], [0, 7200], ['Brasil', 'EUA'], [1, 1], blacklist)
+
+        assert result.is_blocked == True
+        assert result.risk_score == 100
+        assert batch.risk_score == [100, 0]
@@ -0,0 +1,76 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.flight.FlightBookingSystem import FlightBookingSystem
+
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def random_columns(seed, size):
+    rng = random.Random(seed)
+    columns = {
+        "passengers": [], "booking_times": [], "available_seats": [], "current_prices": [],
+        "previous_sales": [], "is_cancellations": [], "departure_times": [], "reward_points_available": [],
+    }
+    for _ in range(size):
+        booking = rng.randint(1_700_000_000, 1_800_000_000)
+        columns["passengers"].append(rng.randint(1, 8))
+        columns["booking_times"].append(booking)
+        columns["available_seats"].append(rng.randint(0, 10))
+        columns["current_prices"].append(rng.choice([0.0, 99.9, 200.0, 1234.56]))
+        columns["previous_sales"].append(rng.randint(0, 300))
+        columns["is_cancellations"].append(rng.random() < 0.3)
+        columns["departure_times"].append(booking + rng.choice([0, 3600, 86399, 86400, 172799, 172800, 900000]))
+        columns["reward_points_available"].append(rng.choice([0, 500, 100000]))
+    return columns
+
+
+class TestQuoteBatch:
+
+    def test_matches_scalar_path(self):
+        system = FlightBookingSystem()
+        columns = random_columns(646, 5000)
+
+        result = system.quote_batch(**columns)
+
+        for row in range(5000):
+            expected = system.book_flight(
+                passengers=columns["passengers"][row],
+                booking_time=EPOCH + timedelta(seconds=columns["booking_times"][row]),
+                available_seats=columns["available_seats"][row],
+                current_price=columns["current_prices"][row],
+                previous_sales=columns["previous_sales"][row],
+                is_cancellation=columns["is_cancellations"][row],
+                departure_time=EPOCH + timedelta(seconds=columns["departure_times"][row]),
+                reward_points_available=columns["reward_points_available"][row],
+            )
+            quoted = result[row]
+            assert quoted.confirmation == expected.confirmation
+            assert quoted.total_price == expected.total_price
+            assert type(quoted.total_price) is type(expected.total_price)
+            assert quoted.refund_amount == expected.refund_amount
+            assert quoted.points_used == expected.points_used
+
+    def test_columns_must_have_same_size(self):
+        columns = random_columns(1, 3)
+        columns["current_prices"].pop()
+
+        with pytest.raises(ValueError):
+            FlightBookingSystem().quote_batch(**columns)
+
+    def test_columnar_output(self):
+        result = FlightBookingSystem().quote_batch(
+            passengers=[2, 5],
+            booking_times=[0, 0],
+            available_seats=[10, 3],
+            current_prices=[200.0, 200.0],
+            previous_sales=[100, 100],
+            is_cancellations=[False, False],
+            departure_times=[5 * 86400, 5 * 86400],
+            reward_points_available=[0, 0],
+        )
+
+        assert len(result) == 2
+        assert result.confirmation == [True, False]
+        assert result.total_price == [320.0, 0.0]
@@ -0,0 +1,116 @@
+import json
+import pytest
+from datetime import datetime
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.BookingLedger import BookingLedger
+from src.flight.LedgerState import LedgerState
+
+
+def book(system, passengers, is_cancellation=False):
+  return system.book_flight(
+    passengers=passengers,
+    booking_time=datetime(2024, 1, 15, 10, 0),
+    available_seats=10,
+    current_price=200.0,
+    previous_sales=100,
+    is_cancellation=is_cancellation,
+    departure_time=datetime(2024, 1, 20, 10, 0),
+    reward_points_available=0,
+  )
+
+
+class TestBookingLedger:
+
+  def setup_method(self):
+    self.system = FlightBookingSystem()
+
+  def test_replay_rebuilds_sales_and_seats(self, tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    with BookingLedger(path, fsync_every=2) as ledger:
+      ledger.open_flight("AD4020", 10)
+      ledger.record("AD4020", 2, False, book(self.system, 2))
+      ledger.record("AD4020", 20, False, book(self.system, 20))
+      ledger.record("AD4020", 3, False, book(self.system, 3))
+      ledger.record("AD4020", 1, True, book(self.system, 1, is_cancellation=True))
+
+    state = BookingLedger.replay(path)
+
+    assert state.sales["AD4020"] == 4
+    assert state.available_seats("AD4020") == 6
+    assert state.revenue["AD4020"] == 320.0 + 480.0
+    assert state.refunds["AD4020"] == 160.0
+    assert state.events == 5
+
+  def test_snapshot_then_tail(self, tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    snapshot = tmp_path / "ledger.snapshot"
+    with BookingLedger(path) as ledger:
+      ledger.open_flight("AD4020", 10)
+      ledger.record("AD4020", 2, False, book(self.system, 2))
+    BookingLedger.write_snapshot(path, snapshot)
+    with BookingLedger(path) as ledger:
+      ledger.record("AD4020", 5, False, book(self.system, 5))
+
+    state = BookingLedger.replay(path, snapshot)
+
+    assert json.loads(snapshot.read_text())["state"]["sales"] == [["AD4020", 2]]
+    assert state.sales["AD4020"] == 7
+    assert state.events == 3
+    assert repr(state) == repr(BookingLedger.replay(path))
+
+  def test_replay_ignores_incomplete_last_line(self, tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    with BookingLedger(path) as ledger:
+      ledger.open_flight("AD4020", 10)
+    with open(path, "ab") as ledger_file:
+      ledger_file.write(b'{"type":"booking","flight')
+
+    assert BookingLedger.replay(path).events == 1
+
+  def test_missing_ledger_and_unknown_events(self, tmp_path):
+    assert BookingLedger.replay(tmp_path / "missing.jsonl").events == 0
+    with pytest.raises(ValueError):
+      LedgerState().apply({"type": "upgrade", "flight_id": "AD4020"})
+    with pytest.raises(ValueError):
+      BookingLedger(tmp_path / "ledger.jsonl", fsync_every=0)
+
+  def test_snapshot_keeps_integer_flight_ids(self, tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    snapshot = tmp_path / "ledger.snapshot"
+    with BookingLedger(path) as ledger:
+      ledger.open_flight(7, 10)
+      ledger.record(7, 2, False, book(self.system, 2))
+    BookingLedger.write_snapshot(path, snapshot)
+    with BookingLedger(path) as ledger:
+      ledger.record(7, 3, False, book(self.system, 3))
+
+    state = BookingLedger.replay(path, snapshot)
+
+    assert state.sales == {7: 5}
+    assert state.available_seats(7) == 5
+    assert LedgerState.from_dict(json.loads(json.dumps(state.to_dict()))).to_dict() == state.to_dict()
+
+  def test_reopening_discards_a_torn_last_line(self, tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    with BookingLedger(path) as ledger:
+      ledger.open_flight("AD4020", 10)
+      ledger.record("AD4020", 2, False, book(self.system, 2))
+    with open(path, "ab") as ledger_file:
+      ledger_file.write(b'{"type":"booking","fli')
+
+    with BookingLedger(path) as ledger:
+      ledger.record("AD4020", 3, False, book(self.system, 3))
+
+    state = BookingLedger.replay(path)
+    assert state.sales["AD4020"] == 5
+    assert state.events == 3
+    assert BookingLedger.write_snapshot(path, tmp_path / "ledger.snapshot").events == 3
+
+  def test_reopening_a_ledger_with_only_a_torn_line(self, tmp_path):
+    path = tmp_path / "ledger.jsonl"
+    path.write_bytes(b'{"type":"fli')
+
+    with BookingLedger(path) as ledger:
+      ledger.open_flight("AD4020", 10)
+
+    assert BookingLedger.replay(path).capacity == {"AD4020": 10}
@@ -0,0 +1,86 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from src.flight.SeatInventory import SeatInventory
+from src.flight.BookingService import BookingService
+
+
+BOOKING_TIME = datetime(2024, 1, 15, 10, 0)
+
+
+def booking(service, flight_id, passengers=1, is_cancellation=False):
+  return service.request(
+    flight_id=flight_id,
+    passengers=passengers,
+    booking_time=BOOKING_TIME,
+    current_price=200.0,
+    previous_sales=100,
+    is_cancellation=is_cancellation,
+    departure_time=BOOKING_TIME + timedelta(days=5),
+    reward_points_available=0,
+  )
+
+
+class TestBookingService:
+
+  def setup_method(self):
+    self.inventory = SeatInventory()
+    self.inventory.add_flight("AD4020", 10)
+    self.inventory.add_flight("LA3000", 10)
+
+  def test_concurrent_requests_never_oversell(self):
+    service = BookingService(self.inventory, max_concurrency=50)
+
+    async def scenario():
+      return await asyncio.gather(*(booking(service, flight) for flight in ["AD4020", "LA3000"] * 30))
+
+    results = asyncio.run(scenario())
+
+    assert sum(result.confirmation for result in results) == 20
+    assert self.inventory.available("AD4020") == 0
+    assert self.inventory.available("LA3000") == 0
+    assert service.metrics() == {"completed": 60, "rejected": 0, "timed_out": 0, "active_flights": 0, "queued": 0}
+
+  def test_requests_for_a_flight_run_in_order(self):
+    service = BookingService(self.inventory)
+
+    async def scenario():
+      return await asyncio.gather(
+        booking(service, "AD4020", passengers=8),
+        booking(service, "AD4020", passengers=3, is_cancellation=True),
+        booking(service, "AD4020", passengers=5),
+      )
+
+    booked, cancelled, rebooked = asyncio.run(scenario())
+
+    assert booked.confirmation == True
+    assert cancelled.refund_amount == 480.0
+    assert rebooked.confirmation == True
+    assert self.inventory.available("AD4020") == 0
+
+  def test_full_queue_applies_backpressure(self):
+    service = BookingService(self.inventory, max_queue_per_flight=2)
+
+    async def scenario():
+      return await asyncio.gather(*(booking(service, "AD4020") for _ in range(5)), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+
+    assert sum(isinstance(result, asyncio.QueueFull) for result in results) == 3
+    assert service.metrics()["rejected"] == 3
+
+  def test_timed_out_requests_do_not_book(self):
+    service = BookingService(self.inventory, timeout=0)
+
+    async def scenario():
+      return await asyncio.gather(booking(service, "AD4020"), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+
+    assert isinstance(results[0], asyncio.TimeoutError)
+    assert self.inventory.available("AD4020") == 10
+    assert service.metrics()["timed_out"] == 1
+
+  def test_invalid_limits(self):
+    with pytest.raises(ValueError):
+      BookingService(self.inventory, max_concurrency=0)
@@ -0,0 +1,108 @@
+import random
+import pytest
+from datetime import date, datetime, timedelta
+from src.energy.DayAheadPlanner import DayAheadPlanner
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+
+
+DAY = date(2025, 11, 2)
+MIDNIGHT = datetime(2025, 11, 2)
+PRIORITIES = {"Security": 1, "Refrigerator": 1, "Heating": 2, "Washer": 2, "Lights": 3, "Computer": 2, "Pump": 3}
+ENERGY = {"Security": 0.01, "Refrigerator": 0.02, "Heating": 0.05, "Cooling": 0.05,
+          "Washer": 0.04, "Lights": 0.01, "Computer": 0.02, "Oven": 0.08}
+
+
+def make_planner(limit=20.0):
+    return DayAheadPlanner(PRIORITIES, ENERGY, price_threshold=0.3,
+                           desired_temperature_range=(20, 24), energy_usage_limit=limit)
+
+
+def random_forecast(seed, price_points=96, temperature_points=24):
+    rng = random.Random(seed)
+    prices = [rng.choice([0.1, 0.25, 0.35, 0.5]) for _ in range(price_points)]
+    temperatures = [rng.choice([17.0, 21.0, 23.5, 27.0]) for _ in range(temperature_points)]
+    schedules = [DeviceSchedule(rng.choice(["Washer", "Oven", "Lights"]),
+                                MIDNIGHT + timedelta(minutes=rng.randrange(1440))) for _ in range(5)]
+    return prices, temperatures, schedules
+
+
+def assert_matches_manage_energy(plan, planner, prices, temperatures, schedules):
+    energy_system = SmartEnergyManagementSystem()
+    price_step = 1440 // len(prices)
+    temperature_step = 1440 // len(temperatures)
+    expected_cost = 0.0
+    for minute in range(1440):
+        expected = energy_system.manage_energy(
+            current_price=prices[minute // price_step], price_threshold=planner.price_threshold,
+            device_priorities=planner.device_priorities, current_time=MIDNIGHT + timedelta(minutes=minute),
+            current_temperature=temperatures[minute // temperature_step],
+            desired_temperature_range=planner.desired_temperature_range,
+            energy_usage_limit=planner.energy_usage_limit,
+            total_energy_used_today=plan.energy_used_before(minute), scheduled_devices=schedules,
+        )
+        assert plan.status_at(minute) == expected.device_status, minute
+        power = sum(ENERGY.get(device, 0.0) for device, on in expected.device_status.items() if on)
+        expected_cost += power * prices[minute // price_step]
+        if minute:
+            assert plan.energy_used_before(minute) - plan.energy_used_before(minute - 1) == pytest.approx(
+                sum(ENERGY.get(device, 0.0) for device, on in plan.status_at(minute - 1).items() if on))
+    assert plan.total_cost == pytest.approx(expected_cost)
+
+
+class TestDayAheadPlanner:
+
+    @pytest.mark.parametrize("seed, limit", [(1, 20.0), (2, 8.0), (3, 3.5), (4, 1000.0)])
+    def test_every_minute_matches_manage_energy(self, seed, limit):
+        planner = make_planner(limit)
+        prices, temperatures, schedules = random_forecast(seed)
+
+        plan = planner.plan(DAY, prices, temperatures, schedules)
+
+        assert_matches_manage_energy(plan, planner, prices, temperatures, schedules)
+        assert len(plan.segments) < 1440
+
+    def test_per_minute_curves_and_initial_usage(self):
+        planner = make_planner(limit=6.0)
+        prices, temperatures, schedules = random_forecast(5, price_points=1440, temperature_points=1440)
+
+        plan = planner.plan(DAY, prices, temperatures, schedules, initial_usage=4.0)
+
+        assert plan.energy_used_before(0) == 4.0
+        assert_matches_manage_energy(plan, planner, prices, temperatures, schedules)
+
+    def test_usage_limit_turns_devices_off_during_the_day(self):
+        planner = make_planner(limit=12.0)
+        plan = planner.plan(DAY, [0.1] * 24, [22.0] * 24)
+
+        timelines = plan.timelines()
+
+        assert timelines["Security"] == [(0, 1440)]
+        assert timelines["Washer"][0][0] == 360
+        assert timelines["Washer"][-1][1] < 1440
+        assert plan.final_usage == pytest.approx(plan.energy_used_before(1439) + sum(
+            ENERGY.get(device, 0.0) for device, on in plan.status_at(1439).items() if on))
+
+    def test_plan_many_matches_individual_plans(self):
+        planner = make_planner(limit=12.0)
+        forecasts = [random_forecast(seed) for seed in range(6)]
+        prices = forecasts[0][0]
+
+        plans = planner.plan_many(DAY, prices, [forecast[1] for forecast in forecasts],
+                                  [forecast[2] for forecast in forecasts], [0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+
+        for home, plan in enumerate(plans):
+            single = make_planner(limit=12.0).plan(DAY, prices, forecasts[home][1], forecasts[home][2], float(home))
+            assert plan.segments == single.segments
+            assert plan.total_cost == single.total_cost
+
+    def test_curves_must_divide_the_day(self):
+        with pytest.raises(ValueError):
+            make_planner().plan(DAY, [0.1] * 7, [22.0] * 24)
+        with pytest.raises(ValueError):
+            make_planner().plan_many(DAY, [0.1] * 24, [[22.0] * 24], initial_usage=[0.0, 1.0])
+
+    def test_status_at_rejects_minutes_outside_the_day(self):
+        plan = make_planner().plan(DAY, [0.1] * 24, [22.0] * 24)
+        with pytest.raises(ValueError):
+            plan.status_at(1440)
@@ -0,0 +1,148 @@
+import json
+import pytest
+from datetime import datetime, timedelta
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.DemandTracker import DemandTracker, EPOCH
+from src.flight.LedgerState import LedgerState
+
+
+class TestDemandTracker:
+
+  def setup_method(self):
+    self.start = datetime(2024, 1, 15, 10, 0)
+
+  def test_running_counters(self):
+    tracker = DemandTracker()
+    tracker.record_booking("AD4020", 3)
+    tracker.record_booking("AD4020", 2)
+    tracker.record_cancellation("AD4020", 1)
+
+    assert tracker.previous_sales("AD4020") == 4
+    assert tracker.previous_sales("LA3000") == 0
+
+  def test_time_window(self):
+    tracker = DemandTracker(window=timedelta(hours=3))
+    tracker.record_booking("AD4020", 5, self.start)
+    tracker.record_booking("AD4020", 2, self.start + timedelta(hours=2))
+
+    assert tracker.previous_sales("AD4020", self.start + timedelta(hours=2, minutes=30)) == 7
+    assert tracker.previous_sales("AD4020", self.start + timedelta(hours=3)) == 2
+    assert tracker.previous_sales("AD4020", self.start + timedelta(hours=6)) == 0
+
+  def test_window_requires_event_time(self):
+    with pytest.raises(ValueError):
+      DemandTracker(window=timedelta(hours=1)).record_booking("AD4020", 1)
+    with pytest.raises(ValueError):
+      DemandTracker(window=timedelta(minutes=10))
+    with pytest.raises(ValueError):
+      DemandTracker(bucket=timedelta(0))
+
+  def test_snapshot_and_restore(self):
+    tracker = DemandTracker(window=timedelta(hours=3))
+    tracker.record_booking("AD4020", 5, self.start)
+    tracker.record_booking("AD4020", 2, self.start + timedelta(hours=2))
+
+    tracker.record_booking(101, 4, self.start + timedelta(hours=1))
+
+    restored = DemandTracker.restore(json.loads(json.dumps(tracker.snapshot())))
+
+    assert restored.previous_sales("AD4020", self.start + timedelta(hours=3)) == 2
+    assert restored.previous_sales(101, self.start + timedelta(hours=3)) == 4
+    assert restored.window == timedelta(hours=3)
+    restored.record_booking(101, 1, self.start + timedelta(hours=3))
+    assert restored.snapshot()["totals"] == [["AD4020", 2], [101, 5]]
+
+  def test_from_ledger(self):
+    state = LedgerState()
+    state.apply({"type": "flight", "flight_id": "AD4020", "capacity": 10})
+    state.apply({"type": "booking", "flight_id": "AD4020", "passengers": 4, "total_price": 1.0})
+
+    assert DemandTracker.from_ledger(state).previous_sales("AD4020") == 4
+
+  def test_booking_system_consults_tracker(self):
+    tracker = DemandTracker()
+    tracker.record_booking("AD4020", 100)
+    system = FlightBookingSystem(demand_tracker=tracker)
+    booking = dict(
+      booking_time=self.start,
+      available_seats=10,
+      current_price=200.0,
+      departure_time=self.start + timedelta(days=5),
+      reward_points_available=0,
+    )
+
+    confirmed = system.book_tracked_flight("AD4020", passengers=2, is_cancellation=False, **booking)
+    cancelled = system.book_tracked_flight("AD4020", passengers=1, is_cancellation=True, **booking)
+
+    assert confirmed.total_price == 320.0
+    assert cancelled.refund_amount == pytest.approx(200 * (102 / 100.0) * 0.8)
+    assert tracker.previous_sales("AD4020") == 101
+    with pytest.raises(RuntimeError):
+      FlightBookingSystem().book_tracked_flight("AD4020", passengers=1, is_cancellation=False, **booking)
+
+  def test_cancellation_after_window_expiry_never_goes_negative(self):
+    tracker = DemandTracker(window=timedelta(hours=24))
+    tracker.record_booking("AD4020", 5, self.start)
+    tracker.record_cancellation("AD4020", 5, self.start + timedelta(hours=23))
+
+    assert tracker.previous_sales("AD4020", self.start + timedelta(hours=23)) == 0
+    assert tracker.previous_sales("AD4020", self.start + timedelta(hours=25)) == 0
+
+  def test_cancellation_comes_out_of_the_booking_bucket(self):
+    tracker = DemandTracker(window=timedelta(hours=24))
+    tracker.record_booking("AD4020", 5, self.start)
+    tracker.record_booking("AD4020", 3, self.start + timedelta(hours=10))
+    tracker.record_cancellation("AD4020", 2, self.start + timedelta(hours=12), booked_at=self.start)
+
+    assert tracker.previous_sales("AD4020", self.start + timedelta(hours=12)) == 6
+    assert tracker.previous_sales("AD4020", self.start + timedelta(hours=25)) == 3
+
+  def test_cancelling_an_expired_sale_changes_nothing(self):
+    tracker = DemandTracker(window=timedelta(hours=3))
+    tracker.record_booking("AD4020", 5, self.start)
+    tracker.record_booking("AD4020", 2, self.start + timedelta(hours=4))
+    tracker.record_cancellation("AD4020", 5, self.start + timedelta(hours=5), booked_at=self.start)
+
+    assert tracker.previous_sales("AD4020", self.start + timedelta(hours=5)) == 2
+
+  def test_running_counter_is_clamped_at_zero(self):
+    tracker = DemandTracker()
+    tracker.record_booking("AD4020", 1)
+    tracker.record_cancellation("AD4020", 3)
+
+    assert tracker.previous_sales("AD4020") == 0
+
+  def test_out_of_order_events_use_their_own_bucket(self):
+    tracker = DemandTracker(window=timedelta(hours=3))
+    tracker.record_booking("AD4020", 2, self.start + timedelta(hours=2))
+    tracker.record_booking("AD4020", 5, self.start)
+    tracker.record_booking("AD4020", 1, self.start - timedelta(hours=5))
+
+    assert tracker.previous_sales("AD4020", self.start + timedelta(hours=2)) == 7
+    assert tracker.previous_sales("AD4020", self.start + timedelta(hours=3)) == 2
+
+  def test_tracked_booking_is_not_priced_from_negative_sales(self):
+    tracker = DemandTracker(window=timedelta(hours=24))
+    system = FlightBookingSystem(demand_tracker=tracker)
+    departure = self.start + timedelta(days=5)
+    booking = dict(flight_id="AD4020", available_seats=10, current_price=500.0,
+                   departure_time=departure, reward_points_available=0)
+    system.book_tracked_flight(passengers=5, booking_time=self.start, is_cancellation=False, **booking)
+    system.book_tracked_flight(passengers=5, booking_time=self.start + timedelta(hours=23),
+                               is_cancellation=True, **booking)
+
+    assert tracker.previous_sales("AD4020", self.start + timedelta(hours=25)) == 0
+
+  def test_windowed_tracker_accepts_epoch_seconds(self):
+    tracker = DemandTracker(window=timedelta(hours=24))
+    system = FlightBookingSystem(demand_tracker=tracker)
+    booked_at = 1_700_000_000
+    booking = dict(available_seats=10, current_price=200.0, departure_time=1_700_500_000,
+                   reward_points_available=0)
+
+    confirmed = system.book_tracked_flight("F", 2, booked_at, is_cancellation=False, **booking)
+
+    assert confirmed.confirmation == True
+    assert tracker.previous_sales("F", booked_at + 3600) == 2
+    assert tracker.previous_sales("F", EPOCH + timedelta(seconds=booked_at + 3600)) == 2
+    assert tracker.previous_sales("F", booked_at + 25 * 3600) == 0
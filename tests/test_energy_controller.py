@@ -0,0 +1,94 @@
+import random
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyController import EnergyController
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.ScheduleIndex import ScheduleIndex
+
+
+START = datetime(2025, 11, 2, 21, 0)
+PRIORITIES = {"Security": 1, "Refrigerator": 1, "Heating": 2, "Washer": 2, "Lights": 3, "Computer": 2}
+
+
+def make_controller(schedules=None, limit=30):
+    return EnergyController(PRIORITIES, price_threshold=0.3, desired_temperature_range=(20, 24),
+                            energy_usage_limit=limit, scheduled_devices=schedules)
+
+
+class TestEnergyController:
+
+    def test_matches_manage_energy_on_every_tick(self):
+        rng = random.Random(24)
+        schedules = [DeviceSchedule(rng.choice(["Washer", "Oven", "Lights"]),
+                                    START + timedelta(minutes=rng.randrange(0, 3000, 5))) for _ in range(60)]
+        controller = make_controller(ScheduleIndex(schedules))
+        energy_system = SmartEnergyManagementSystem()
+        status = {}
+        total_today = 0.0
+        day = START.date()
+
+        for minute in range(0, 3000, 5):
+            now = START + timedelta(minutes=minute)
+            price = rng.choice([0.2, 0.25, 0.4])
+            temperature = rng.choice([18.0, 22.0, 26.0])
+            used = rng.choice([0.0, 0.1, 0.5])
+            if now.date() != day:
+                day = now.date()
+                total_today = 0.0
+            total_today += used
+
+            changes = controller.tick(price, now, temperature, used)
+
+            expected = energy_system.manage_energy(
+                current_price=price, price_threshold=0.3, device_priorities=PRIORITIES, current_time=now,
+                current_temperature=temperature, desired_temperature_range=(20, 24), energy_usage_limit=30,
+                total_energy_used_today=total_today, scheduled_devices=schedules,
+            )
+            assert repr(controller.result()) == repr(expected)
+            for device, state in changes.items():
+                if state is None:
+                    del status[device]
+                else:
+                    status[device] = state
+            assert status == expected.device_status
+
+    def test_unchanged_inputs_emit_no_changes(self):
+        controller = make_controller()
+
+        first = controller.tick(0.2, START, 22.0)
+        second = controller.tick(0.25, START + timedelta(minutes=1), 23.0)
+
+        assert first["Washer"] is True
+        assert second == {}
+
+    def test_price_crossing_threshold_emits_only_diffs(self):
+        controller = make_controller()
+        controller.tick(0.2, START, 22.0)
+
+        changes = controller.tick(0.5, START + timedelta(minutes=1), 22.0)
+
+        assert changes == {"Washer": False, "Lights": False, "Computer": False}
+
+    def test_usage_is_reset_each_day(self):
+        controller = make_controller(limit=10)
+        controller.tick(0.2, datetime(2025, 11, 2, 12, 0), 22.0, energy_used=12)
+        assert controller.device_status["Washer"] is False
+
+        changes = controller.tick(0.2, datetime(2025, 11, 3, 12, 0), 22.0, energy_used=1)
+
+        assert controller.total_energy_used_today == 1
+        assert changes["Washer"] is True
+
+    def test_scheduled_device_outside_priorities_is_reported_as_removed(self):
+        controller = make_controller([DeviceSchedule("Oven", START)])
+
+        assert controller.tick(0.2, START, 22.0)["Oven"] is True
+        assert controller.tick(0.2, START + timedelta(minutes=1), 22.0) == {"Oven": None}
+
+    def test_index_schedules_are_expired(self):
+        index = ScheduleIndex([DeviceSchedule("Oven", START), DeviceSchedule("Oven", START + timedelta(days=1))])
+        controller = make_controller(index)
+
+        controller.tick(0.2, START + timedelta(hours=1), 22.0)
+
+        assert len(index) == 1
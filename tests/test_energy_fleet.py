@@ -0,0 +1,105 @@
+import random
+import pytest
+from datetime import datetime
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+
+
+DEVICES = ["Security", "Refrigerator", "Heating", "Microwave", "Sound System", "Computer", "Washer", "Lights"]
+
+
+def random_fleet(seed, homes):
+    rng = random.Random(seed)
+    fleet = {
+        "current_prices": [], "price_thresholds": [], "device_names": DEVICES, "device_priorities": [],
+        "current_times": [], "current_temperatures": [], "desired_temperature_ranges": [],
+        "energy_usage_limits": [], "total_energy_used_today": [], "scheduled_devices": [],
+    }
+    for _ in range(homes):
+        current_time = datetime(2025, 11, 2, rng.randrange(24), rng.choice([0, 30]))
+        fleet["current_prices"].append(rng.choice([0.1, 0.3, 0.5]))
+        fleet["price_thresholds"].append(0.3)
+        fleet["device_priorities"].append(
+            [rng.choice([None, 1, 2, 3]) if rng.random() < 0.9 else None for _ in DEVICES])
+        fleet["current_times"].append(current_time)
+        fleet["current_temperatures"].append(rng.choice([15.0, 20.0, 22.5, 24.0, 30.0]))
+        fleet["desired_temperature_ranges"].append((20.0, 24.0))
+        fleet["energy_usage_limits"].append(rng.choice([10, 50.5, 100]))
+        fleet["total_energy_used_today"].append(rng.choice([0, 9.5, 10, 12, 50.5, 52.25, 1000]))
+        fleet["scheduled_devices"].append([
+            DeviceSchedule(rng.choice(DEVICES + ["Oven"]), rng.choice([current_time, datetime(2025, 1, 1)]))
+            for _ in range(rng.randrange(3))
+        ])
+    return fleet
+
+
+def scalar_result(energy_system, fleet, home):
+    priorities = {
+        name: priority
+        for name, priority in zip(fleet["device_names"], fleet["device_priorities"][home])
+        if priority is not None
+    }
+    return energy_system.manage_energy(
+        current_price=fleet["current_prices"][home],
+        price_threshold=fleet["price_thresholds"][home],
+        device_priorities=priorities,
+        current_time=fleet["current_times"][home],
+        current_temperature=fleet["current_temperatures"][home],
+        desired_temperature_range=fleet["desired_temperature_ranges"][home],
+        energy_usage_limit=fleet["energy_usage_limits"][home],
+        total_energy_used_today=fleet["total_energy_used_today"][home],
+        scheduled_devices=fleet["scheduled_devices"][home],
+    )
+
+
+class TestManageEnergyFleet:
+
+    def setup_method(self):
+        self.energy_system = SmartEnergyManagementSystem()
+
+    def test_matches_per_home_results(self):
+        fleet = random_fleet(2025, 2000)
+
+        result = self.energy_system.manage_energy_fleet(**fleet)
+
+        assert len(result) == 2000
+        for home in range(2000):
+            expected = scalar_result(self.energy_system, fleet, home)
+            actual = result[home]
+            assert actual.device_status == expected.device_status
+            assert actual.energy_saving_mode == expected.energy_saving_mode
+            assert actual.temperature_regulation_active == expected.temperature_regulation_active
+            assert actual.total_energy_used == expected.total_energy_used
+
+    def test_missing_devices_get_extra_columns(self):
+        fleet = random_fleet(1, 5)
+        fleet["device_names"] = ["Security", "Computer"]
+        fleet["device_priorities"] = [[1, 2]] * 5
+        fleet["scheduled_devices"] = [[DeviceSchedule("Oven", fleet["current_times"][0])]] + [[]] * 4
+
+        result = self.energy_system.manage_energy_fleet(**fleet)
+
+        assert result.device_names == ["Security", "Computer", "Heating", "Cooling", "Oven"]
+        assert result.device_status[0][4] is True
+        assert result.device_status[1][4] is None
+
+    def test_absent_device_is_none(self):
+        fleet = random_fleet(3, 1)
+        fleet["device_priorities"] = [[None] * len(DEVICES)]
+        fleet["scheduled_devices"] = [[]]
+
+        result = self.energy_system.manage_energy_fleet(**fleet)
+
+        assert result.device_status[0][DEVICES.index("Microwave")] is None
+
+    def test_columns_must_match_homes(self):
+        fleet = random_fleet(4, 3)
+        fleet["current_prices"] = fleet["current_prices"][:2]
+        with pytest.raises(ValueError):
+            self.energy_system.manage_energy_fleet(**fleet)
+
+    def test_priority_rows_must_match_device_names(self):
+        fleet = random_fleet(4, 3)
+        fleet["device_priorities"][1] = [1]
+        with pytest.raises(ValueError):
+            self.energy_system.manage_energy_fleet(**fleet)
@@ -0,0 +1,105 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.FareQuoteCache import FareQuoteCache
+
+
+class FakeClock:
+  def __init__(self):
+    self.now = 0.0
+
+  def __call__(self):
+    return self.now
+
+
+def quote(cache, hours, **overrides):
+  booking_time = datetime(2024, 1, 15, 10, 0)
+  arguments = dict(
+    passengers=2,
+    booking_time=booking_time,
+    available_seats=10,
+    current_price=200.0,
+    previous_sales=100,
+    is_cancellation=False,
+    departure_time=booking_time + timedelta(hours=hours),
+    reward_points_available=0,
+  )
+  arguments.update(overrides)
+  return cache.book_flight(**arguments)
+
+
+class TestFareQuoteCache:
+
+  def test_time_buckets_share_entries(self):
+    cache = FareQuoteCache()
+
+    first = quote(cache, 100)
+    second = quote(cache, 72)
+    last_minute = quote(cache, 10)
+
+    assert second is first
+    assert last_minute.total_price == 420.0
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+  def test_matches_uncached_results(self):
+    system = FlightBookingSystem()
+    cache = FareQuoteCache(max_entries=50)
+    rng = random.Random(646)
+    for _ in range(2000):
+      overrides = dict(
+        passengers=rng.randint(1, 6),
+        available_seats=rng.randint(0, 6),
+        current_price=rng.choice([100.0, 250.0]),
+        previous_sales=rng.choice([50, 120]),
+        is_cancellation=rng.random() < 0.3,
+        reward_points_available=rng.choice([0, 1000]),
+      )
+      hours = rng.choice([1, 23.99, 24, 30, 47.99, 48, 200])
+
+      cached = quote(cache, hours, **overrides)
+      expected = quote(system, hours, **overrides)
+
+      assert repr(cached) == repr(expected)
+    assert len(cache) <= 50
+    assert cache.stats()["evictions"] > 0
+
+  def test_lru_eviction(self):
+    cache = FareQuoteCache(max_entries=2)
+    quote(cache, 100, passengers=1)
+    quote(cache, 100, passengers=2)
+    quote(cache, 100, passengers=1)
+    quote(cache, 100, passengers=3)
+
+    quote(cache, 100, passengers=1)
+
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["evictions"] == 1
+
+  def test_ttl_expiration(self):
+    clock = FakeClock()
+    cache = FareQuoteCache(ttl=30, clock=clock)
+    first = quote(cache, 100)
+
+    clock.now = 31
+
+    assert quote(cache, 100) is not first
+    assert cache.stats()["misses"] == 2
+
+  def test_price_or_sales_change_invalidates_flight(self):
+    cache = FareQuoteCache()
+    quote(cache, 100, flight_id="AD4020")
+    quote(cache, 10, flight_id="AD4020")
+    quote(cache, 100, flight_id="LA3000")
+
+    changed = quote(cache, 100, flight_id="AD4020", previous_sales=150)
+
+    assert changed.total_price == pytest.approx(480.0)
+    assert cache.stats()["invalidations"] == 2
+    assert len(cache) == 2
+    assert cache.invalidate("LA3000") == 1
+
+  def test_invalid_configuration(self):
+    with pytest.raises(ValueError):
+      FareQuoteCache(max_entries=0)
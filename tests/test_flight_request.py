@@ -0,0 +1,61 @@
+import random
+from datetime import datetime, timedelta
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.FlightRequest import FlightRequest
+from src.flight.FareQuoteCache import FareQuoteCache
+
+
+EPOCH = datetime(1970, 1, 1)
+
+
+class TestFlightRequest:
+
+  def setup_method(self):
+    self.system = FlightBookingSystem()
+
+  def test_epoch_seconds_match_datetimes(self):
+    rng = random.Random(646)
+    for _ in range(3000):
+      booking = rng.randint(1_700_000_000, 1_800_000_000)
+      departure = booking + rng.choice([-60, 0, 86399, 86400, 86401, 172799, 172800, 172801, rng.randint(0, 10**6)])
+      arguments = dict(
+        passengers=rng.randint(1, 8),
+        available_seats=rng.randint(0, 10),
+        current_price=rng.choice([99.9, 200.0]),
+        previous_sales=rng.randint(0, 300),
+        is_cancellation=rng.random() < 0.4,
+        reward_points_available=rng.choice([0, 700]),
+      )
+
+      from_epoch = self.system.book_flight(booking_time=booking, departure_time=departure, **arguments)
+      from_datetime = self.system.book_flight(
+        booking_time=EPOCH + timedelta(seconds=booking),
+        departure_time=EPOCH + timedelta(seconds=departure),
+        **arguments,
+      )
+
+      assert repr(from_epoch) == repr(from_datetime)
+      assert from_epoch.total_price == from_datetime.total_price
+      assert from_epoch.refund_amount == from_datetime.refund_amount
+
+  def test_thresholds_in_seconds(self):
+    cancellation = dict(passengers=1, available_seats=10, current_price=100.0, previous_sales=100,
+                        is_cancellation=True, reward_points_available=0, booking_time=0)
+
+    assert self.system.book_flight(departure_time=86399, **cancellation).refund_amount == 90.0
+    assert self.system.book_flight(departure_time=86400, **cancellation).refund_amount == 40.0
+    assert self.system.book_flight(departure_time=172799, **cancellation).refund_amount == 40.0
+    assert self.system.book_flight(departure_time=172800, **cancellation).refund_amount == 80.0
+
+  def test_request_record(self):
+    request = FlightRequest(2, 0, 10, 200.0, 100, False, 5 * 86400, 0)
+
+    result = self.system.book_request(request)
+    cached = FareQuoteCache().book_request(request)
+
+    assert not hasattr(request, "__dict__")
+    assert result.total_price == 320.0
+    assert repr(cached) == repr(result)
+    assert repr(request) == ("FlightRequest(passengers=2, booking_time=0, available_seats=10, "
+                             "current_price=200.00, previous_sales=100, is_cancellation=False, "
+                             "departure_time=432000, reward_points_available=0)")
@@ -0,0 +1,70 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.fraud.Transaction import Transaction
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def scalar_results(fraud_system, amounts, timestamps, locations, accounts, blacklist):
+    """Executa o caminho escalar linha a linha, com o histórico de cada conta em lista."""
+    histories = {}
+    results = []
+    for amount, timestamp, location, account in zip(amounts, timestamps, locations, accounts):
+        transaction = Transaction(amount, EPOCH + timedelta(seconds=timestamp), location)
+        previous = histories.setdefault(account, [])
+        results.append(fraud_system.check_for_fraud(transaction, previous, blacklist))
+        previous.append(transaction)
+    return results
+
+
+class TestFraudBatch:
+
+    def setup_method(self):
+        self.fraud_system = FraudDetectionSystem()
+
+    def test_columns_must_have_same_size(self):
+        with pytest.raises(ValueError):
+            self.fraud_system.check_for_fraud_batch([1.0, 2.0], [0], ['A'], [1], [])
+
+    def test_history_is_per_account(self):
+        timestamps = [i * 60 for i in range(12)]
+        amounts = [50.0] * 12
+        locations = ['Brasil'] * 12
+        accounts = [1] * 11 + [2]
+
+        result = self.fraud_system.check_for_fraud_batch(amounts, timestamps, locations, accounts, [])
+
+        assert result.is_blocked[10] == False
+        assert result.is_blocked[11] == False
+        assert len(result) == 12
+
+    def test_rows_as_check_results(self):
+        result = self.fraud_system.check_for_fraud_batch(
+            [15000.0, 100.0], [0, 600], ['Brasil', 'EUA'], ['a', 'a'], ['Chile']
+        )
+
+        assert repr(result[0]) == repr(self.fraud_system.check_for_fraud(
+            Transaction(15000.0, EPOCH, 'Brasil'), [], ['Chile']))
+        assert result.is_fraudulent[1] == True
+        assert result.risk_score[1] == 20
+
+    def test_matches_scalar_path(self):
+        rng = random.Random(646)
+        size = 3000
+        amounts = [rng.choice([50.0, 10000.0, 10001.0]) for _ in range(size)]
+        timestamps = []
+        moment = 1_700_000_000
+        for _ in range(size):
+            moment += rng.randint(-30, 120)
+            timestamps.append(moment)
+        locations = [rng.choice(['Brasil', 'EUA', 'Chile']) for _ in range(size)]
+        accounts = [rng.randint(0, 5) for _ in range(size)]
+        blacklist = ['Chile']
+
+        expected = scalar_results(self.fraud_system, amounts, timestamps, locations, accounts, blacklist)
+        result = self.fraud_system.check_for_fraud_batch(amounts, timestamps, locations, accounts, blacklist)
+
+        assert [repr(result[i]) for i in range(size)] == [repr(r) for r in expected]
@@ -0,0 +1,53 @@
+import random
+from datetime import datetime, timedelta
+from src.fraud.Transaction import Transaction
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+
+
+class UntouchableTransaction:
+    """Transação antiga que não deve ser lida pelo caminho com parada antecipada."""
+    @property
+    def timestamp(self):
+        raise AssertionError("transação fora da janela foi lida")
+
+
+class TestFraudEarlyExit:
+
+    def setup_method(self):
+        self.fraud_system = FraudDetectionSystem()
+        self.base_time = datetime(2025, 10, 16, 13, 0, 0)
+
+    def test_stops_after_eleventh_hit(self):
+        previous = [UntouchableTransaction() for _ in range(1000)]
+        previous += [Transaction(50.0, self.base_time + timedelta(minutes=i), 'Brasil') for i in range(11)]
+        current = Transaction(100.0, self.base_time + timedelta(minutes=30), 'Brasil')
+
+        result = self.fraud_system.check_for_fraud(current, previous, [], previous_sorted=True)
+
+        assert result.is_blocked == True
+        assert result.risk_score == 30
+
+    def test_stops_when_leaving_window(self):
+        previous = [UntouchableTransaction() for _ in range(1000)]
+        previous.append(Transaction(50.0, self.base_time - timedelta(minutes=61), 'Brasil'))
+        previous += [Transaction(50.0, self.base_time + timedelta(minutes=i), 'Brasil') for i in range(5)]
+        current = Transaction(100.0, self.base_time + timedelta(minutes=10), 'Brasil')
+
+        result = self.fraud_system.check_for_fraud(current, previous, [], previous_sorted=True)
+
+        assert result.is_blocked == False
+        assert result.risk_score == 0
+
+    def test_sorted_path_matches_full_scan(self):
+        rng = random.Random(646)
+        for _ in range(300):
+            previous = []
+            moment = self.base_time
+            for _ in range(rng.randint(0, 40)):
+                moment += timedelta(seconds=rng.randint(0, 600))
+                previous.append(Transaction(50.0, moment, rng.choice(['Brasil', 'EUA'])))
+            current = Transaction(100.0, moment + timedelta(seconds=rng.randint(-600, 4000)), 'Brasil')
+
+            expected = repr(self.fraud_system.check_for_fraud(current, previous, []))
+
+            assert repr(self.fraud_system.check_for_fraud(current, previous, [], previous_sorted=True)) == expected
@@ -0,0 +1,72 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.fraud.Transaction import Transaction
+from src.fraud.AccountHistory import AccountHistory
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.FraudRuleEngine import FraudRuleEngine, DEFAULT_RULES
+
+
+class ExplodingHistory(AccountHistory):
+    """Histórico que falha se a regra de velocidade for avaliada."""
+    def count_since(self, cutoff):
+        raise AssertionError("a regra de velocidade não deveria ser avaliada")
+
+
+class TestFraudRuleEngine:
+
+    def setup_method(self):
+        self.engine = FraudRuleEngine()
+        self.fraud_system = FraudDetectionSystem()
+        self.base_time = datetime(2025, 10, 16, 13, 0, 0)
+
+    def test_matches_fraud_detection_system(self):
+        rng = random.Random(646)
+        for _ in range(500):
+            previous = []
+            moment = self.base_time
+            for _ in range(rng.randint(0, 20)):
+                moment += timedelta(seconds=rng.randint(0, 400))
+                previous.append(Transaction(50.0, moment, rng.choice(['Brasil', 'EUA'])))
+            current = Transaction(
+                rng.choice([100.0, 10000.0, 10001.0]),
+                moment + timedelta(seconds=rng.randint(0, 3000)),
+                rng.choice(['Brasil', 'EUA', 'Chile']),
+            )
+            blacklist = rng.choice([[], ['Chile'], ['Brasil']])
+
+            expected = repr(self.fraud_system.check_for_fraud(current, previous, blacklist))
+
+            assert repr(self.engine.check(current, previous, blacklist)) == expected
+            assert repr(self.engine.check(current, AccountHistory(previous), blacklist)) == expected
+
+    def test_blacklist_skips_velocity_scan(self):
+        previous = ExplodingHistory([Transaction(50.0, self.base_time, 'EUA')])
+        current = Transaction(15000.0, self.base_time + timedelta(minutes=10), 'Chile')
+
+        result = self.engine.check(current, previous, ['Chile'])
+
+        assert result.is_fraudulent == True
+        assert result.is_blocked == True
+        assert result.verification_required == True
+        assert result.risk_score == 100
+
+    def test_custom_thresholds(self):
+        rules = [dict(rule) for rule in DEFAULT_RULES]
+        rules[0]["threshold"] = 500
+        engine = FraudRuleEngine(rules)
+
+        result = engine.check(Transaction(600.0, self.base_time, 'Brasil'), [], [])
+
+        assert result.is_fraudulent == True
+        assert result.risk_score == 50
+
+    def test_invalid_rules(self):
+        with pytest.raises(ValueError):
+            FraudRuleEngine([{"kind": "unknown"}])
+        with pytest.raises(ValueError):
+            FraudRuleEngine([{"kind": "amount_above", "threshold": 1, "flags": ("is_suspicious",)}])
+        with pytest.raises(ValueError):
+            FraudRuleEngine([{"kind": "amount_above", "threshold": 1, "score_mode": "multiply"}])
+        with pytest.raises(ValueError):
+            FraudRuleEngine([DEFAULT_RULES[3], DEFAULT_RULES[0]])
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import time
+import pytest
+from datetime import datetime, timedelta
+from src.fraud.Transaction import Transaction
+from src.fraud.RollingFraudScorer import RollingFraudScorer
+from src.fraud.FraudScoringService import FraudScoringService
+
+
+def make_feed(size):
+    start = datetime(2025, 10, 16, 14, 0, 0)
+    return [
+        (i % 3, Transaction(15000.0 if i % 7 == 0 else 50.0, start + timedelta(minutes=i), ['Brasil', 'EUA'][i % 2]))
+        for i in range(size)
+    ]
+
+
+class TestFraudScoringService:
+
+    def test_batches_concurrent_requests(self):
+        feed = make_feed(50)
+        sequential = RollingFraudScorer()
+        expected = [repr(sequential.score(account, t)) for account, t in feed]
+
+        async def scenario():
+            service = FraudScoringService(max_batch_size=16, max_delay=0.05)
+            await service.start()
+            results = await asyncio.gather(*(service.check(account, t) for account, t in feed))
+            metrics = service.metrics()
+            await service.stop()
+            return results, metrics
+
+        results, metrics = asyncio.run(scenario())
+
+        assert [repr(result) for result in results] == expected
+        assert metrics["requests"] == 50
+        assert 4 <= metrics["batches"] < 50
+        assert metrics["p99_latency_ms"] >= metrics["p50_latency_ms"] > 0
+
+    def test_requires_start(self):
+        async def scenario():
+            await FraudScoringService().check(1, make_feed(1)[0][1])
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(scenario())
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            FraudScoringService(max_batch_size=0)
+        with pytest.raises(ValueError):
+            FraudScoringService(max_delay=-1)
+
+    def test_tcp_server(self):
+        async def scenario():
+            service = FraudScoringService(scorer=RollingFraudScorer(blacklisted_locations=['Miami']))
+            server = await service.serve(port=0)
+            port = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            lines = [
+                {"account": "a", "amount": 100, "timestamp": 0, "location": "Miami"},
+                {"account": "a"},
+                [1, 2],
+                "x",
+                {"command": "metrics"},
+            ]
+            responses = []
+            for line in lines:
+                writer.write(json.dumps(line).encode() + b"\n")
+                await writer.drain()
+                responses.append(json.loads(await reader.readline()))
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            await service.stop()
+            return responses
+
+        blocked, error, array_line, string_line, metrics = asyncio.run(scenario())
+
+        assert "error" in array_line and "error" in string_line
+        assert blocked == {"is_fraudulent": False, "is_blocked": True, "verification_required": False, "risk_score": 100}
+        assert "error" in error
+        assert metrics["requests"] == 1
+
+    def test_stop_finishes_the_batch_in_flight_without_blocking(self):
+        class SlowScorer(RollingFraudScorer):
+            def score(self, account, transaction):
+                time.sleep(0.2)
+                return super().score(account, transaction)
+
+        async def scenario():
+            service = FraudScoringService(scorer=SlowScorer(), max_delay=0)
+            await service.start()
+            pending = asyncio.ensure_future(service.check(1, make_feed(1)[0][1]))
+            await asyncio.sleep(0.05)
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            counting = asyncio.ensure_future(ticker())
+            await service.stop()
+            counting.cancel()
+            result = await asyncio.wait_for(pending, 1)
+            return result, ticks, service.metrics()
+
+        result, ticks, metrics = asyncio.run(scenario())
+
+        assert result.risk_score == 50
+        assert ticks >= 5
+        assert metrics["requests"] == 1
+
+    def test_a_failing_transaction_only_fails_its_own_request(self):
+        class PickyScorer(RollingFraudScorer):
+            def score(self, account, transaction):
+                if account == 'bad':
+                    raise ValueError('conta inválida')
+                return super().score(account, transaction)
+
+        feed = make_feed(4)
+
+        async def scenario():
+            service = FraudScoringService(scorer=PickyScorer(), max_batch_size=16, max_delay=0.05)
+            await service.start()
+            results = await asyncio.gather(
+                *(service.check('bad' if i == 1 else account, t) for i, (account, t) in enumerate(feed)),
+                return_exceptions=True,
+            )
+            metrics = service.metrics()
+            await service.stop()
+            return results, metrics
+
+        results, metrics = asyncio.run(scenario())
+
+        assert isinstance(results[1], ValueError)
+        assert all(not isinstance(result, Exception) for i, result in enumerate(results) if i != 1)
+        assert metrics["batches"] == 1
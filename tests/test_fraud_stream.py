@@ -0,0 +1,159 @@
+import io
+import json
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.fraud.Transaction import Transaction
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.RollingFraudScorer import RollingFraudScorer
+from src.fraud import stream
+
+
+class TestRollingFraudScorer:
+
+    def test_matches_full_history(self):
+        fraud_system = FraudDetectionSystem()
+        scorer = RollingFraudScorer(blacklisted_locations=['Chile'])
+        rng = random.Random(646)
+        histories = {}
+        moment = datetime(2025, 10, 16, 0, 0, 0)
+        for _ in range(2000):
+            moment += timedelta(seconds=rng.randint(0, 200))
+            account = rng.randint(0, 4)
+            transaction = Transaction(rng.choice([50.0, 15000.0]), moment, rng.choice(['Brasil', 'EUA', 'Chile']))
+            previous = histories.setdefault(account, [])
+
+            expected = fraud_system.check_for_fraud(transaction, previous, ['Chile'])
+            result = scorer.score(account, transaction)
+            previous.append(transaction)
+
+            assert repr(result) == repr(expected)
+
+    def test_history_stays_within_window(self):
+        scorer = RollingFraudScorer()
+        start = datetime(2025, 10, 16, 0, 0, 0)
+        for minute in range(600):
+            scorer.score('a', Transaction(10.0, start + timedelta(minutes=minute), 'Brasil'))
+
+        assert len(scorer._histories['a']) == 61
+
+    def test_max_accounts_evicts_least_recent(self):
+        scorer = RollingFraudScorer(max_accounts=2)
+        moment = datetime(2025, 10, 16, 0, 0, 0)
+        for account in ['a', 'b', 'a', 'c']:
+            scorer.score(account, Transaction(10.0, moment, 'Brasil'))
+
+        assert len(scorer) == 2
+        assert set(scorer._histories) == {'a', 'c'}
+
+
+    def test_idle_accounts_are_evicted_without_changing_results(self):
+        fraud_system = FraudDetectionSystem()
+        scorer = RollingFraudScorer()
+        rng = random.Random(4)
+        histories = {}
+        moment = datetime(2025, 10, 16, 0, 0, 0)
+        for _ in range(3000):
+            moment += timedelta(seconds=rng.randint(0, 30))
+            account = rng.randint(0, 2000)
+            transaction = Transaction(rng.choice([50.0, 15000.0]), moment, rng.choice(['Brasil', 'EUA']))
+            previous = histories.setdefault(account, [])
+
+            expected = fraud_system.check_for_fraud(transaction, previous, [])
+            result = scorer.score(account, transaction)
+            previous.append(transaction)
+
+            assert repr(result) == repr(expected)
+            assert all(history[-1].timestamp >= moment - scorer.HISTORY_WINDOW
+                       for history in scorer._histories.values())
+
+        assert len(scorer) < 500 < len(histories)
+
+class TestFraudStream:
+
+    def test_jsonl_pipeline(self):
+        lines = [
+            json.dumps({"account": 1, "amount": 15000, "timestamp": 0, "location": "Brasil"}),
+            "",
+            json.dumps({"account": 1, "amount": 10, "timestamp": "1970-01-01T00:10:00", "location": "EUA"}),
+        ]
+        output = io.StringIO()
+        progress = io.StringIO()
+
+        count = stream.run(lines, output, "jsonl", RollingFraudScorer(), progress=progress)
+
+        rows = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert count == 2
+        assert rows[0]["risk_score"] == 50
+        assert rows[1]["is_fraudulent"] == True
+        assert rows[1]["risk_score"] == 20
+        assert "linhas/s" in progress.getvalue()
+
+    def test_csv_pipeline(self):
+        feed = io.StringIO(
+            "account,amount,timestamp,location\n"
+            "7,100,2025-10-16T14:00:00,Miami\n"
+            "7,100,2025-10-16T15:30:00,Brasil\n"
+        )
+        output = io.StringIO()
+
+        stream.run(feed, output, "csv", RollingFraudScorer(blacklisted_locations=['Miami']))
+
+        lines = output.getvalue().splitlines()
+        assert lines[0] == ",".join(stream.RESULT_FIELDS)
+        assert lines[1] == "7,2025-10-16T14:00:00,False,True,False,100"
+        assert lines[2] == "7,2025-10-16T15:30:00,False,False,False,0"
+
+    def test_main_with_files(self, tmp_path):
+        feed = tmp_path / "feed.jsonl"
+        feed.write_text(json.dumps({"account": "x", "amount": 5, "timestamp": 60, "location": "Miami"}) + "\n")
+        blacklist = tmp_path / "blacklist.txt"
+        blacklist.write_text("Miami\n")
+        output = tmp_path / "out.jsonl"
+
+        assert stream.main([str(feed), "-o", str(output), "--blacklist", str(blacklist)]) == 0
+
+        row = json.loads(output.read_text())
+        assert row["account"] == "x"
+        assert row["risk_score"] == 100
+
+    def test_aware_timestamps_become_naive_utc(self):
+        assert stream.parse_timestamp("2025-10-16T14:00:00-03:00") == datetime(2025, 10, 16, 17, 0, 0)
+        assert stream.parse_timestamp("2025-10-16T17:00:00+00:00") == datetime(2025, 10, 16, 17, 0, 0)
+
+        lines = [
+            json.dumps({"account": 1, "amount": 10, "timestamp": "2025-10-16T14:00:00-03:00", "location": "Brasil"}),
+            json.dumps({"account": 1, "amount": 10, "timestamp": "2025-10-16T17:10:00", "location": "EUA"}),
+        ]
+        output = io.StringIO()
+
+        assert stream.run(lines, output, "jsonl", RollingFraudScorer()) == 2
+        assert json.loads(output.getvalue().splitlines()[1])["risk_score"] == 20
+
+    def test_malformed_records_are_skipped_and_reported(self):
+        lines = [
+            json.dumps({"account": 1, "amount": 10, "timestamp": 0, "location": "Brasil"}),
+            "{nao e json",
+            json.dumps({"account": 1, "amount": "muito", "timestamp": 60, "location": "Brasil"}),
+            json.dumps({"account": 1, "timestamp": 60, "location": "Brasil"}),
+            json.dumps({"account": 1, "amount": 10, "timestamp": "ontem", "location": "Brasil"}),
+            json.dumps({"account": 1, "amount": 10, "timestamp": 120, "location": "Brasil"}),
+        ]
+        output = io.StringIO()
+        progress = io.StringIO()
+
+        count = stream.run(lines, output, "jsonl", RollingFraudScorer(), progress=progress, strict=False)
+
+        assert count == 2
+        assert "linha 2 ignorado" in progress.getvalue()
+        assert progress.getvalue().count("registro") == 3
+
+    def test_strict_stops_at_the_first_malformed_record(self, tmp_path):
+        feed = tmp_path / "feed.csv"
+        feed.write_text("account,amount,timestamp,location\n7,abc,60,Miami\n7,10,120,Miami\n")
+        output = tmp_path / "out.csv"
+
+        with pytest.raises(ValueError):
+            stream.main([str(feed), "-o", str(output), "--strict"])
+        assert stream.main([str(feed), "-o", str(output)]) == 0
+        assert len(output.read_text().splitlines()) == 2
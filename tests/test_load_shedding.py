@@ -0,0 +1,99 @@
+import math
+import random
+import pytest
+from datetime import datetime
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem, shed_load
+
+
+def reference_shedding(total, limit, eligible):
+    """O laço original do passo 4, contando os dispositivos desligados."""
+    turned_off = 0
+    devices_were_on = True
+    while total >= limit and devices_were_on:
+        devices = eligible - turned_off
+        if not devices:
+            devices_were_on = False
+            continue
+        for _ in range(devices):
+            if total < limit:
+                break
+            turned_off += 1
+            total -= 1
+    return turned_off, total
+
+
+def same(first, second):
+    """Igualdade que também compara tipo e trata NaN como igual a NaN."""
+    if isinstance(first[1], float) and math.isnan(first[1]):
+        return first[0] == second[0] and math.isnan(second[1])
+    return first == second and type(first[1]) is type(second[1])
+
+
+class TestShedLoad:
+
+    @pytest.mark.parametrize("total, limit", [
+        (10, 10), (9, 10), (155, 110), (110.0, 110), (52.25, 50.5), (0.3, -0.2), (0.3, -5.0),
+        (1.0, 0.5), (-3.5, -10), (2.0 ** 53, 2.0 ** 53 - 8), (2.0 ** 53 + 2, 0.0), (1e300, 1e299),
+        (math.inf, 0.0), (math.inf, math.inf), (math.nan, 0.0), (5.0, math.nan), (-math.inf, -math.inf),
+        (10 ** 30, 10 ** 30 - 3), (10 ** 30, 1e30), (True, 0), (7, 6.5),
+    ])
+    @pytest.mark.parametrize("eligible", [0, 1, 3, 12, 1000])
+    def test_matches_original_loop(self, total, limit, eligible):
+        assert same(shed_load(total, limit, eligible), reference_shedding(total, limit, eligible))
+
+    def test_matches_original_loop_on_random_values(self):
+        rng = random.Random(22)
+        for _ in range(20000):
+            limit = rng.choice([rng.uniform(-20, 20), rng.randint(-20, 20), 0.1, -0.7])
+            total = rng.choice([rng.uniform(-30, 60), rng.randint(-30, 60), limit + rng.random()])
+            eligible = rng.randrange(60)
+            assert same(shed_load(total, limit, eligible), reference_shedding(total, limit, eligible))
+
+    def test_manage_energy_far_over_the_limit(self):
+        priorities = {f"Device {index}": 2 for index in range(500)}
+        priorities["Security"] = 1
+
+        result = SmartEnergyManagementSystem().manage_energy(
+            current_price=0.1, price_threshold=0.3, device_priorities=priorities,
+            current_time=datetime(2025, 11, 2, 12, 0), current_temperature=22,
+            desired_temperature_range=(20, 24), energy_usage_limit=100.5,
+            total_energy_used_today=300.25, scheduled_devices=[],
+        )
+
+        assert result.total_energy_used == 100.25
+        assert [result.device_status[f"Device {index}"] for index in (0, 199, 200)] == [False, False, True]
+        assert result.device_status["Security"] is True
+
+    def test_manage_energy_matches_original_loop_on_random_homes(self):
+        rng = random.Random(4)
+        energy_system = SmartEnergyManagementSystem()
+        for _ in range(2000):
+            priorities = {f"Device {index}": rng.choice([1, 2, 3]) for index in range(rng.randrange(8))}
+            total = rng.choice([rng.uniform(-5, 15), rng.randint(0, 15), 0.3])
+            limit = rng.choice([rng.uniform(-5, 10), rng.randint(0, 10), -0.5])
+
+            expected_status = dict.fromkeys(priorities, True)
+            expected_total = total
+            devices_were_on = True
+            while expected_total >= limit and devices_were_on:
+                devices_to_turn_off = [device for device, priority in priorities.items()
+                                       if expected_status[device] and priority > 1]
+                if not devices_to_turn_off:
+                    devices_were_on = False
+                    continue
+                for device in devices_to_turn_off:
+                    if expected_total < limit:
+                        break
+                    expected_status[device] = False
+                    expected_total -= 1
+
+            result = energy_system.manage_energy(
+                current_price=0.1, price_threshold=0.3, device_priorities=priorities,
+                current_time=datetime(2025, 11, 2, 12, 0), current_temperature=22,
+                desired_temperature_range=(20, 24), energy_usage_limit=limit,
+                total_energy_used_today=total, scheduled_devices=[],
+            )
+
+            del result.device_status["Heating"], result.device_status["Cooling"]
+            assert result.device_status == expected_status
+            assert same((0, result.total_energy_used), (0, expected_total))
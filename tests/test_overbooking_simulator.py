@@ -0,0 +1,72 @@
+import pytest
+from src.flight.OverbookingSimulator import OverbookingSimulator, main
+
+
+def small_simulator(**overrides):
+    options = dict(flights=6, capacity=20, horizon=5 * 24 * 3600, tick=3600, booking_probability=0.5)
+    options.update(overrides)
+    return OverbookingSimulator(**options)
+
+
+class TestOverbookingSimulator:
+
+    def test_same_seed_gives_same_result(self):
+        simulator = small_simulator(cancellation_rate=0.01)
+
+        first, second = simulator.run(3), simulator.run(3)
+
+        assert first.summary() == second.summary()
+        assert first.revenue == second.revenue
+
+    def test_sales_stay_within_sell_limit(self):
+        simulator = small_simulator(overbooking=0.2, no_show_rate=0.0)
+
+        result = simulator.run(1)
+
+        assert len(result) == 6
+        assert all(sold <= simulator.sell_limit for sold in result.sold)
+        assert all(0.0 <= load <= 1.0 for load in result.load_factor)
+        assert [boarded + denied for boarded, denied in zip(result.boarded, result.denied_boardings)] == result.sold
+
+    def test_without_overbooking_nobody_is_denied(self):
+        result = small_simulator(overbooking=0.0, booking_probability=1.0).run(5)
+
+        assert sum(result.denied_boardings) == 0
+        assert result.summary()["denied_boarding_cost"] == 0
+
+    def test_without_cancellations_there_are_no_refunds(self):
+        result = small_simulator(cancellation_rate=0.0).run(2)
+
+        assert result.refunds == [0.0] * 6
+        assert sum(result.revenue) > 0
+
+    def test_cancellations_are_refunded(self):
+        result = small_simulator(cancellation_rate=0.05).run(2)
+
+        assert sum(result.refunds) > 0
+
+    def test_run_many_matches_sequential_runs_in_order(self):
+        simulator = small_simulator(cancellation_rate=0.01)
+
+        parallel = simulator.run_many([4, 1, 9], workers=2)
+
+        assert [result.seed for result in parallel] == [4, 1, 9]
+        assert [result.summary() for result in parallel] == [simulator.run(seed).summary() for seed in (4, 1, 9)]
+
+    def test_invalid_parameters_are_rejected(self):
+        with pytest.raises(ValueError):
+            OverbookingSimulator(flights=0)
+        with pytest.raises(ValueError):
+            OverbookingSimulator(booking_probability=1.5)
+        with pytest.raises(ValueError):
+            OverbookingSimulator(tick=3600, horizon=60)
+        with pytest.raises(ValueError):
+            OverbookingSimulator(party_sizes=(1, 2), party_weights=(1,))
+
+    def test_main_prints_one_line_per_level(self, capsys):
+        assert main(["--overbooking", "0", "0.1", "--scenarios", "2", "--flights", "3",
+                     "--capacity", "10", "--workers", "1"]) == 0
+
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 2
+        assert lines[0].startswith("overbooking=0.00")
@@ -0,0 +1,42 @@
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.fraud.Transaction import Transaction
+from src.fraud.RollingFraudScorer import RollingFraudScorer
+from src.fraud.ParallelFraudScorer import ParallelFraudScorer
+
+
+def make_feed(seed, size, start):
+    rng = random.Random(seed)
+    feed = []
+    moment = start
+    for _ in range(size):
+        moment += timedelta(seconds=rng.randint(0, 60))
+        transaction = Transaction(rng.choice([50.0, 15000.0]), moment, rng.choice(['Brasil', 'EUA', 'Chile']))
+        feed.append((f"conta-{rng.randint(0, 20)}", transaction))
+    return feed
+
+
+class TestParallelFraudScorer:
+
+    def test_matches_sequential_scoring_across_calls(self):
+        first = make_feed(1, 3000, datetime(2025, 10, 16, 0, 0, 0))
+        second = make_feed(2, 1000, first[-1][1].timestamp)
+        sequential = RollingFraudScorer(blacklisted_locations=['Chile'])
+        expected = [repr(sequential.score(account, t)) for account, t in first + second]
+
+        with ParallelFraudScorer(blacklisted_locations=['Chile'], max_workers=3, batch_size=100) as scorer:
+            results = scorer.score(first) + scorer.score(second)
+
+        assert [repr(result) for result in results] == expected
+
+    def test_empty_input(self):
+        with ParallelFraudScorer(max_workers=2) as scorer:
+            assert scorer.score([]) == []
+
+    def test_closed_scorer_rejects_work(self):
+        scorer = ParallelFraudScorer(max_workers=1)
+        scorer.close()
+
+        with pytest.raises(RuntimeError):
+            scorer.score([])
@@ -0,0 +1,118 @@
+import pathlib
+import random
+import subprocess
+import sys
+import pytest
+from array import array
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight import reprice
+
+
+def write_scenarios(path, size, seed=646):
+  rng = random.Random(seed)
+  columns = {name: [] for name in reprice.SCENARIO_COLUMNS}
+  with open(path, "w") as scenarios:
+    scenarios.write(",".join(reprice.SCENARIO_COLUMNS) + "\n")
+    for _ in range(size):
+      booking = rng.randint(1_700_000_000, 1_800_000_000)
+      row = {
+        "passengers": rng.randint(1, 8),
+        "booking_time": booking,
+        "available_seats": rng.randint(0, 10),
+        "current_price": rng.choice([99.9, 200.0, 1234.56]),
+        "previous_sales": rng.randint(0, 300),
+        "is_cancellation": rng.choice([0, 1]),
+        "departure_time": booking + rng.choice([3600, 86400, 172800, 900000]),
+        "reward_points_available": rng.choice([0, 500, 100000]),
+      }
+      for name, value in row.items():
+        columns[name].append(value)
+      scenarios.write(",".join(str(row[name]) for name in reprice.SCENARIO_COLUMNS) + "\n")
+  return columns
+
+
+def read_column(path, fmt):
+  values = array(fmt)
+  values.frombytes(path.read_bytes())
+  return list(values)
+
+
+class TestReprice:
+
+  def test_matches_quote_batch(self, tmp_path):
+    columns = write_scenarios(tmp_path / "scenarios.csv", 1000)
+    expected = FlightBookingSystem().quote_batch(
+      passengers=columns["passengers"],
+      booking_times=columns["booking_time"],
+      available_seats=columns["available_seats"],
+      current_prices=columns["current_price"],
+      previous_sales=columns["previous_sales"],
+      is_cancellations=columns["is_cancellation"],
+      departure_times=columns["departure_time"],
+      reward_points_available=columns["reward_points_available"],
+    )
+
+    total = reprice.reprice(str(tmp_path / "scenarios.csv"), str(tmp_path / "out"), chunk_size=128, workers=2)
+
+    out = tmp_path / "out"
+    assert total == 1000
+    assert read_column(out / "confirmation.bin", "B") == [int(value) for value in expected.confirmation]
+    assert read_column(out / "total_price.bin", "d") == expected.total_price
+    assert read_column(out / "refund_amount.bin", "d") == expected.refund_amount
+    assert read_column(out / "points_used.bin", "B") == [int(value) for value in expected.points_used]
+
+  def test_resumes_from_checkpoint(self, tmp_path):
+    write_scenarios(tmp_path / "scenarios.csv", 500)
+    reprice.reprice(str(tmp_path / "scenarios.csv"), str(tmp_path / "full"), chunk_size=100, workers=1)
+    out = tmp_path / "partial"
+    reprice.reprice(str(tmp_path / "scenarios.csv"), str(out), chunk_size=100, workers=1)
+    # Simula uma interrupção: checkpoint no meio e saída parcial a mais
+    (out / "checkpoint.json").write_text('{"rows": 300}')
+    with open(out / "total_price.bin", "r+b") as column:
+      column.truncate(8 * 350)
+
+    assert reprice.reprice(str(tmp_path / "scenarios.csv"), str(out), chunk_size=100, workers=1) == 500
+
+    for name in reprice.RESULT_FILES:
+      assert (out / f"{name}.bin").read_bytes() == (tmp_path / "full" / f"{name}.bin").read_bytes()
+
+  def test_refuses_to_resume_from_columns_shorter_than_the_checkpoint(self, tmp_path):
+    write_scenarios(tmp_path / "scenarios.csv", 300)
+    out = tmp_path / "out"
+    reprice.reprice(str(tmp_path / "scenarios.csv"), str(out), chunk_size=100, workers=1)
+    with open(out / "confirmation.bin", "r+b") as column:
+      column.truncate(250)
+    before = {name: (out / f"{name}.bin").read_bytes() for name in reprice.RESULT_FILES}
+
+    with pytest.raises(ValueError):
+      reprice.reprice(str(tmp_path / "scenarios.csv"), str(out), chunk_size=100, workers=1)
+
+    assert {name: (out / f"{name}.bin").read_bytes() for name in reprice.RESULT_FILES} == before
+    assert reprice.reprice(str(tmp_path / "scenarios.csv"), str(out), chunk_size=100, workers=1, resume=False) == 300
+
+  def test_main_and_missing_columns(self, tmp_path, capsys):
+    write_scenarios(tmp_path / "scenarios.csv", 10)
+    assert reprice.main([str(tmp_path / "scenarios.csv"), str(tmp_path / "out"), "--workers", "1"]) == 0
+    assert "cenários/s" in capsys.readouterr().err
+
+    (tmp_path / "bad.csv").write_text("passengers\n1\n")
+    with pytest.raises(ValueError):
+      reprice.reprice(str(tmp_path / "bad.csv"), str(tmp_path / "bad"), workers=1, resume=False)
+
+  def test_shared_memory_is_released_without_tracker_errors(self, tmp_path):
+    write_scenarios(tmp_path / "scenarios.csv", 1000)
+    shm = pathlib.Path("/dev/shm")
+    before = {path.name for path in shm.glob("psm_*")} if shm.is_dir() else set()
+
+    # Processo novo, para que o resource tracker escreva no stderr capturado
+    completed = subprocess.run(
+      [sys.executable, "-m", "src.flight.reprice", str(tmp_path / "scenarios.csv"), str(tmp_path / "out"),
+       "--chunk-size", "100", "--workers", "2"],
+      cwd=pathlib.Path(__file__).resolve().parent.parent, capture_output=True, text=True, timeout=120,
+    )
+
+    assert completed.returncode == 0
+    assert "Traceback" not in completed.stderr
+    assert "resource_tracker" not in completed.stderr
+    if shm.is_dir():
+      assert {path.name for path in shm.glob("psm_*")} - before == set()
@@ -0,0 +1,97 @@
+import pytest
+from array import array
+from src.energy.EnergyManagementResult import EnergyManagementResult
+from src.flight.BookingBatchResult import BookingBatchResult
+from src.flight.BookingResult import BookingResult
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.fraud.FraudBatchResult import FraudBatchResult
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from tests.test_booking_batch import random_columns
+
+
+def fraud_columns(size, offset=0):
+    return {
+        "amounts": [15000.0 if row % 7 == 0 else 100.0 for row in range(size)],
+        "timestamps": [offset + row * 60 for row in range(size)],
+        "locations": ["XX" if row % 11 == 0 else ("SP" if row % 2 else "RJ") for row in range(size)],
+        "account_ids": [row % 3 for row in range(size)],
+    }
+
+
+def columns_of(result):
+    return [list(column) for column in vars(result).values()]
+
+
+class TestSlottedResults:
+
+    def test_results_have_no_instance_dict(self):
+        booking = BookingResult(True, 10.0, 0.0, False)
+        energy = EnergyManagementResult({"Heating": True}, False, True, 3.0)
+
+        assert not hasattr(booking, "__dict__")
+        assert not hasattr(energy, "__dict__")
+        with pytest.raises(AttributeError):
+            booking.extra = 1
+
+    def test_repr_is_unchanged(self):
+        assert repr(BookingResult(True, 10.0, 0.0, False)) == (
+            "BookingResult(confirmation=True, total_price=10.00, refund_amount=0.00, points_used=False)")
+        assert repr(EnergyManagementResult({"Heating": True}, False, True, 3.0)) == (
+            "EnergyManagementResult(device_status={'Heating': True}, energy_saving_mode=False, "
+            "temperature_regulation_active=True, total_energy_used=3.0)")
+
+
+class TestResultSink:
+
+    def test_quote_batch_reused_out_matches_fresh_result(self):
+        system = FlightBookingSystem()
+        out = BookingBatchResult.allocate(500)
+        for seed in (1, 2, 3):
+            columns = random_columns(seed, 500)
+
+            returned = system.quote_batch(**columns, out=out)
+
+            assert returned is out
+            assert columns_of(out) == columns_of(system.quote_batch(**columns))
+
+    def test_quote_batch_writes_into_arrays(self):
+        system = FlightBookingSystem()
+        columns = random_columns(7, 300)
+        out = BookingBatchResult(array("B", bytes(300)), array("d", [0.0]) * 300,
+                                 array("d", [0.0]) * 300, array("B", bytes(300)))
+
+        system.quote_batch(**columns, out=out)
+
+        expected = system.quote_batch(**columns)
+        assert list(out.confirmation) == [int(value) for value in expected.confirmation]
+        assert list(out.total_price) == expected.total_price
+        assert list(out.refund_amount) == expected.refund_amount
+
+    def test_larger_out_keeps_rows_past_the_batch(self):
+        system = FlightBookingSystem()
+        out = BookingBatchResult.allocate(5)
+        out.total_price[4] = 123.0
+        columns = random_columns(9, 4)
+
+        system.quote_batch(**columns, out=out)
+
+        assert out.total_price[4] == 123.0
+
+    def test_smaller_out_is_rejected(self):
+        with pytest.raises(ValueError):
+            FlightBookingSystem().quote_batch(**random_columns(1, 3), out=BookingBatchResult.allocate(2))
+        with pytest.raises(ValueError):
+            FraudDetectionSystem().check_for_fraud_batch(
+                **fraud_columns(3), blacklisted_locations=[], out=FraudBatchResult.allocate(2))
+
+    def test_fraud_batch_reused_out_matches_fresh_result(self):
+        fraud_system = FraudDetectionSystem()
+        out = FraudBatchResult.allocate(200)
+        for offset in (0, 30, 7):
+            columns = fraud_columns(200, offset)
+
+            returned = fraud_system.check_for_fraud_batch(**columns, blacklisted_locations=["XX"], out=out)
+
+            assert returned is out
+            assert columns_of(out) == columns_of(
+                fraud_system.check_for_fraud_batch(**columns, blacklisted_locations=["XX"]))
@@ -0,0 +1,85 @@
+import random
+from datetime import datetime, timedelta
+from src.energy.DeviceSchedule import DeviceSchedule
+from src.energy.EnergyManagementSystem import SmartEnergyManagementSystem
+from src.energy.ScheduleIndex import ScheduleIndex
+
+
+START = datetime(2025, 11, 2, 0, 0)
+
+
+class TestScheduleIndex:
+
+    def test_devices_at_returns_devices_in_insertion_order(self):
+        index = ScheduleIndex([
+            DeviceSchedule("Washer", START),
+            DeviceSchedule("Oven", START + timedelta(minutes=1)),
+            DeviceSchedule("Lights", START),
+        ])
+
+        assert list(index.devices_at(START)) == ["Washer", "Lights"]
+        assert list(index.devices_at(START + timedelta(minutes=2))) == []
+        assert len(index) == 3
+
+    def test_cancel_removes_one_schedule(self):
+        index = ScheduleIndex([DeviceSchedule("Washer", START), DeviceSchedule("Washer", START)])
+
+        assert index.cancel(DeviceSchedule("Washer", START)) is True
+        assert index.cancel(DeviceSchedule("Oven", START)) is False
+        assert list(index.devices_at(START)) == ["Washer"]
+        assert len(index) == 1
+
+    def test_expire_before_drops_past_schedules(self):
+        index = ScheduleIndex(DeviceSchedule("Washer", START + timedelta(minutes=minute)) for minute in range(10))
+        index.cancel(DeviceSchedule("Washer", START + timedelta(minutes=2)))
+
+        assert index.expire_before(START + timedelta(minutes=5)) == 4
+        assert len(index) == 5
+        assert list(index.devices_at(START + timedelta(minutes=1))) == []
+        assert list(index.devices_at(START + timedelta(minutes=5))) == ["Washer"]
+        assert [schedule.scheduled_time.minute for schedule in index] == [5, 6, 7, 8, 9]
+
+    def test_re_adding_a_cancelled_time_expires_once(self):
+        index = ScheduleIndex([DeviceSchedule("Washer", START)])
+        index.cancel(DeviceSchedule("Washer", START))
+        index.add(DeviceSchedule("Oven", START))
+
+        assert index.expire_before(START + timedelta(minutes=1)) == 1
+        assert len(index) == 0
+        assert index._times == []
+
+    def test_manage_energy_gives_same_result_with_index(self):
+        rng = random.Random(23)
+        energy_system = SmartEnergyManagementSystem()
+        names = ["Security", "Heating", "Washer", "Oven", "Lights", "Pool Pump"]
+        schedules = [DeviceSchedule(rng.choice(names), START + timedelta(minutes=rng.randrange(120)))
+                     for _ in range(400)]
+        index = ScheduleIndex(schedules)
+
+        for minute in range(0, 120, 7):
+            arguments = dict(
+                current_price=0.2, price_threshold=0.3,
+                device_priorities={"Security": 1, "Washer": 2, "Lights": 3},
+                current_time=START + timedelta(minutes=minute), current_temperature=22,
+                desired_temperature_range=(20, 24), energy_usage_limit=100, total_energy_used_today=10,
+            )
+            from_list = energy_system.manage_energy(**arguments, scheduled_devices=schedules)
+            from_index = energy_system.manage_energy(**arguments, scheduled_devices=index)
+
+            assert repr(from_index) == repr(from_list)
+
+    def test_fleet_accepts_index_per_home(self):
+        energy_system = SmartEnergyManagementSystem()
+        index = ScheduleIndex([DeviceSchedule("Oven", START)])
+
+        result = energy_system.manage_energy_fleet(
+            current_prices=[0.2, 0.2], price_thresholds=[0.3, 0.3], device_names=["Security"],
+            device_priorities=[[1], [1]], current_times=[START, START],
+            current_temperatures=[22, 22], desired_temperature_ranges=[(20, 24), (20, 24)],
+            energy_usage_limits=[100, 100], total_energy_used_today=[0, 0],
+            scheduled_devices=[index, []],
+        )
+
+        assert result.device_names == ["Security", "Heating", "Cooling", "Oven"]
+        assert result.device_status[0][3] is True
+        assert result.device_status[1][3] is None
@@ -0,0 +1,87 @@
+import threading
+import pytest
+from datetime import datetime
+from src.flight.FlightBookingSystem import FlightBookingSystem
+from src.flight.SeatInventory import SeatInventory
+
+
+class TestSeatInventory:
+
+  def setup_method(self):
+    self.inventory = SeatInventory(stripes=4)
+    self.inventory.add_flight("AD4020", 10)
+
+  def test_reserve_and_release(self):
+    assert self.inventory.reserve("AD4020", 4) == True
+    assert self.inventory.reserve("AD4020", 7) == False
+    assert self.inventory.available("AD4020") == 6
+
+    self.inventory.release("AD4020", 4)
+
+    assert self.inventory.available("AD4020") == 10
+    with pytest.raises(ValueError):
+      self.inventory.release("AD4020", 1)
+
+  def test_invalid_flights(self):
+    with pytest.raises(ValueError):
+      self.inventory.add_flight("AD4020", 5)
+    with pytest.raises(ValueError):
+      self.inventory.add_flight("G31234", -1)
+    with pytest.raises(ValueError):
+      SeatInventory(stripes=0)
+
+  def test_concurrent_reservations_never_oversell(self):
+    self.inventory.add_flight("LA3000", 100)
+    granted = []
+
+    def worker():
+      for _ in range(100):
+        if self.inventory.reserve("LA3000", 1):
+          granted.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    assert len(granted) == 100
+    assert self.inventory.available("LA3000") == 0
+
+  def test_book_updates_inventory(self):
+    system = FlightBookingSystem()
+    booking = dict(
+      booking_time=datetime(2024, 1, 15, 10, 0),
+      current_price=200.0,
+      previous_sales=100,
+      departure_time=datetime(2024, 1, 20, 10, 0),
+      reward_points_available=0,
+    )
+
+    confirmed = self.inventory.book(system, "AD4020", passengers=6, is_cancellation=False, **booking)
+    rejected = self.inventory.book(system, "AD4020", passengers=6, is_cancellation=False, **booking)
+    too_many_cancelled = self.inventory.book(system, "AD4020", passengers=7, is_cancellation=True, **booking)
+    cancelled = self.inventory.book(system, "AD4020", passengers=2, is_cancellation=True, **booking)
+
+    assert confirmed.confirmation == True
+    assert rejected.confirmation == False
+    assert too_many_cancelled.refund_amount == 0.0
+    assert cancelled.refund_amount == 320.0
+    assert self.inventory.available("AD4020") == 6
+    assert self.inventory.sold("AD4020") == 4
+
+  def test_negative_or_empty_requests_are_rejected(self):
+    with pytest.raises(ValueError):
+      self.inventory.reserve("AD4020", -5)
+    with pytest.raises(ValueError):
+      self.inventory.reserve("AD4020", 0)
+    self.inventory.reserve("AD4020", 3)
+    with pytest.raises(ValueError):
+      self.inventory.release("AD4020", -2)
+    with pytest.raises(ValueError):
+      self.inventory.book(FlightBookingSystem(), "AD4020", passengers=-4, booking_time=datetime(2024, 1, 15, 10, 0),
+                          current_price=200.0, previous_sales=0, is_cancellation=False,
+                          departure_time=datetime(2024, 1, 20, 10, 0), reward_points_available=0)
+
+    assert self.inventory.available("AD4020") == 7
+    assert self.inventory.sold("AD4020") == 3
@@ -0,0 +1,112 @@
+import pytest
+from datetime import datetime, timedelta
+from src.fraud.Transaction import Transaction
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+from src.fraud.TransactionHistoryFile import TransactionHistoryFile, HEADER_SIZE, RECORD_SIZE
+
+
+class TestTransactionHistoryFile:
+
+    def setup_method(self):
+        self.base_time = datetime(2025, 10, 16, 13, 0, 0)
+
+    def fill(self, history, minutes, location='Brasil'):
+        for minute in minutes:
+            history.append(Transaction(float(minute), self.base_time + timedelta(minutes=minute), location))
+
+    def test_append_and_reopen(self, tmp_path):
+        path = tmp_path / "conta.hist"
+        with TransactionHistoryFile(path) as history:
+            self.fill(history, range(5))
+
+        with TransactionHistoryFile(path) as history:
+            view = history.window(self.base_time)
+            assert len(history) == 5
+            assert [t.amount for t in view] == [0.0, 1.0, 2.0, 3.0, 4.0]
+            assert view[-1].timestamp == self.base_time + timedelta(minutes=4)
+            assert view[0].location == 'Brasil'
+
+        assert path.stat().st_size == HEADER_SIZE + 5 * RECORD_SIZE
+
+    def test_window_slices_last_hour(self, tmp_path):
+        with TransactionHistoryFile(tmp_path / "conta.hist") as history:
+            self.fill(history, range(0, 120, 10))
+
+            view = history.window(self.base_time + timedelta(minutes=55))
+
+            assert len(view) == 6
+            assert view[0].amount == 60.0
+            assert view.count_since(self.base_time + timedelta(minutes=100)) == 2
+            with pytest.raises(IndexError):
+                view[6]
+
+    def test_views_survive_appends(self, tmp_path):
+        with TransactionHistoryFile(tmp_path / "conta.hist") as history:
+            self.fill(history, range(3))
+            view = history.window(self.base_time)
+            self.fill(history, range(3, 6))
+
+            assert len(view) == 3
+            assert len(history.window(self.base_time)) == 6
+
+    def test_rejects_out_of_order_and_long_locations(self, tmp_path):
+        with TransactionHistoryFile(tmp_path / "conta.hist") as history:
+            self.fill(history, [10])
+            with pytest.raises(ValueError):
+                self.fill(history, [5])
+            with pytest.raises(ValueError):
+                self.fill(history, [20], location='x' * 33)
+
+    def test_rejects_foreign_files(self, tmp_path):
+        path = tmp_path / "outro.bin"
+        path.write_bytes(b"nao e um historico")
+
+        with pytest.raises(ValueError):
+            TransactionHistoryFile(path)
+
+    def test_reopening_discards_a_torn_last_record(self, tmp_path):
+        path = tmp_path / "conta.hist"
+        with TransactionHistoryFile(path) as history:
+            self.fill(history, range(3))
+        with open(path, "ab") as history_file:
+            history_file.write(b"\x01" * (RECORD_SIZE // 2))
+
+        with TransactionHistoryFile(path) as history:
+            assert len(history) == 3
+            self.fill(history, [3])
+            assert [t.amount for t in history.window(self.base_time)] == [0.0, 1.0, 2.0, 3.0]
+
+        assert path.stat().st_size == HEADER_SIZE + 4 * RECORD_SIZE
+
+    def test_compact_drops_records_outside_window(self, tmp_path):
+        path = tmp_path / "conta.hist"
+        with TransactionHistoryFile(path) as history:
+            self.fill(history, range(0, 200, 10))
+
+            dropped = history.compact(self.base_time + timedelta(minutes=190))
+
+            assert dropped == 13
+            assert len(history) == 7
+            assert history.window(self.base_time)[0].amount == 130.0
+            self.fill(history, [200])
+            assert len(history) == 8
+            assert history.compact(self.base_time + timedelta(minutes=190)) == 0
+
+        assert path.stat().st_size == HEADER_SIZE + 8 * RECORD_SIZE
+
+    def test_fraud_rules_consume_view(self, tmp_path):
+        fraud_system = FraudDetectionSystem()
+        previous = [
+            Transaction(50.0, self.base_time + timedelta(minutes=i * 5), 'Brasil' if i < 11 else 'EUA')
+            for i in range(12)
+        ]
+        current = Transaction(15000.0, self.base_time + timedelta(minutes=60), 'Brasil')
+        with TransactionHistoryFile(tmp_path / "conta.hist") as history:
+            for transaction in previous:
+                history.append(transaction)
+
+            view = history.window(current.timestamp - timedelta(minutes=60))
+            result = fraud_system.check_for_fraud(current, view, [])
+
+        assert repr(result) == repr(fraud_system.check_for_fraud(current, previous, []))
+        assert result.risk_score == 100
@@ -0,0 +1,109 @@
+import random
+import threading
+import pytest
+from datetime import datetime, timedelta, timezone
+from src.fraud.Transaction import Transaction
+from src.fraud.FraudCheckResult import FraudCheckResult
+from src.fraud.LocationCodes import LocationCodes
+from src.fraud.TransactionLog import TransactionLog
+from src.fraud.FraudDetectionSystem import FraudDetectionSystem
+
+
+class TestTransactionLog:
+
+    def setup_method(self):
+        self.base_time = datetime(2025, 10, 16, 13, 0, 0)
+
+    def test_results_and_transactions_are_slotted(self):
+        transaction = Transaction(10.0, self.base_time, 'Brasil')
+        result = FraudCheckResult(False, False, False, 0)
+
+        assert not hasattr(transaction, '__dict__')
+        assert not hasattr(result, '__dict__')
+
+    def test_round_trip(self):
+        log = TransactionLog()
+        log.add(Transaction(12.5, self.base_time + timedelta(microseconds=7), 'Brasil'))
+        log.add(Transaction(99.0, self.base_time - timedelta(minutes=1), 'EUA'))
+
+        assert len(log) == 2
+        assert repr(log[0]) == repr(Transaction(99.0, self.base_time - timedelta(minutes=1), 'EUA'))
+        assert log[-1].timestamp == self.base_time + timedelta(microseconds=7)
+        assert [t.location for t in log] == ['EUA', 'Brasil']
+
+    def test_locations_are_shared_codes(self):
+        first = TransactionLog([Transaction(1.0, self.base_time, 'Cidade Compartilhada')])
+        second = TransactionLog([Transaction(1.0, self.base_time, 'Cidade Compartilhada')])
+
+        assert first.locations[0] == second.locations[0]
+
+    def test_rejects_aware_timestamps(self):
+        with pytest.raises(ValueError):
+            TransactionLog().add(Transaction(1.0, datetime(2025, 1, 1, tzinfo=timezone.utc), 'Brasil'))
+
+    def test_window_view(self):
+        log = TransactionLog([
+            Transaction(float(i), self.base_time + timedelta(minutes=i), 'Brasil')
+            for i in range(10)
+        ])
+
+        view = log.window(self.base_time + timedelta(minutes=6))
+
+        assert len(view) == 4
+        assert view[0].amount == 6.0
+        assert view[-1].amount == 9.0
+        assert view.count_since(self.base_time + timedelta(minutes=8)) == 2
+        assert [t.amount for t in log[2:4]] == [2.0, 3.0]
+        with pytest.raises(IndexError):
+            view[4]
+
+    def test_discard_before(self):
+        log = TransactionLog([
+            Transaction(float(i), self.base_time + timedelta(minutes=i), 'Brasil')
+            for i in range(10)
+        ])
+
+        assert log.discard_before(self.base_time + timedelta(minutes=7)) == 7
+        assert [t.amount for t in log] == [7.0, 8.0, 9.0]
+
+    def test_fraud_rules_consume_log_and_views(self):
+        fraud_system = FraudDetectionSystem()
+        rng = random.Random(646)
+        for _ in range(200):
+            previous = []
+            moment = self.base_time
+            for _ in range(rng.randint(0, 25)):
+                moment += timedelta(seconds=rng.randint(0, 600))
+                previous.append(Transaction(50.0, moment, rng.choice(['Brasil', 'EUA'])))
+            current = Transaction(100.0, moment + timedelta(seconds=rng.randint(0, 3000)), 'Brasil')
+            log = TransactionLog(previous)
+
+            expected = repr(fraud_system.check_for_fraud(current, previous, []))
+
+            assert repr(fraud_system.check_for_fraud(current, log, [])) == expected
+            assert repr(fraud_system.check_for_fraud(current, log[0:len(log)], [])) == expected
+
+    def test_injected_codes_are_separate_and_thread_safe(self):
+        codes = LocationCodes()
+        log = TransactionLog([Transaction(1.0, self.base_time, 'Cidade Isolada')], codes=codes)
+        before = len(TransactionLog.default_codes)
+
+        assert log.locations[0] == 0
+        assert log[0].location == 'Cidade Isolada'
+        assert len(TransactionLog.default_codes) == before
+
+        names = [f'Cidade {i}' for i in range(200)]
+        seen = []
+
+        def worker():
+            seen.append([codes.code(name) for name in names])
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert all(codes_seen == seen[0] for codes_seen in seen)
+        assert len(codes) == 201
+        assert [codes.name(code) for code in seen[0]] == names